@@ -1,11 +1,15 @@
 """
 FreeCAD macro to calculate global placement of a selected child object.
 """
+from typing import List, Optional
+
 from FreeCAD import Console, Placement
 from FreeCADGui import Selection
 
 
-def calculate_global_placement(child: object, placements: Placement = []) -> Placement:
+def calculate_global_placement(child: object, placements: Optional[List[Placement]] = None) -> Placement:
+    if placements is None:
+        placements = []
     placements.append(child.Placement)
     in_list = child.InList
     num_in = len(in_list)
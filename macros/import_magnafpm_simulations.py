@@ -0,0 +1,28 @@
+from argparse import ArgumentParser
+
+from openafpm_cad_core.app import import_magnafpm_simulations
+
+if __name__ == '__main__':
+    parser = ArgumentParser(
+        description='Imports a directory or archive of MagnAFPM .mat files into unique parameter sets.')
+    parser.add_argument('source',
+                        metavar='<source>',
+                        type=str,
+                        help='Directory, .zip, or .tar archive of .mat files.')
+    parser.add_argument('output',
+                        metavar='<output>',
+                        type=str,
+                        help='Output .npz or .parquet path.')
+    parser.add_argument('-p',
+                        '--processes',
+                        type=int,
+                        required=False,
+                        default=None,
+                        help='Number of worker processes. Defaults to the number of CPUs.')
+    args = parser.parse_args()
+    result = import_magnafpm_simulations(args.source, args.output, processes=args.processes)
+    for source, error in result['error_by_source'].items():
+        print(f'{source}: {error}')
+    print(f"Imported {result['file_count']} files in {result['elapsed_seconds']:.2f}s "
+          f"({result['files_per_second']:.1f} files/s).")
+    print(f"{len(result['parameters_by_hash'])} unique, {len(result['error_by_source'])} errors.")
@@ -0,0 +1,233 @@
+"""Module for statically analyzing the cells of the Master_of_Puppets spreadsheets.
+
+Mistakes in cells like duplicate aliases or typos in references
+otherwise only surface when populating spreadsheets or recomputing documents in FreeCAD.
+
+A ``CellGraph`` parses the formula of every cell without FreeCAD,
+and records which cells each cell references to find:
+
+* duplicate aliases within a sheet,
+* formulas which fail to parse,
+* references to aliases or sheets which don't exist,
+* cycles of cells referencing each other,
+* and aliased cells which no other cell references.
+
+Cells referenced only by part documents or Python code (e.g. dimension tables) are also unreferenced,
+so unreferenced cells are informational instead of errors.
+
+Run as a module to analyze cells for a preset:
+
+.. code-block:: shell
+
+    python -m openafpm_cad_core.analyze_cells "T Shape"
+    python -m openafpm_cad_core.analyze_cells "T Shape" --dot > cells.dot
+"""
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, TypedDict
+
+from .spreadsheet import Cell
+from .spreadsheet.cell_address import get_cell_address
+from .spreadsheet_evaluator import FormulaError, iterate_references, parse
+
+__all__ = ['analyze_cells', 'CellGraph', 'CellIssue']
+
+CellKey = Tuple[str, str]
+"""Sheet name, and alias or address (e.g. ``('Tail', 'BoomLength')`` or ``('Tail', 'A1')``)."""
+
+
+class CellIssue(TypedDict):
+    kind: str
+    """One of "duplicate-alias", "invalid-formula", "undefined-reference", "cycle", or "unreferenced"."""
+
+    cell: str
+    """Sheet name and alias or address of the cell (e.g. "Tail.BoomLength")."""
+
+    message: str
+
+
+ERROR_KINDS = {'duplicate-alias', 'invalid-formula', 'undefined-reference', 'cycle'}
+
+
+class CellGraph:
+    """Graph of references between cells of spreadsheets.
+
+    :param cells_by_spreadsheet_name: Cells keyed by sheet name,
+                                      as returned by ``get_cells_by_spreadsheet_name``.
+    """
+
+    def __init__(self, cells_by_spreadsheet_name: Dict[str, List[List[Cell]]]) -> None:
+        self.cell_by_key: Dict[CellKey, Cell] = {}
+        self.dependency_keys_by_key: Dict[CellKey, Set[CellKey]] = {}
+        """Cells each cell references."""
+
+        self.issues: List[CellIssue] = []
+        aliases_by_sheet_name = {
+            sheet_name: self._add_cells(sheet_name, cells)
+            for sheet_name, cells in cells_by_spreadsheet_name.items()
+        }
+        for key, cell in self.cell_by_key.items():
+            self.dependency_keys_by_key[key] = self._get_dependency_keys(key, cell, aliases_by_sheet_name)
+        for cycle in self.find_cycles():
+            self._add_issue('cycle', cycle[0], 'Circular reference ' + ' -> '.join(map(format_key, cycle)))
+        for key in self.find_unreferenced():
+            self._add_issue('unreferenced', key, 'Not referenced by other cells')
+
+    def _add_cells(self, sheet_name: str, cells: List[List[Cell]]) -> Set[str]:
+        """Add cells of a sheet, and return its aliases."""
+        aliases = set()
+        for row_index, row in enumerate(cells):
+            for col_index, cell in enumerate(row):
+                if cell.alias in aliases:
+                    self._add_issue('duplicate-alias', (sheet_name, cell.alias),
+                                    f'Alias "{cell.alias}" already defined')
+                if cell.alias:
+                    aliases.add(cell.alias)
+                self.cell_by_key[(sheet_name, cell.alias or get_cell_address(row_index, col_index))] = cell
+        return aliases
+
+    def _get_dependency_keys(self,
+                             key: CellKey,
+                             cell: Cell,
+                             aliases_by_sheet_name: Dict[str, Set[str]]) -> Set[CellKey]:
+        sheet_name = key[0]
+        if not cell.content.startswith('='):
+            return set()
+        try:
+            expression = parse(cell.content[1:],
+                               frozenset(aliases_by_sheet_name[sheet_name]),
+                               frozenset(aliases_by_sheet_name.keys()))
+        except FormulaError as error:
+            self._add_issue('invalid-formula', key, str(error))
+            return set()
+        dependency_keys = set()
+        for referenced_sheet_name, alias in iterate_references(expression):
+            dependency_key = (referenced_sheet_name or sheet_name, alias)
+            if alias in aliases_by_sheet_name.get(dependency_key[0], ()):
+                dependency_keys.add(dependency_key)
+            else:
+                self._add_issue('undefined-reference', key,
+                                f'References undefined alias "{format_key(dependency_key)}"')
+        return dependency_keys
+
+    def _add_issue(self, kind: str, key: CellKey, message: str) -> None:
+        self.issues.append({'kind': kind, 'cell': format_key(key), 'message': message})
+
+    @property
+    def errors(self) -> List[CellIssue]:
+        """Issues excluding unreferenced cells."""
+        return [issue for issue in self.issues if issue['kind'] in ERROR_KINDS]
+
+    def find_cycles(self) -> List[List[CellKey]]:
+        """Find strongly connected components with more than one cell, or a cell referencing itself."""
+        return [
+            component
+            for component in StronglyConnectedComponents(self.dependency_keys_by_key).find()
+            if len(component) > 1 or component[0] in self.dependency_keys_by_key[component[0]]
+        ]
+
+    def find_unreferenced(self) -> List[CellKey]:
+        """Find aliased cells which no other cell references."""
+        referenced_keys = {
+            dependency_key
+            for dependency_keys in self.dependency_keys_by_key.values()
+            for dependency_key in dependency_keys
+        }
+        return [
+            key for key, cell in self.cell_by_key.items()
+            if cell.alias and key not in referenced_keys
+        ]
+
+    def iterate_edges(self, cross_sheet_only: bool = False) -> Iterable[Tuple[CellKey, CellKey]]:
+        """Iterate (cell, referenced cell) pairs."""
+        for key, dependency_keys in self.dependency_keys_by_key.items():
+            for dependency_key in sorted(dependency_keys):
+                if not cross_sheet_only or key[0] != dependency_key[0]:
+                    yield key, dependency_key
+
+    def to_dot(self, cross_sheet_only: bool = False) -> str:
+        """Format references as a Graphviz DOT graph, with an edge from each cell to cells it references."""
+        lines = ['digraph cells {']
+        for key, dependency_key in self.iterate_edges(cross_sheet_only):
+            lines.append(f'  "{format_key(key)}" -> "{format_key(dependency_key)}";')
+        lines.append('}')
+        return '\n'.join(lines)
+
+
+def analyze_cells(cells_by_spreadsheet_name: Dict[str, List[List[Cell]]]) -> List[CellIssue]:
+    """Analyze cells for duplicate aliases, invalid formulas, undefined references, cycles, and unreferenced cells."""
+    return CellGraph(cells_by_spreadsheet_name).issues
+
+
+class StronglyConnectedComponents:
+    """Iterative version of Tarjan's algorithm, as cells may reference long chains of cells."""
+
+    def __init__(self, dependency_keys_by_key: Dict[CellKey, Set[CellKey]]) -> None:
+        self.dependency_keys_by_key = dependency_keys_by_key
+        self.index_by_key: Dict[CellKey, int] = {}
+        self.low_link_by_key: Dict[CellKey, int] = {}
+        self.stack: List[CellKey] = []
+        self.on_stack: Set[CellKey] = set()
+        self.work: List[Tuple[CellKey, Iterator[CellKey]]] = []
+        self.components: List[List[CellKey]] = []
+
+    def find(self) -> List[List[CellKey]]:
+        for root in self.dependency_keys_by_key:
+            if root not in self.index_by_key:
+                self._visit(root)
+            while self.work:
+                key, dependency_keys = self.work[-1]
+                dependency_key = next(dependency_keys, None)
+                if dependency_key is None:
+                    self._finish(key)
+                elif dependency_key not in self.index_by_key:
+                    self._visit(dependency_key)
+                elif dependency_key in self.on_stack:
+                    self.low_link_by_key[key] = min(self.low_link_by_key[key], self.index_by_key[dependency_key])
+        return self.components
+
+    def _visit(self, key: CellKey) -> None:
+        self.index_by_key[key] = self.low_link_by_key[key] = len(self.index_by_key)
+        self.stack.append(key)
+        self.on_stack.add(key)
+        self.work.append((key, iter(sorted(self.dependency_keys_by_key[key]))))
+
+    def _finish(self, key: CellKey) -> None:
+        self.work.pop()
+        if self.work:
+            parent_key = self.work[-1][0]
+            self.low_link_by_key[parent_key] = min(self.low_link_by_key[parent_key], self.low_link_by_key[key])
+        if self.low_link_by_key[key] == self.index_by_key[key]:
+            index = self.stack.index(key)
+            component = self.stack[index:]
+            del self.stack[index:]
+            self.on_stack.difference_update(component)
+            self.components.append(component)
+
+
+def format_key(key: CellKey) -> str:
+    return '.'.join(key)
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+
+    from .get_cells_by_spreadsheet_name import get_cells_by_spreadsheet_name
+    from .get_default_parameters import get_default_parameters
+
+    argument_parser = ArgumentParser(description='Analyze cells of spreadsheets without FreeCAD.')
+    argument_parser.add_argument('preset', nargs='?', default='T Shape')
+    argument_parser.add_argument('--dot', action='store_true', help='Print references as a Graphviz DOT graph.')
+    argument_parser.add_argument('--cross-sheet-only', action='store_true',
+                                 help='Only include references between sheets in DOT graph.')
+    argument_parser.add_argument('--unreferenced', action='store_true', help='Include unreferenced cells.')
+    args = argument_parser.parse_args()
+    parameters = get_default_parameters(args.preset)
+    cell_graph = CellGraph(get_cells_by_spreadsheet_name(
+        parameters['magnafpm'], parameters['furling'], parameters['user']))
+    if args.dot:
+        print(cell_graph.to_dot(args.cross_sheet_only))
+    else:
+        issues = cell_graph.issues if args.unreferenced else cell_graph.errors
+        for issue in issues:
+            print(f'{issue["kind"]}: {issue["cell"]}: {issue["message"]}')
+        print(f'{len(cell_graph.errors)} error(s) in {len(cell_graph.cell_by_key)} cells')
+        raise SystemExit(1 if cell_graph.errors else 0)
@@ -1,56 +1,146 @@
+from .analyze_cells import CellGraph, CellIssue, analyze_cells
+from .assembly_index import AssemblyIndex, get_assembly_index
 from .assembly_to_obj import load_assembly_to_obj, get_assembly_to_obj
+from .async_load import (FreeCADWorkerPool, aload_assembly_to_obj, aload_dimension_tables, aload_dxf_archive,
+                         aload_dxf_as_svg, aload_freecad_archive, aload_furl_transform, aload_outputs,
+                         worker_pool)
+from .bill_of_materials import (aggregate_bills_of_materials, bill_of_materials_to_csv,
+                                bill_of_materials_to_json, create_bill_of_materials, optimize_cuts)
+from .calculate_furl_trajectory import FurlTrajectory, calculate_furl_trajectory
+from .calculate_furl_transform import calculate_furl_transform
+from .cancellation import CancellationToken, DeadlineExceededError, run_with_watchdog
 from .close_all_documents import close_all_documents
+from .document_scope import DocumentScope, get_worker_document_scope
 from .freecad_archive import load_freecad_archive, get_freecad_archive
 from .exec_turbine_function import exec_turbine_function
 from .dxf_archive import load_dxf_archive, get_dxf_archive
-from .find_descendent_by_label import find_descendent_by_label
-from .find_object_by_label import find_object_by_label
-from .get_default_parameters import get_default_parameters, get_presets
-from .dimension_tables import get_dimension_tables, load_dimension_tables
-from .get_parameters_schema import get_parameters_schema
+from .find_descendent_by_label import find_descendent_by_label, find_descendents_by_labels
+from .find_object_by_label import find_object_by_label, find_objects_by_labels
+from .get_default_parameters import (get_default_parameters, get_preset, get_presets,
+                                     register_preset, register_presets)
+from .dimension_tables import DimensionTables, create_dimension_tables, get_dimension_table_ids
+from .load_bill_of_materials import (TurbineConfiguration, get_bill_of_materials, load_bill_of_materials,
+                                     load_bills_of_materials)
+from .load_dimension_tables import (get_dimension_tables, load_dimension_table_by_id,
+                                    load_dimension_tables, load_resin_volumes)
+from .global_placement_resolver import GlobalPlacementResolver, get_global_placement_resolver
+from .get_parameters_schema import get_parameters_schema, get_preset_schema
+from .import_magnafpm_simulations import import_magnafpm_simulations
 from .load import Assembly, load_all
 from .furl_transform import load_furl_transform, get_furl_transform
 from .load_spreadsheet_document import load_spreadsheet_document
-from .loadmat import loadmat
-from .map_magnafpm_parameters import map_magnafpm_parameters
-from .parameter_hash import hash_parameters, unhash_parameters
+from .load_outputs import get_outputs, load_outputs
+from .loadmat import MatFile, loadmat
+from .loadmat_numpy import loadmat_numpy
+from .map_magnafpm_parameters import MAGNAFPM_VARIABLE_NAMES, map_magnafpm_parameters
+from .parameter_hash import get_preset_hash, hash_parameters, unhash_parameters
 from .dxf_as_svg import load_dxf_as_svg, get_dxf_as_svg
+from .progress import ProgressEvent, ProgressStream, ProgressTimings, progress_timings
+from .output_type import OutputType
+from .single_flight import SingleFlight, aload_output, single_flight
+from .spreadsheet_evaluator import FormulaError, SpreadsheetEvaluator
+from .spreadsheet_snapshot import SpreadsheetSnapshot, take_spreadsheet_snapshot
 from .upsert_spreadsheet_document import upsert_spreadsheet_document
+from .validate_parameters import validate_parameters
 from .wind_turbine_shape import (WindTurbineShape,
                                  map_rotor_disk_radius_to_wind_turbine_shape,
                                  H_SHAPE_LOWER_BOUND,
                                  STAR_SHAPE_LOWER_BOUND)
 
 __all__ = [
+    'analyze_cells',
+    'aload_assembly_to_obj',
+    'aload_dimension_tables',
+    'aload_dxf_archive',
+    'aload_dxf_as_svg',
+    'aload_freecad_archive',
+    'aload_furl_transform',
+    'aload_output',
+    'aload_outputs',
     'Assembly',
+    'AssemblyIndex',
+    'get_assembly_index',
     'load_all',
     'load_assembly_to_obj',
     'get_assembly_to_obj',
+    'CancellationToken',
+    'DeadlineExceededError',
+    'run_with_watchdog',
     'close_all_documents',
+    'DocumentScope',
+    'get_worker_document_scope',
+    'FreeCADWorkerPool',
+    'worker_pool',
     'get_freecad_archive',
     'load_freecad_archive',
     'exec_turbine_function',
     'get_dxf_archive',
     'load_dxf_archive',
     'find_descendent_by_label',
+    'find_descendents_by_labels',
     'find_object_by_label',
+    'find_objects_by_labels',
     'hash_parameters',
     'get_default_parameters',
+    'create_dimension_tables',
+    'DimensionTables',
+    'get_dimension_table_ids',
     'get_dimension_tables',
+    'load_dimension_table_by_id',
     'load_dimension_tables',
+    'load_resin_volumes',
+    'aggregate_bills_of_materials',
+    'bill_of_materials_to_csv',
+    'bill_of_materials_to_json',
+    'create_bill_of_materials',
+    'get_bill_of_materials',
+    'load_bill_of_materials',
+    'load_bills_of_materials',
+    'optimize_cuts',
+    'TurbineConfiguration',
+    'GlobalPlacementResolver',
+    'get_global_placement_resolver',
     'get_parameters_schema',
+    'get_preset',
+    'get_preset_hash',
+    'get_preset_schema',
     'get_presets',
+    'import_magnafpm_simulations',
     'load_furl_transform',
     'get_furl_transform',
+    'calculate_furl_transform',
+    'calculate_furl_trajectory',
+    'FurlTrajectory',
     'load_spreadsheet_document',
+    'get_outputs',
+    'load_outputs',
+    'OutputType',
+    'ProgressEvent',
+    'ProgressStream',
+    'ProgressTimings',
+    'progress_timings',
+    'CellGraph',
+    'CellIssue',
+    'SingleFlight',
+    'single_flight',
+    'SpreadsheetEvaluator',
+    'FormulaError',
+    'SpreadsheetSnapshot',
+    'take_spreadsheet_snapshot',
     'loadmat',
+    'MatFile',
+    'loadmat_numpy',
     'map_magnafpm_parameters',
+    'MAGNAFPM_VARIABLE_NAMES',
     'map_rotor_disk_radius_to_wind_turbine_shape',
     'H_SHAPE_LOWER_BOUND',
     'STAR_SHAPE_LOWER_BOUND',
     'load_dxf_as_svg',
+    'register_preset',
+    'register_presets',
     'get_dxf_as_svg',
     'unhash_parameters',
     'upsert_spreadsheet_document',
+    'validate_parameters',
     'WindTurbineShape'
 ]
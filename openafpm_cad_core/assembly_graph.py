@@ -0,0 +1,123 @@
+"""Module for traversing assembly trees as directed acyclic graphs.
+
+Assemblies share subtrees through links.
+For example, every App::Link to a fastener links to the same object,
+so walking the tree recursively descends into the same subtree once per link.
+
+An ``AssemblyGraph`` visits each unique object once with an explicit stack
+(so deep trees don't exceed Python's recursion limit),
+and records the edges between objects.
+Instance counts are then calculated by multiplying counts along edges
+in topological order instead of re-walking shared subtrees.
+"""
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = ['AssemblyGraph', 'get_object_key', 'is_link_array', 'iterate_unique_objects']
+
+logger = logging.getLogger(__name__)
+
+ObjectKey = Tuple[str, str]
+
+
+class AssemblyGraph:
+    """Graph of objects reachable from root objects.
+
+    :param roots: Objects to start traversing from.
+    :param get_children: Function to get children of an object.
+                         Children appearing more than once are separate edges (i.e. instances).
+    """
+
+    def __init__(self,
+                 roots: Iterable[object],
+                 get_children: Callable[[object], List[object]]) -> None:
+        self.root_keys: List[ObjectKey] = []
+        self.object_by_key: Dict[ObjectKey, object] = {}
+        """Unique objects in depth-first pre-order."""
+
+        self.child_keys_by_key: Dict[ObjectKey, List[ObjectKey]] = {}
+        self.topological_keys: List[ObjectKey] = []
+        """Keys ordered so parents come before children."""
+
+        post_order_keys = []
+        for root in roots:
+            root_key = get_object_key(root)
+            self.root_keys.append(root_key)
+            if root_key in self.object_by_key:
+                continue
+            stack = [(root_key, iter(self._visit(root_key, root, get_children)))]
+            while stack:
+                key, children = stack[-1]
+                child_key, child = next(children, (None, None))
+                if child_key is None:
+                    stack.pop()
+                    post_order_keys.append(key)
+                elif child_key not in self.object_by_key:
+                    stack.append((child_key, iter(self._visit(child_key, child, get_children))))
+        self.topological_keys = post_order_keys[::-1]
+
+    def _visit(self,
+               key: ObjectKey,
+               obj: object,
+               get_children: Callable[[object], List[object]]) -> List[Tuple[ObjectKey, object]]:
+        """Record an object and its edges, and return its children with their keys."""
+        self.object_by_key[key] = obj
+        children = get_children(obj)
+        if any(child is None for child in children):
+            logger.warning(
+                f'child of {obj.Label} ({obj.TypeId}) is None in document {obj.Document.Name}')
+        children_with_keys = [(get_object_key(child), child) for child in children if child is not None]
+        self.child_keys_by_key[key] = [child_key for child_key, _ in children_with_keys]
+        return children_with_keys
+
+    def iterate_objects(self) -> Iterator[object]:
+        """Iterate unique objects in depth-first pre-order."""
+        return iter(self.object_by_key.values())
+
+    def count_instances(self) -> Dict[ObjectKey, int]:
+        """Count instances of each object by multiplying counts along edges.
+
+        Each root counts as one instance.
+        """
+        count_by_key = dict.fromkeys(self.topological_keys, 0)
+        for root_key in self.root_keys:
+            count_by_key[root_key] += 1
+        for key in self.topological_keys:
+            count = count_by_key[key]
+            for child_key in self.child_keys_by_key[key]:
+                count_by_key[child_key] += count
+        return count_by_key
+
+    def find_object(self, predicate: Callable[[object], bool]) -> Optional[object]:
+        """Find the first object in depth-first pre-order matching predicate."""
+        return next((obj for obj in self.iterate_objects() if predicate(obj)), None)
+
+
+def iterate_unique_objects(roots: Iterable[object],
+                           get_children: Callable[[object], List[object]]) -> Iterator[object]:
+    """Lazily iterate objects reachable from roots once each in depth-first pre-order.
+
+    Unlike ``AssemblyGraph``, iteration may stop early without visiting every object.
+    """
+    visited_keys = set()
+    stack = list(roots)[::-1]
+    while stack:
+        obj = stack.pop()
+        key = get_object_key(obj)
+        if key in visited_keys:
+            continue
+        visited_keys.add(key)
+        yield obj
+        stack.extend(child for child in reversed(get_children(obj)) if child is not None)
+
+
+def get_object_key(obj: object) -> ObjectKey:
+    # Names are unique within a document, but labels may not be.
+    return obj.Document.Name, obj.Name
+
+
+def is_link_array(obj: object) -> bool:
+    return (
+        obj.TypeId == 'Part::FeaturePython' and
+        hasattr(obj, 'ArrayType')
+    )
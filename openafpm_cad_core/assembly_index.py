@@ -0,0 +1,130 @@
+"""Module for indexing the assembly trees of root documents.
+
+Counting parts and finding flat parts to export as DXF
+both walk the App::Part, App::Link, and Part::Mirroring tree of every root document.
+
+An ``AssemblyIndex`` walks the trees once as an ``AssemblyGraph``, and records:
+
+* the number of instances of each part by label and type id,
+* the first object found with each label,
+* the labels of the parents of each object,
+* which objects are children of link arrays,
+* and the set of flat objects to export as DXF.
+
+Indexes are cached per set of root documents,
+and the cache is cleared whenever documents are recomputed or closed.
+"""
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from FreeCAD import Document
+
+from .assembly_graph import AssemblyGraph, ObjectKey, get_object_key, is_link_array
+from .find_object_by_label import find_object_by_label
+
+__all__ = ['AssemblyIndex', 'get_assembly_index', 'clear_assembly_index_cache']
+
+logger = logging.getLogger(__name__)
+
+ASSEMBLY_TYPE_IDS = {'App::Part', 'App::Link', 'Part::Mirroring'}
+LINK_AND_PART_TYPE_IDS = {'App::Part', 'App::Link'}
+
+FLAT_ATTRIBUTE = 'Openafpm_Flat'
+
+assembly_index_by_document_names: Dict[Tuple[str, ...], 'AssemblyIndex'] = {}
+
+
+class AssemblyIndex:
+    """Index of the assembly trees of root documents."""
+
+    def __init__(self, root_documents: List[Document]) -> None:
+        self._is_child_of_link_array_by_key: Dict[ObjectKey, bool] = {}
+        graph = AssemblyGraph(
+            [find_object_by_label(document, document.Label) for document in root_documents],
+            get_children)
+        self.count_by_label_and_type_id: Dict[Tuple[str, str], int] = {}
+        for key, count in graph.count_instances().items():
+            obj = graph.object_by_key[key]
+            if obj.TypeId not in ASSEMBLY_TYPE_IDS:
+                label_and_type_id = (obj.Label, obj.TypeId)
+                self.count_by_label_and_type_id[label_and_type_id] = (
+                    self.count_by_label_and_type_id.get(label_and_type_id, 0) + count)
+        self.object_by_label: Dict[str, object] = {}
+        for obj in graph.iterate_objects():
+            self.object_by_label.setdefault(obj.Label, obj)
+        self.parent_labels_by_label: Dict[str, Set[str]] = {}
+        for key, child_keys in graph.child_keys_by_key.items():
+            for child_key in child_keys:
+                self.parent_labels_by_label.setdefault(
+                    graph.object_by_key[child_key].Label, set()).add(graph.object_by_key[key].Label)
+        self.export_set: Set[object] = self._get_export_set(graph)
+
+    def get_count(self, label: str, type_id: str) -> int:
+        """Get the number of instances of a part in the assembly trees."""
+        return self.count_by_label_and_type_id.get((label, type_id), 0)
+
+    def get_object(self, label: str) -> Optional[object]:
+        """Get the first object found with a label, or ``None``."""
+        return self.object_by_label.get(label)
+
+    def get_parent_labels(self, label: str) -> Set[str]:
+        """Get labels of assemblies which contain, link to, or mirror an object."""
+        return self.parent_labels_by_label.get(label, set())
+
+    def is_child_of_link_array(self, obj: object) -> bool:
+        key = get_object_key(obj)
+        if key not in self._is_child_of_link_array_by_key:
+            self._is_child_of_link_array_by_key[key] = is_child_of_link_array(obj)
+        return self._is_child_of_link_array_by_key[key]
+
+    def _get_export_set(self, graph: AssemblyGraph) -> Set[object]:
+        """Find flat objects reachable from a root through visible objects.
+
+        An object is reachable if any of its parents is,
+        so reachability is propagated along edges in topological order.
+        """
+        export_set = set()
+        reachable_keys = set(graph.root_keys)
+        for key in graph.topological_keys:
+            if key not in reachable_keys:
+                continue
+            obj = graph.object_by_key[key]
+            # Filter out hidden parts like Rotor_MagnetJig_Disk (for T_SHAPE_2F)
+            # but keep hidden parts that are children of link arrays
+            # like coil winder elements (e.g. Stator_CoilWinder_Cheek).
+            if not obj.Visibility and not self.is_child_of_link_array(obj):
+                continue
+            if obj.TypeId not in LINK_AND_PART_TYPE_IDS and getattr(obj, FLAT_ATTRIBUTE, False):
+                export_set.add(obj)
+            # Mirrored parts are counted, but not exported.
+            if obj.TypeId in LINK_AND_PART_TYPE_IDS:
+                reachable_keys.update(graph.child_keys_by_key[key])
+        return export_set
+
+
+def get_assembly_index(root_documents: List[Document]) -> AssemblyIndex:
+    """Get the cached assembly index of root documents, or index them on a cache miss."""
+    key = tuple(document.Name for document in root_documents)
+    if key not in assembly_index_by_document_names:
+        logger.debug(f'Indexing assemblies of {", ".join(key)}')
+        assembly_index_by_document_names[key] = AssemblyIndex(root_documents)
+    return assembly_index_by_document_names[key]
+
+
+def clear_assembly_index_cache() -> None:
+    assembly_index_by_document_names.clear()
+
+
+def get_children(obj: object) -> List[object]:
+    if obj.TypeId == 'App::Part':
+        return obj.Group
+    elif obj.TypeId == 'App::Link':
+        return [obj.LinkedObject]
+    elif obj.TypeId == 'Part::Mirroring':
+        return [obj.Source]
+    else:
+        return []
+
+
+def is_child_of_link_array(obj: object) -> bool:
+    return any(is_link_array(parent) for parent in obj.InList)
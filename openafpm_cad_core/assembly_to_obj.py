@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 import FreeCAD  # Needed for freecad_to_obj Draft dependency
 import freecad_to_obj
 from FreeCAD import Document
 
+from .document_scope import DocumentScope, get_worker_document_scope
 from .find_object_by_label import find_object_by_label
 from .load import Assembly, load_assembly
 from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
@@ -16,15 +17,17 @@ def load_assembly_to_obj(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> str:
     root_document, spreadsheet_document = load_assembly(
-        assembly, magnafpm_parameters, furling_parameters, user_parameters
+        assembly, magnafpm_parameters, furling_parameters, user_parameters,
+        document_scope or get_worker_document_scope(),
     )
     return get_assembly_to_obj(assembly, root_document)
 
 
 def get_assembly_to_obj(assembly: Assembly, root_document: Document) -> str:
-    obj = find_object_by_label(root_document, root_document.Name)
+    obj = find_object_by_label(root_document, root_document.Label)
     export_kwargs = get_export_kwargs(assembly)
     # https://wiki.freecad.org/Mesh_FromPartShape
     mesh_settings = {
@@ -0,0 +1,313 @@
+"""Module for loading documents from asyncio code.
+
+Loading documents blocks for about a minute in FreeCAD,
+so the async functions in this module run the work in a FreeCAD worker subprocess
+(see ``run_with_watchdog``), without blocking the event loop:
+
+.. code-block:: python
+
+    stream = ProgressStream()
+    task = asyncio.create_task(aload_freecad_archive(
+        magnafpm_parameters, furling_parameters, user_parameters, progress_listener=stream))
+    async for event in stream:
+        print(event['message'], event['percent'], event['eta'])
+    archive = await task
+
+Cancelling the task cancels loading,
+and the worker is killed if it doesn't stop within a grace period.
+
+Concurrent calls are bounded by the number of workers of a ``FreeCADWorkerPool``,
+and wait for a free worker.
+Each worker loads documents from a scratch directory of the pool (see ``DocumentScope``),
+reused by later workers, so documents are copied once per concurrent worker, instead of once per call.
+
+Functions which load only some documents (e.g. ``load_furl_transform``)
+don't report progress or check for cancellation,
+so their worker is killed after the grace period when cancelled.
+"""
+import asyncio
+import logging
+import shutil
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import uuid1
+
+from .assembly_to_obj import load_assembly_to_obj
+from .calculate_furl_transform import FurlTransform
+from .cancellation import run_with_watchdog
+from .dimension_tables import Element
+from .document_scope import use_worker_documents_path
+from .dxf_archive import load_dxf_archive
+from .dxf_as_svg import load_dxf_as_svg
+from .freecad_archive import load_freecad_archive
+from .furl_transform import load_furl_transform
+from .load import Assembly
+from .load_dimension_tables import load_dimension_tables
+from .load_outputs import load_outputs
+from .output_type import OutputType
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .progress import ProgressListener, ProgressStream, get_progress_listener
+
+__all__ = [
+    'aload_assembly_to_obj',
+    'aload_dimension_tables',
+    'aload_dxf_archive',
+    'aload_dxf_as_svg',
+    'aload_freecad_archive',
+    'aload_furl_transform',
+    'aload_outputs',
+    'FreeCADWorkerPool',
+    'worker_pool',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def remove_directories(paths: List[Path]) -> None:
+    for path in paths:
+        logger.debug(f'Removing {path}')
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class FreeCADWorkerPool:
+    """Runs functions in FreeCAD worker subprocesses, at most ``max_workers`` at a time.
+
+    Each function runs in a new worker subprocess,
+    watched by a thread, so a worker may be killed without affecting other workers.
+
+    :param max_workers: Maximum number of workers running at once.
+    :param grace_period: Seconds a worker has to stop after cancellation, before it's killed.
+    """
+
+    def __init__(self, max_workers: int = 1, grace_period: float = 5) -> None:
+        self.max_workers = max_workers
+        self.grace_period = grace_period
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='FreeCADWorkerWatchdog')
+        # Semaphores are bound to the event loop they're first contended in,
+        # so the pool may be used from several event loops (e.g. consecutive asyncio.run calls).
+        self.semaphore_by_loop: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # Scratch directories of documents not used by a running worker.
+        self.free_documents_paths: List[Path] = []
+        self.documents_paths: List[Path] = []
+        self.documents_paths_lock = threading.Lock()
+        weakref.finalize(self, remove_directories, self.documents_paths)
+
+    async def run(self,
+                  function: Callable[..., Any],
+                  *args: Any,
+                  progress_callback: Optional[Callable[[str, int], None]] = None,
+                  progress_listener: Optional[ProgressListener] = None,
+                  timeout: Optional[float] = None,
+                  step_timeout: Optional[float] = None,
+                  **kwargs: Any) -> Any:
+        """Run a function in a worker subprocess.
+
+        The function is called with ``cancellation_token``, and ``progress_listener`` keyword arguments.
+
+        :param progress_callback: Optional callback function(stage: str, percent: int), called in the event loop.
+        :param progress_listener: Optional listener of progress events, called in the event loop.
+                                  A ``ProgressStream`` is closed when the function returns or raises.
+        :param timeout: Optional time budget in seconds, including waiting for a free worker.
+        :param step_timeout: Optional time budget in seconds for each step (e.g. recomputing a document).
+        :raises asyncio.CancelledError: If cancelled.
+        :raises DeadlineExceededError: If the function or a step overruns.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        cancel_event = threading.Event()
+        listener = get_progress_listener(progress_callback, progress_listener)
+        # Progress events are received in a watchdog thread.
+        forward_progress = None if listener is None else partial(loop.call_soon_threadsafe, listener)
+        try:
+            async with self.get_semaphore(loop):
+                if timeout is not None:
+                    timeout = max(timeout - (loop.time() - start_time), 0)
+                documents_path = self.acquire_documents_path()
+                future = loop.run_in_executor(self.executor, partial(
+                    run_with_watchdog, run_in_worker_document_scope, documents_path, function, *args,
+                    cancel_event=cancel_event,
+                    timeout=timeout,
+                    step_timeout=step_timeout,
+                    progress_listener=forward_progress,
+                    grace_period=self.grace_period,
+                    **kwargs))
+                future.add_done_callback(lambda _: self.release_documents_path(documents_path))
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    logger.debug(f'Cancelling {function.__name__}')
+                    cancel_event.set()
+                    # Hold the worker until it stops, so the number of workers stays bounded.
+                    await asyncio.wait([future])
+                    # Retrieve InterruptedError from the worker, as CancelledError is raised instead.
+                    future.exception()
+                    raise
+        finally:
+            if isinstance(progress_listener, ProgressStream):
+                progress_listener.close()
+
+    def get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        if loop not in self.semaphore_by_loop:
+            self.semaphore_by_loop[loop] = asyncio.Semaphore(self.max_workers)
+        return self.semaphore_by_loop[loop]
+
+    def acquire_documents_path(self) -> Path:
+        """Get a scratch directory not used by a running worker, or a new one copied by the worker on first use."""
+        with self.documents_paths_lock:
+            if self.free_documents_paths:
+                return self.free_documents_paths.pop()
+            documents_path = Path(gettempdir()).joinpath(str(uuid1()))
+            self.documents_paths.append(documents_path)
+            return documents_path
+
+    def release_documents_path(self, documents_path: Path) -> None:
+        with self.documents_paths_lock:
+            self.free_documents_paths.append(documents_path)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+        remove_directories(self.documents_paths)
+
+
+worker_pool = FreeCADWorkerPool()
+"""Default worker pool with one worker, as loading documents uses most of a CPU core and lots of memory."""
+
+
+async def aload_freecad_archive(magnafpm_parameters: MagnafpmParameters,
+                                furling_parameters: FurlingParameters,
+                                user_parameters: UserParameters,
+                                progress_callback: Optional[Callable[[str, int], None]] = None,
+                                progress_listener: Optional[ProgressListener] = None,
+                                timeout: Optional[float] = None,
+                                step_timeout: Optional[float] = None,
+                                pool: Optional[FreeCADWorkerPool] = None) -> bytes:
+    """Async version of ``load_freecad_archive``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        load_freecad_archive, magnafpm_parameters, furling_parameters, user_parameters,
+        progress_callback=progress_callback,
+        progress_listener=progress_listener,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+async def aload_dxf_archive(magnafpm_parameters: MagnafpmParameters,
+                            furling_parameters: FurlingParameters,
+                            user_parameters: UserParameters,
+                            progress_callback: Optional[Callable[[str, int], None]] = None,
+                            progress_listener: Optional[ProgressListener] = None,
+                            timeout: Optional[float] = None,
+                            step_timeout: Optional[float] = None,
+                            pool: Optional[FreeCADWorkerPool] = None) -> bytes:
+    """Async version of ``load_dxf_archive``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        load_dxf_archive, magnafpm_parameters, furling_parameters, user_parameters,
+        progress_callback=progress_callback,
+        progress_listener=progress_listener,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+async def aload_dxf_as_svg(magnafpm_parameters: MagnafpmParameters,
+                           furling_parameters: FurlingParameters,
+                           user_parameters: UserParameters,
+                           font_family: str = 'sans-serif',
+                           foreground: str = '#FFFFFF',
+                           background: str = '#000000',
+                           timeout: Optional[float] = None,
+                           step_timeout: Optional[float] = None,
+                           pool: Optional[FreeCADWorkerPool] = None) -> str:
+    """Async version of ``load_dxf_as_svg``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        call_uncancellable, load_dxf_as_svg, magnafpm_parameters, furling_parameters, user_parameters,
+        font_family, foreground, background,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+async def aload_assembly_to_obj(assembly: Assembly,
+                                magnafpm_parameters: MagnafpmParameters,
+                                furling_parameters: FurlingParameters,
+                                user_parameters: UserParameters,
+                                timeout: Optional[float] = None,
+                                step_timeout: Optional[float] = None,
+                                pool: Optional[FreeCADWorkerPool] = None) -> str:
+    """Async version of ``load_assembly_to_obj``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        call_uncancellable, load_assembly_to_obj, assembly, magnafpm_parameters, furling_parameters, user_parameters,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+async def aload_furl_transform(magnafpm_parameters: MagnafpmParameters,
+                               furling_parameters: FurlingParameters,
+                               user_parameters: UserParameters,
+                               timeout: Optional[float] = None,
+                               step_timeout: Optional[float] = None,
+                               pool: Optional[FreeCADWorkerPool] = None) -> FurlTransform:
+    """Async version of ``load_furl_transform``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        call_uncancellable, load_furl_transform, magnafpm_parameters, furling_parameters, user_parameters,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+async def aload_dimension_tables(magnafpm_parameters: MagnafpmParameters,
+                                 furling_parameters: FurlingParameters,
+                                 user_parameters: UserParameters,
+                                 img_path_prefix: str = '',
+                                 timeout: Optional[float] = None,
+                                 step_timeout: Optional[float] = None,
+                                 pool: Optional[FreeCADWorkerPool] = None) -> List[Element]:
+    """Async version of ``load_dimension_tables``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        call_uncancellable, load_dimension_tables, magnafpm_parameters, furling_parameters, user_parameters,
+        img_path_prefix,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+async def aload_outputs(output_types: Iterable[OutputType],
+                        magnafpm_parameters: MagnafpmParameters,
+                        furling_parameters: FurlingParameters,
+                        user_parameters: UserParameters,
+                        assemblies: Iterable[Assembly] = (Assembly.WIND_TURBINE,),
+                        img_path_prefix: str = '',
+                        progress_callback: Optional[Callable[[str, int], None]] = None,
+                        progress_listener: Optional[ProgressListener] = None,
+                        timeout: Optional[float] = None,
+                        step_timeout: Optional[float] = None,
+                        pool: Optional[FreeCADWorkerPool] = None) -> Dict[OutputType, Any]:
+    """Async version of ``load_outputs``, run in a worker subprocess."""
+    return await (pool or worker_pool).run(
+        load_outputs, list(output_types), magnafpm_parameters, furling_parameters, user_parameters,
+        list(assemblies), img_path_prefix,
+        progress_callback=progress_callback,
+        progress_listener=progress_listener,
+        timeout=timeout,
+        step_timeout=step_timeout)
+
+
+def run_in_worker_document_scope(documents_path: Path, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a function in a worker, loading documents from a scratch directory of the pool by default.
+
+    Module-level instead of a closure, so it may be pickled to start workers.
+    """
+    use_worker_documents_path(documents_path)
+    return function(*args, **kwargs)
+
+
+def call_uncancellable(function: Callable[..., Any],
+                       *args: Any,
+                       cancellation_token=None,
+                       progress_listener: Optional[ProgressListener] = None,
+                       **kwargs: Any) -> Any:
+    """Call a function which doesn't accept a cancellation token or progress listener in a worker.
+
+    Module-level instead of a closure, so it may be pickled to start workers.
+    """
+    return function(*args, **kwargs)
@@ -0,0 +1,217 @@
+"""Module for creating bills of materials for purchasing.
+
+Like dimension tables, bills of materials are created from a snapshot of spreadsheet values,
+and flat parts from the DXF export set,
+so bills of materials for many turbines can be aggregated without FreeCAD.
+
+See ``load_bill_of_materials.py`` for creating bills of materials from FreeCAD documents.
+
+Items cut from stock lengths (e.g. pipe and flat bar) include the length of each cut,
+so the number of stock lengths to buy can be optimized with ``optimize_cuts``.
+"""
+import csv
+import io
+import json
+from typing import Dict, Iterable, List, NotRequired, Optional, Tuple, TypedDict
+
+from .dimension_tables import (get_angle_bar_lengths, get_pipe_outer_diameter_length_tuples,
+                               get_studs_diameter_length_tuples)
+from .spreadsheet_snapshot import SpreadsheetSnapshot
+
+__all__ = [
+    "aggregate_bills_of_materials",
+    "BillOfMaterialsItem",
+    "bill_of_materials_to_csv",
+    "bill_of_materials_to_json",
+    "create_bill_of_materials",
+    "FlatPart",
+    "optimize_cuts",
+]
+
+FLAT_BAR_ASPECT_RATIO = 3
+"""Minimum ratio of length to width for steel flat parts to be cut from flat bar instead of plate."""
+
+
+class FlatPart(TypedDict):
+    """Flat part from the DXF export set."""
+
+    label: str
+    count: int
+    material: str
+    thickness: float
+    """Thickness in mm."""
+
+    width: float
+    """Shortest side of the bounding box of the 2D projection in mm."""
+
+    length: float
+    """Longest side of the bounding box of the 2D projection in mm."""
+
+
+class BillOfMaterialsItem(TypedDict):
+    category: str
+    """Category of item (e.g. "Pipe", "Flat bar", or "Plate")."""
+
+    description: str
+    """Size or label of item, unique within a category."""
+
+    unit: str
+    """Unit of quantity, either "mm" for lengths or "pcs" for pieces."""
+
+    quantity: float
+
+    cut_lengths: NotRequired[List[float]]
+    """Length of each piece in mm for items cut from stock lengths."""
+
+    stock_lengths: NotRequired[List[List[float]]]
+    """Cut lengths grouped by stock length (see ``optimize_cuts``)."""
+
+
+def create_bill_of_materials(spreadsheet_document: SpreadsheetSnapshot,
+                             flat_parts: Iterable[FlatPart] = ()) -> List[BillOfMaterialsItem]:
+    """Create a bill of materials for a single turbine.
+
+    Doesn't include fasteners, electrical components, or consumables like resin.
+    """
+    pipe_cut_lengths_by_diameter = group_cut_lengths(get_pipe_outer_diameter_length_tuples(spreadsheet_document))
+    items = [
+        create_length_item("Pipe", f"{format_number(diameter)} mm outer diameter", cut_lengths)
+        for diameter, cut_lengths in pipe_cut_lengths_by_diameter.items()
+    ]
+    items.append(create_length_item(
+        "Angle section",
+        (f"{format_number(spreadsheet_document.Spreadsheet.MetalLengthL)} x "
+         f"{format_number(spreadsheet_document.Spreadsheet.MetalThicknessL)} mm"),
+        get_angle_bar_lengths(spreadsheet_document)))
+    for diameter, length in get_studs_diameter_length_tuples(spreadsheet_document):
+        items.append({
+            "category": "Studs",
+            "description": f"M{format_number(diameter)}",
+            "unit": "mm",
+            "quantity": round(length),
+        })
+    items.extend(create_flat_part_items(flat_parts))
+    return aggregate_bills_of_materials([(items, 1)])
+
+
+def create_flat_part_items(flat_parts: Iterable[FlatPart]) -> List[BillOfMaterialsItem]:
+    items = []
+    for flat_part in flat_parts:
+        material = flat_part["material"]
+        thickness = format_number(flat_part["thickness"])
+        width = round(flat_part["width"])
+        length = round(flat_part["length"])
+        if material == "Steel" and length >= width * FLAT_BAR_ASPECT_RATIO:
+            items.append(create_length_item(
+                "Flat bar", f"{width} x {thickness} mm", [length] * flat_part["count"]))
+        else:
+            items.append({
+                "category": "Plate" if material == "Steel" else material,
+                "description": f"{flat_part['label']} {length} x {width} x {thickness} mm",
+                "unit": "pcs",
+                "quantity": flat_part["count"],
+            })
+    return items
+
+
+def aggregate_bills_of_materials(
+        bills_of_materials_with_counts: Iterable[Tuple[List[BillOfMaterialsItem], int]],
+        stock_length_by_category: Optional[Dict[str, float]] = None,
+        kerf: float = 0) -> List[BillOfMaterialsItem]:
+    """Sum items of bills of materials for many turbines in one pass.
+
+    :param bills_of_materials_with_counts: Bill of materials for each turbine configuration,
+                                           and the number of turbines to build with that configuration.
+    :param stock_length_by_category: Stock length to cut items from by category (e.g. ``{"Pipe": 6000}``).
+                                     Items in these categories include optimized ``stock_lengths``.
+    :param kerf: Width of material removed by each cut in mm.
+    """
+    item_by_key: Dict[Tuple[str, str, str], BillOfMaterialsItem] = {}
+    for bill_of_materials, count in bills_of_materials_with_counts:
+        for item in bill_of_materials:
+            key = (item["category"], item["description"], item["unit"])
+            if key not in item_by_key:
+                item_by_key[key] = {**item, "quantity": 0}
+                if "cut_lengths" in item:
+                    item_by_key[key]["cut_lengths"] = []
+                item_by_key[key].pop("stock_lengths", None)
+            aggregate = item_by_key[key]
+            aggregate["quantity"] += item["quantity"] * count
+            if "cut_lengths" in item:
+                aggregate["cut_lengths"].extend(item["cut_lengths"] * count)
+    items = sorted(item_by_key.values(), key=lambda i: (i["category"], i["description"]))
+    if stock_length_by_category:
+        for item in items:
+            stock_length = stock_length_by_category.get(item["category"])
+            if stock_length is not None and "cut_lengths" in item:
+                item["stock_lengths"] = optimize_cuts(item["cut_lengths"], stock_length, kerf)
+    return items
+
+
+def optimize_cuts(cut_lengths: Iterable[float], stock_length: float, kerf: float = 0) -> List[List[float]]:
+    """Group cuts into as few stock lengths as possible.
+
+    Uses the first-fit decreasing heuristic,
+    which uses at most 11/9 times the optimal number of stock lengths plus one.
+
+    Kerf is the width lost to each cut between two pieces,
+    so it isn't lost after the last piece of a stock length.
+
+    :raises ValueError: If a cut is longer than the stock length.
+    """
+    stock_lengths: List[List[float]] = []
+    remaining_lengths: List[float] = []
+    for cut_length in sorted(cut_lengths, reverse=True):
+        if cut_length > stock_length:
+            raise ValueError(f"Cut length {cut_length} mm is longer than stock length {stock_length} mm.")
+        for i, remaining_length in enumerate(remaining_lengths):
+            if cut_length + kerf <= remaining_length:
+                stock_lengths[i].append(cut_length)
+                remaining_lengths[i] -= cut_length + kerf
+                break
+        else:
+            stock_lengths.append([cut_length])
+            remaining_lengths.append(stock_length - cut_length)
+    return stock_lengths
+
+
+def bill_of_materials_to_csv(bill_of_materials: List[BillOfMaterialsItem]) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(["Category", "Description", "Quantity", "Unit", "Stock lengths", "Cut lengths"])
+    for item in bill_of_materials:
+        writer.writerow([
+            item["category"],
+            item["description"],
+            format_number(item["quantity"]),
+            item["unit"],
+            len(item["stock_lengths"]) if "stock_lengths" in item else "",
+            " ".join(map(format_number, item.get("cut_lengths", []))),
+        ])
+    return output.getvalue()
+
+
+def bill_of_materials_to_json(bill_of_materials: List[BillOfMaterialsItem]) -> str:
+    return json.dumps(bill_of_materials)
+
+
+def create_length_item(category: str, description: str, cut_lengths: List[float]) -> BillOfMaterialsItem:
+    return {
+        "category": category,
+        "description": description,
+        "unit": "mm",
+        "quantity": sum(cut_lengths),
+        "cut_lengths": cut_lengths,
+    }
+
+
+def group_cut_lengths(diameter_length_tuples: List[Tuple[float, float]]) -> Dict[float, List[float]]:
+    # Same rounding as sum_length_by_diameter in dimension tables.
+    cut_lengths_by_diameter = {}
+    for diameter, length in sorted(diameter_length_tuples):
+        cut_lengths_by_diameter.setdefault(diameter, []).append(round(length))
+    return cut_lengths_by_diameter
+
+
+def format_number(number: float) -> str:
+    return f"{number:g}"
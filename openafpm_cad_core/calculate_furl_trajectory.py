@@ -0,0 +1,68 @@
+import struct
+from typing import List, TypedDict
+
+from .calculate_furl_transform import FurlTransform, evaluate_furl_transform, evaluate_parent_placement
+from .get_cells_by_spreadsheet_name import get_cells_by_spreadsheet_name
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .placement_math import Placement, Rotation
+from .spreadsheet_evaluator import SpreadsheetEvaluator
+
+__all__ = ["calculate_furl_trajectory", "FurlTrajectory", "POSE_STRIDE"]
+
+POSE_STRIDE = 7
+"""Number of floats per pose: x, y, and z coordinates, followed by a quaternion in the form (x, y, z, w)."""
+
+
+class FurlTrajectory(TypedDict):
+    """Poses of the tail sampled from unfurled to furled."""
+
+    furl_transform: FurlTransform
+    """Transforms to furl the tail, as returned by ``calculate_furl_transform``."""
+
+    angles: List[float]
+    """Furl angle (in degrees) of each pose, evenly spaced from 0 to the maximum angle."""
+
+    poses: bytes
+    """Little-endian float32 buffer of ``POSE_STRIDE`` floats per pose.
+
+    Positions are global coordinates (in millimeters) of the origin of the Tail part,
+    and quaternions are its global rotation.
+    """
+
+
+def calculate_furl_trajectory(
+    magnafpm_parameters: MagnafpmParameters,
+    furling_parameters: FurlingParameters,
+    user_parameters: UserParameters,
+    sample_count: int = 60,
+) -> FurlTrajectory:
+    """Sample poses of the tail as it furls about the outer tail hinge.
+
+    Like ``calculate_furl_transform``, doesn't depend on FreeCAD.
+
+    :param sample_count: Number of poses, including unfurled and fully furled poses.
+    """
+    if sample_count < 2:
+        raise ValueError(f"sample_count must be at least 2, got {sample_count}.")
+    evaluator = SpreadsheetEvaluator(get_cells_by_spreadsheet_name(
+        magnafpm_parameters, furling_parameters, user_parameters
+    ))
+    furl_transform = evaluate_furl_transform(evaluator)
+    maximum_angle = furl_transform["maximum_angle"]
+    angles = [maximum_angle * i / (sample_count - 1) for i in range(sample_count)]
+    parent_placement = evaluate_parent_placement(evaluator)
+    furl_axis = evaluator.evaluate("HighEndStop", "FurlAxis")
+    hinge_base = evaluator.evaluate("HighEndStop", "OuterTailHingeBase")
+    floats = []
+    for angle in angles:
+        # Same as TailFurlPlacement in the HighEndStop spreadsheet.
+        rotation = Rotation(furl_axis, angle)
+        furl_placement = Placement(hinge_base - rotation * hinge_base, rotation)
+        pose = parent_placement * furl_placement
+        floats.extend(pose.Base)
+        floats.extend(pose.Rotation.Q)
+    return {
+        "furl_transform": furl_transform,
+        "angles": angles,
+        "poses": struct.pack(f"<{len(floats)}f", *floats),
+    }
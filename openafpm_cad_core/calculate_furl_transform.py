@@ -0,0 +1,86 @@
+from typing import List, TypedDict
+
+from .get_cells_by_spreadsheet_name import get_cells_by_spreadsheet_name
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .placement_math import Placement, Rotation, Vector
+from .spreadsheet_evaluator import SpreadsheetEvaluator
+
+__all__ = ["calculate_furl_transform", "FurlTransform", "Transform"]
+
+
+class Transform(TypedDict):
+    """An object representing a 3D transformation in Axis–angle representation."""
+
+    name: str
+    """Name for transform."""
+
+    position: List[float]
+    """3 element list containing x, y, and z coordinates."""
+
+    axis: List[float]
+    """Axis of rotation, 3 element list for x, y, and z axes."""
+
+    angle: float
+    """Angle of rotation (in radians)."""
+
+
+class FurlTransform(TypedDict):
+    """Transformation to furl the tail."""
+
+    maximum_angle: float
+    """The maximum angle (in degrees) the tail can furl
+    before the high end stop hits the yaw bearing pipe.
+    """
+
+    transforms: List[Transform]
+    """Series of 3D transformations needed to furl the tail."""
+
+
+def calculate_furl_transform(
+    magnafpm_parameters: MagnafpmParameters,
+    furling_parameters: FurlingParameters,
+    user_parameters: UserParameters,
+) -> FurlTransform:
+    """Calculate the furl transform from spreadsheet cells without FreeCAD.
+
+    Equivalent to ``load_furl_transform``,
+    but evaluates the placement cells the Tail documents are positioned by
+    instead of loading the wind turbine and opening the Tail document.
+    """
+    evaluator = SpreadsheetEvaluator(get_cells_by_spreadsheet_name(
+        magnafpm_parameters, furling_parameters, user_parameters
+    ))
+    return evaluate_furl_transform(evaluator)
+
+
+def evaluate_furl_transform(evaluator: SpreadsheetEvaluator) -> FurlTransform:
+    # The Tail part rotates about the furl axis, and is unfurled by default.
+    tail_placement = Placement(Vector(), Rotation(evaluator.evaluate("HighEndStop", "FurlAxis"), 0))
+    return {
+        "maximum_angle": round(evaluator.evaluate("HighEndStop", "MaximumFurlAngle"), ndigits=2),
+        "transforms": [
+            placement_to_dict("parent", evaluate_parent_placement(evaluator)),
+            placement_to_dict("tail", tail_placement),
+            placement_to_dict("hinge", evaluator.evaluate("Tail", "OuterTailHingePlacement")),
+        ],
+    }
+
+
+def evaluate_parent_placement(evaluator: SpreadsheetEvaluator) -> Placement:
+    """Evaluate the global placement of the parent of the Tail part."""
+    # The Tail_Assembly link in WindTurbine, and the Tail_Assembly part.
+    # Other parents of the Tail part have identity placements.
+    return (
+        evaluator.evaluate("WindTurbine", "TailAssemblyLinkPlacement") *
+        evaluator.evaluate("HighEndStop", "TailAssemblyPlacement")
+    )
+
+
+def placement_to_dict(name: str, placement: Placement) -> Transform:
+    """Convert a ``Placement`` or ``FreeCAD.Placement`` to a transform."""
+    return {
+        "name": name,
+        "position": list(placement.Base),
+        "axis": list(placement.Rotation.Axis),
+        "angle": placement.Rotation.Angle,
+    }
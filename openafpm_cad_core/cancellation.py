@@ -0,0 +1,265 @@
+"""Module for cooperatively cancelling loading documents.
+
+A ``CancellationToken`` is threaded through loading documents,
+and cancels when its event is set or its deadline passes:
+
+.. code-block:: python
+
+    cancellation_token = CancellationToken(cancel_event, timeout=300)
+    load_all(magnafpm_parameters, furling_parameters, user_parameters,
+             cancellation_token=cancellation_token)
+
+Checking the token closes all documents and raises ``InterruptedError`` if cancelled,
+or ``DeadlineExceededError`` if the deadline passed.
+Tokens of jobs with a ``DocumentScope`` close only the job's documents instead (see ``on_cancel``).
+
+A single recompute runs in FreeCAD's C++ code and can't be interrupted,
+so ``run_with_watchdog`` runs a function in a worker subprocess,
+and kills the worker if the deadline passes,
+or a step (e.g. recomputing a document) runs longer than ``step_timeout``.
+"""
+import logging
+import multiprocessing
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+__all__ = ['CancellationToken', 'DeadlineExceededError', 'run_with_watchdog']
+
+logger = logging.getLogger(__name__)
+
+NO_STEP = 0.0
+"""Value of a shared step deadline when no step is running."""
+
+
+class DeadlineExceededError(InterruptedError):
+    """Raised when an operation runs past its deadline."""
+
+
+class CancellationToken:
+    """Cancels an operation when an event is set, or a deadline passes.
+
+    Deadlines are in seconds of ``time.monotonic``, which is system-wide,
+    so deadlines may be shared with worker subprocesses.
+
+    :param cancel_event: Optional ``threading.Event`` or ``multiprocessing.Event`` to signal cancellation.
+    :param timeout: Optional time budget in seconds from now.
+    :param deadline: Optional deadline, instead of a timeout.
+    :param check_every: Check only every nth call to ``checkpoint``, for checks in loops over many objects.
+    :param step_timeout: Optional time budget in seconds for each ``step``, enforced by ``run_with_watchdog``.
+    :param step_deadline: Shared ``multiprocessing.Value`` for the deadline of the current step.
+    :param on_cancel: Optional function called when cancelled, instead of closing all documents.
+    """
+
+    def __init__(self,
+                 cancel_event=None,
+                 timeout: Optional[float] = None,
+                 deadline: Optional[float] = None,
+                 check_every: int = 1,
+                 step_timeout: Optional[float] = None,
+                 step_deadline=None,
+                 on_cancel: Optional[Callable[[], None]] = None) -> None:
+        if timeout is not None:
+            deadline = min_deadline(deadline, time.monotonic() + timeout)
+        self.cancel_event = cancel_event
+        self.deadline = deadline
+        self.check_every = check_every
+        self.step_timeout = step_timeout
+        self.step_deadline = step_deadline
+        self.on_cancel = on_cancel
+        self.checkpoint_count = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the deadline, or None without a deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0)
+
+    def check(self) -> None:
+        """Close documents and raise if cancelled or past the deadline.
+
+        :raises InterruptedError: If cancelled.
+        :raises DeadlineExceededError: If past the deadline.
+        """
+        if self.cancelled:
+            cancel(InterruptedError('Operation was cancelled'), self.on_cancel)
+        if self.expired:
+            cancel(DeadlineExceededError('Operation exceeded deadline'), self.on_cancel)
+
+    def checkpoint(self) -> None:
+        """Like ``check``, but only checks every ``check_every`` calls."""
+        self.checkpoint_count += 1
+        if self.checkpoint_count >= self.check_every:
+            self.checkpoint_count = 0
+            self.check()
+
+    def child(self,
+              timeout: Optional[float] = None,
+              on_cancel: Optional[Callable[[], None]] = None) -> 'CancellationToken':
+        """Create a token with the same event, and a deadline no later than this token's deadline.
+
+        Useful for time budgets of stages within an operation,
+        or to close only the documents of a job when cancelled (see ``DocumentScope``).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return CancellationToken(self.cancel_event,
+                                 deadline=min_deadline(self.deadline, deadline),
+                                 check_every=self.check_every,
+                                 step_timeout=self.step_timeout,
+                                 step_deadline=self.step_deadline,
+                                 on_cancel=on_cancel or self.on_cancel)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Run a step which can't be interrupted, like recomputing a document.
+
+        Checks before and after the step.
+        Within ``run_with_watchdog``, the worker is killed if the step runs longer than ``step_timeout``.
+        """
+        self.check()
+        if self.step_deadline is not None and self.step_timeout is not None:
+            logger.debug(f'{name} has {self.step_timeout} seconds')
+            self.step_deadline.value = time.monotonic() + self.step_timeout
+        try:
+            yield
+        finally:
+            if self.step_deadline is not None:
+                self.step_deadline.value = NO_STEP
+        self.check()
+
+
+UNCANCELLABLE = CancellationToken()
+"""Token which is never cancelled, for callers which don't pass a token."""
+
+
+def min_deadline(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def cancel(error: InterruptedError, on_cancel: Optional[Callable[[], None]] = None) -> None:
+    if on_cancel is None:
+        # Imported here so tokens may be used without FreeCAD.
+        from .close_all_documents import close_all_documents
+        on_cancel = close_all_documents
+    on_cancel()
+    raise error
+
+
+def run_with_watchdog(function: Callable[..., Any],
+                      *args: Any,
+                      cancel_event=None,
+                      timeout: Optional[float] = None,
+                      step_timeout: Optional[float] = None,
+                      progress_listener: Optional[Callable[[Any], None]] = None,
+                      grace_period: float = 5,
+                      poll_interval: float = 0.1,
+                      **kwargs: Any) -> Any:
+    """Run a function in a worker subprocess, killing the worker if it overruns.
+
+    The function is called with a ``cancellation_token`` keyword argument,
+    and must return a picklable result (e.g. ``load_freecad_archive``).
+
+    :param cancel_event: Optional ``threading.Event`` to signal cancellation.
+    :param timeout: Optional time budget in seconds for the whole function.
+    :param step_timeout: Optional time budget in seconds for each step (e.g. recomputing a document).
+    :param progress_listener: Optional listener of progress events.
+                              If given, the function is also called with a ``progress_listener`` keyword argument,
+                              and events are forwarded from the worker.
+    :param grace_period: Seconds the worker has to stop cooperatively after cancellation, before it's killed.
+    :param poll_interval: Seconds between checks of the worker.
+    :raises InterruptedError: If cancelled.
+    :raises DeadlineExceededError: If the function or a step overruns.
+    """
+    worker_cancel_event = multiprocessing.Event()
+    step_deadline = multiprocessing.Value('d', NO_STEP)
+    token = CancellationToken(worker_cancel_event, timeout=timeout,
+                              step_timeout=step_timeout, step_deadline=step_deadline)
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    worker = multiprocessing.Process(target=run_worker,
+                                     args=(sender, function, args, kwargs, token, progress_listener is not None),
+                                     daemon=True)
+    worker.start()
+    sender.close()
+    try:
+        status, value = watch(worker, receiver, cancel_event, worker_cancel_event, token.deadline,
+                              step_deadline, progress_listener, grace_period, poll_interval)
+    except EOFError:
+        raise RuntimeError(f'Worker exited with code {worker.exitcode} without a result')
+    finally:
+        if worker.is_alive():
+            worker.kill()
+        worker.join()
+        receiver.close()
+    if status == 'error':
+        raise value
+    return value
+
+
+def run_worker(sender,
+               function: Callable[..., Any],
+               args: tuple,
+               kwargs: dict,
+               token: CancellationToken,
+               forward_progress: bool) -> None:
+    if forward_progress:
+        kwargs = {**kwargs, 'progress_listener': lambda event: sender.send(('progress', event))}
+    try:
+        sender.send(('result', function(*args, cancellation_token=token, **kwargs)))
+    except BaseException as exception:
+        sender.send(('error', exception))
+    finally:
+        sender.close()
+
+
+def watch(worker: multiprocessing.Process,
+          receiver,
+          cancel_event,
+          worker_cancel_event,
+          deadline: Optional[float],
+          step_deadline,
+          progress_listener: Optional[Callable[[Any], None]],
+          grace_period: float,
+          poll_interval: float) -> Tuple[str, Any]:
+    """Wait for the worker's result, forwarding progress events, and kill the worker if it overruns.
+
+    :raises InterruptedError: If the worker was killed after cancellation.
+    :raises DeadlineExceededError: If the worker was killed after overrunning.
+    :raises EOFError: If the worker exited without a result.
+    """
+    kill_at = None
+    while True:
+        if receiver.poll(poll_interval):
+            status, value = receiver.recv()
+            if status != 'progress':
+                return status, value
+            if progress_listener is not None:
+                progress_listener(value)
+        now = time.monotonic()
+        if step_deadline.value != NO_STEP and now >= step_deadline.value:
+            logger.warning(f'Killing worker {worker.pid} as step exceeded deadline')
+            worker.kill()
+            raise DeadlineExceededError('Step exceeded deadline')
+        # The worker's token enforces the deadline itself.
+        if kill_at is None and deadline is not None and now >= deadline:
+            kill_at = now + grace_period
+        if kill_at is None and cancel_event is not None and cancel_event.is_set():
+            worker_cancel_event.set()
+            kill_at = now + grace_period
+        if kill_at is not None and now >= kill_at:
+            logger.warning(f'Killing worker {worker.pid} as it did not stop within {grace_period} seconds')
+            worker.kill()
+            if cancel_event is not None and cancel_event.is_set():
+                raise InterruptedError('Operation was cancelled')
+            raise DeadlineExceededError('Operation exceeded deadline')
@@ -1,5 +1,9 @@
 import FreeCAD as App
 
+from .assembly_index import clear_assembly_index_cache
+from .global_placement_resolver import clear_global_placement_cache
+from .label_index import clear_label_index_cache
+
 __all__ = ['close_all_documents']
 
 
@@ -10,3 +14,6 @@ def close_all_documents() -> None:
         # Check if document still exists and has a valid Name attribute
         if hasattr(doc, 'Name') and doc.Name:
             App.closeDocument(doc.Name)
+    clear_assembly_index_cache()
+    clear_label_index_cache()
+    clear_global_placement_cache()
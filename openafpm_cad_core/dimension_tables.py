@@ -1,17 +1,37 @@
-"""Module for retrieving dimensions to display in a tabular format."""
-
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, NotRequired
-
-from FreeCAD import Document
-
-from .find_descendent_by_label import find_descendent_by_label
-from .find_object_by_label import find_object_by_label
-from .load import load_alernator
-from .load_spreadsheet_document import load_spreadsheet_document
-from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+"""Module for creating dimensions to display in a tabular format.
+
+Tables are created from a snapshot of spreadsheet values,
+so they can be created without FreeCAD.
+
+See ``load_dimension_tables.py`` for creating tables from FreeCAD documents.
+"""
+
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NotRequired,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+
+from .spreadsheet_snapshot import SpreadsheetSnapshot
 from .wind_turbine_shape import WindTurbineShape
 
-__all__ = ["load_dimension_tables", "get_dimension_tables"]
+__all__ = [
+    "create_dimension_tables",
+    "DimensionTables",
+    "Element",
+    "get_dimension_table_ids",
+    "get_required_sheet_names",
+    "requires_resin_volumes",
+    "ResinVolumes",
+]
 
 
 class Element(TypedDict):
@@ -25,91 +45,153 @@ class Element(TypedDict):
     properties: NotRequired[Dict[str, Any]]
 
 
+class ResinVolumes(TypedDict):
+    """Volumes of resin in mm³."""
+
+    stator: float
+    """Volume of stator resin cast minus coils."""
+
+    rotor: float
+    """Volume of resin cast minus magnets for a single rotor."""
+
+
 book_reference_template = "A Wind Turbine Recipe Book (2014 metric edition), %s"
 jacking_rods_length = 250  # in mm
 estimated_coil_winder_handle_length = 350  # 35cm
 
 
-def load_dimension_tables(
-    magnafpm_parameters: MagnafpmParameters,
-    furling_parameters: FurlingParameters,
-    user_parameters: UserParameters,
+def create_dimension_tables(
+    spreadsheet_document: SpreadsheetSnapshot,
+    resin_volumes: ResinVolumes,
     img_path_prefix: str = "",
 ) -> List[Element]:
-    spreadsheet_document = load_spreadsheet_document(
-        magnafpm_parameters, furling_parameters, user_parameters
-    )
-    alternator_document = load_alernator(recompute_all=True)
-    return get_dimension_tables(
-        spreadsheet_document, alternator_document, img_path_prefix
+    return list(
+        DimensionTables(
+            spreadsheet_document, lambda: resin_volumes, img_path_prefix
+        ).values()
     )
 
 
-def get_dimension_tables(
-    spreadsheet_document: Document,
-    alternator_document: Document,
-    img_path_prefix: str = "",
-) -> List[Element]:
-    wind_turbine_shape = WindTurbineShape.from_string(
-        spreadsheet_document.Spreadsheet.CalculatedWindTurbineShape
-    )
-    tables = []
-    tables.append(create_dimension_of_hub_plywood_pieces_table(spreadsheet_document))
-    tables.append(create_yaw_bearing_pipe_sizes_table(spreadsheet_document))
-    tables.append(create_wheel_bearing_hub_table(spreadsheet_document))
-    tables.append(create_steel_disk_sizes_table(spreadsheet_document))
-    tables.append(create_frame_dimensions_table(spreadsheet_document, img_path_prefix))
-    tables.append(create_offset_table(spreadsheet_document))
-    if wind_turbine_shape == WindTurbineShape.T:
-        tables.append(
-            create_alternator_frame_to_yaw_pipe_sizes_table(
-                spreadsheet_document, img_path_prefix
-            )
-        )
-    else:
-        tables.append(
-            create_frame_dimensions_flat_bar_table_top_view(
-                spreadsheet_document, img_path_prefix
-            )
+class TableDefinition(TypedDict):
+    create: Callable[..., Element]
+    """Function to create the table."""
+
+    sheet_names: List[str]
+    """Names of sheets in the spreadsheet document the table reads values from."""
+
+    has_image: bool
+    """Whether ``create`` takes an ``img_path_prefix`` argument."""
+
+    requires_resin_volumes: bool
+    """Whether ``create`` takes a ``resin_volumes`` argument.
+
+    Resin volumes require geometry from the Alternator document.
+    """
+
+    wind_turbine_shapes: NotRequired[List[WindTurbineShape]]
+    """Shapes the table applies to. Applies to all shapes if omitted."""
+
+
+class DimensionTables(Mapping):
+    """Lazy mapping of table id to dimension table.
+
+    Tables are created on first access and cached.
+    ``get_resin_volumes`` is only called if the resin table is accessed.
+
+    .. code-block:: python
+
+        tables = DimensionTables(snapshot, get_resin_volumes)
+        tables["offset"]
+    """
+
+    def __init__(
+        self,
+        spreadsheet_document: SpreadsheetSnapshot,
+        get_resin_volumes: Callable[[], ResinVolumes],
+        img_path_prefix: str = "",
+        table_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        :param spreadsheet_document: Snapshot containing at least the sheets needed by ``table_ids``.
+        :param get_resin_volumes: Function to get resin volumes for the resin table.
+        :param img_path_prefix: Prefix for image paths.
+        :param table_ids: Ids of tables to include. Defaults to all tables for the wind turbine shape.
+        """
+        self._spreadsheet_document = spreadsheet_document
+        self._get_resin_volumes = get_resin_volumes
+        self._img_path_prefix = img_path_prefix
+        wind_turbine_shape = WindTurbineShape.from_string(
+            spreadsheet_document.Spreadsheet.CalculatedWindTurbineShape
         )
-        tables.append(
-            create_frame_dimensions_flat_bar_table_side_view(
-                spreadsheet_document, img_path_prefix
+        self._table_ids = get_dimension_table_ids(wind_turbine_shape, table_ids)
+        self._table_by_id: Dict[str, Element] = {}
+
+    def __getitem__(self, table_id: str) -> Element:
+        if table_id not in self._table_by_id:
+            if table_id not in self._table_ids:
+                raise KeyError(table_id)
+            self._table_by_id[table_id] = self._create(table_id)
+        return self._table_by_id[table_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table_ids)
+
+    def __len__(self) -> int:
+        return len(self._table_ids)
+
+    def _create(self, table_id: str) -> Element:
+        definition = table_definition_by_id[table_id]
+        args = [self._spreadsheet_document]
+        if definition["has_image"]:
+            args.append(self._img_path_prefix)
+        if definition["requires_resin_volumes"]:
+            args.append(self._get_resin_volumes())
+        return definition["create"](*args)
+
+
+def get_dimension_table_ids(
+    wind_turbine_shape: WindTurbineShape,
+    table_ids: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """Get ids of tables for a wind turbine shape in display order.
+
+    If ``table_ids`` is given, only those ids are returned.
+    Ids of tables which don't apply to the wind turbine shape are ignored.
+
+    :raises ValueError: If a table id is unknown.
+    """
+    if table_ids is not None:
+        table_ids = set(table_ids)
+        unknown_table_ids = table_ids - table_definition_by_id.keys()
+        if unknown_table_ids:
+            raise ValueError(
+                f"Unknown dimension table ids: {', '.join(sorted(unknown_table_ids))}."
             )
-        )
-    tables.append(
-        create_steel_pipe_dimensions_for_tail_table(
-            spreadsheet_document, img_path_prefix
-        )
-    )
-    tables.append(
-        create_tail_junction_dimensions_table(spreadsheet_document, img_path_prefix)
-    )
-    tables.append(
-        create_tail_vane_dimensions_table(spreadsheet_document, img_path_prefix)
-    )
-    tables.append(create_magnets_and_coils_table(spreadsheet_document))
-    tables.append(
-        create_coil_winder_dimensions_table(spreadsheet_document, img_path_prefix)
-    )
-    tables.append(
-        create_stator_mold_dimensions_table(spreadsheet_document, img_path_prefix)
-    )
-    tables.append(
-        create_rotor_mold_dimensions_table(spreadsheet_document, img_path_prefix)
-    )
-    tables.append(
-        create_magnet_positioning_jig_dimensions_table(
-            spreadsheet_document, img_path_prefix
-        )
-    )
-    tables.append(create_various_parts_dimensions_table(spreadsheet_document))
-    tables.append(
-        create_total_pipe_length_by_outer_diameter_table(spreadsheet_document)
+    return [
+        table_id
+        for table_id, definition in table_definition_by_id.items()
+        if (table_ids is None or table_id in table_ids)
+        and wind_turbine_shape
+        in definition.get("wind_turbine_shapes", list(WindTurbineShape))
+    ]
+
+
+def get_required_sheet_names(table_ids: Iterable[str]) -> List[str]:
+    """Get names of sheets needed to create the given tables.
+
+    Always includes "Spreadsheet" which contains the wind turbine shape.
+    """
+    sheet_names = {"Spreadsheet"}
+    for table_id in table_ids:
+        sheet_names.update(table_definition_by_id[table_id]["sheet_names"])
+    return sorted(sheet_names)
+
+
+def requires_resin_volumes(table_ids: Iterable[str]) -> bool:
+    return any(
+        table_definition_by_id[table_id]["requires_resin_volumes"]
+        for table_id in table_ids
     )
-    tables.append(create_studs_nuts_and_washers_table(spreadsheet_document))
-    tables.append(create_resin_table(spreadsheet_document, alternator_document))
-    return tables
 
 
 def create_table(
@@ -136,7 +218,7 @@ def create_table(
     return table(children)
 
 
-def create_yaw_bearing_pipe_sizes_table(spreadsheet_document: Document) -> Element:
+def create_yaw_bearing_pipe_sizes_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     return create_table(
         "Yaw Bearing Pipe Sizes",
         [
@@ -166,7 +248,7 @@ def create_yaw_bearing_pipe_sizes_table(spreadsheet_document: Document) -> Eleme
 
 
 def create_dimension_of_hub_plywood_pieces_table(
-    spreadsheet_document: Document,
+    spreadsheet_document: SpreadsheetSnapshot,
 ) -> Element:
     return create_table(
         "Dimensions of hub plywood pieces",
@@ -202,7 +284,7 @@ def create_dimension_of_hub_plywood_pieces_table(
     )
 
 
-def sum_hub_plywood_screws(spreadsheet_document: Document) -> int:
+def sum_hub_plywood_screws(spreadsheet_document: SpreadsheetSnapshot) -> int:
     return (
         spreadsheet_document.Blade.NumberOfBackDiskScrews
         + spreadsheet_document.Blade.MinimumNumberOfFrontTriangleScrews
@@ -211,7 +293,7 @@ def sum_hub_plywood_screws(spreadsheet_document: Document) -> int:
     )
 
 
-def create_wheel_bearing_hub_table(spreadsheet_document: Document) -> Element:
+def create_wheel_bearing_hub_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     return create_table(
         "Wheel Bearing Hub",
         [
@@ -233,7 +315,7 @@ def create_wheel_bearing_hub_table(spreadsheet_document: Document) -> Element:
     )
 
 
-def create_steel_disk_sizes_table(spreadsheet_document: Document) -> Element:
+def create_steel_disk_sizes_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     return create_table(
         "Steel Disk Sizes",
         [
@@ -261,7 +343,7 @@ def create_steel_disk_sizes_table(spreadsheet_document: Document) -> Element:
 
 
 def create_frame_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     header = "Frame Dimensions"
     rotor_disk_radius = spreadsheet_document.Spreadsheet.RotorDiskRadius
@@ -342,7 +424,7 @@ def create_frame_dimensions_table(
 
 
 def create_alternator_frame_to_yaw_pipe_sizes_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     return create_table(
         "Alternator Frame to Yaw Pipe Sizes",
@@ -363,7 +445,7 @@ def create_alternator_frame_to_yaw_pipe_sizes_table(
     )
 
 
-def create_offset_table(spreadsheet_document: Document) -> Element:
+def create_offset_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     return create_table(
         "Offset distance laterally from alternator center to yaw center",
         [("Offset", round_and_format_length(spreadsheet_document.Spreadsheet.Offset))],
@@ -372,7 +454,7 @@ def create_offset_table(spreadsheet_document: Document) -> Element:
 
 
 def create_frame_dimensions_flat_bar_table_top_view(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     return create_table(
         "Frame Dimensions, Flat Bar Top View",
@@ -396,7 +478,7 @@ def create_frame_dimensions_flat_bar_table_top_view(
 
 
 def create_frame_dimensions_flat_bar_table_side_view(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     return create_table(
         "Frame Dimensions, Flat Bar Side View",
@@ -440,7 +522,7 @@ def create_frame_dimensions_flat_bar_table_side_view(
 
 
 def create_steel_pipe_dimensions_for_tail_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     return create_table(
         "Steel Pipe Dimensions for Tail",
@@ -486,7 +568,7 @@ def create_steel_pipe_dimensions_for_tail_table(
 
 
 def create_tail_vane_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     number_of_vane_bracket_fasteners = 4
     return create_table(
@@ -555,7 +637,7 @@ def create_tail_vane_dimensions_table(
     )
 
 
-def create_magnets_and_coils_table(spreadsheet_document: Document) -> Element:
+def create_magnets_and_coils_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     return create_table(
         "Magnets and Coils",
         [
@@ -601,7 +683,7 @@ def create_magnets_and_coils_table(spreadsheet_document: Document) -> Element:
 
 
 def create_tail_junction_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     return create_table(
         "Tail Junction Cross Piece Dimensions",
@@ -629,7 +711,7 @@ def create_tail_junction_dimensions_table(
 
 
 def create_coil_winder_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     coil_type = spreadsheet_document.Spreadsheet.CoilType
     if coil_type == 1:
@@ -694,7 +776,7 @@ def create_coil_winder_dimensions_table(
 
 
 def create_stator_mold_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     rotor_disk_radius = spreadsheet_document.Spreadsheet.RotorDiskRadius
     wind_turbine_shape = WindTurbineShape.from_string(
@@ -789,7 +871,7 @@ def create_stator_mold_dimensions_table(
     )
 
 
-def calculate_number_of_stator_mold_bolts(spreadsheet_document: Document) -> int:
+def calculate_number_of_stator_mold_bolts(spreadsheet_document: SpreadsheetSnapshot) -> int:
     return (
         spreadsheet_document.Alternator.StatorMoldIslandNumberOfBolts
         + spreadsheet_document.Alternator.StatorMoldSurroundNumberOfBolts
@@ -797,7 +879,7 @@ def calculate_number_of_stator_mold_bolts(spreadsheet_document: Document) -> int
 
 
 def create_rotor_mold_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     number_of_rotors = get_number_of_rotors(
         spreadsheet_document.Spreadsheet.RotorTopology
@@ -866,7 +948,7 @@ def create_rotor_mold_dimensions_table(
 
 
 def create_magnet_positioning_jig_dimensions_table(
-    spreadsheet_document: Document, img_path_prefix: str = ""
+    spreadsheet_document: SpreadsheetSnapshot, img_path_prefix: str = ""
 ) -> Element:
     rows = [
         ("Number of magnets", spreadsheet_document.Spreadsheet.NumberMagnet),
@@ -922,7 +1004,7 @@ def create_magnet_positioning_jig_dimensions_table(
     )
 
 
-def create_various_parts_dimensions_table(spreadsheet_document: Document) -> Element:
+def create_various_parts_dimensions_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     return create_table(
         "Various Parts Dimensions",
         [
@@ -937,7 +1019,7 @@ def create_various_parts_dimensions_table(spreadsheet_document: Document) -> Ele
 
 
 def create_total_pipe_length_by_outer_diameter_table(
-    spreadsheet_document: Document,
+    spreadsheet_document: SpreadsheetSnapshot,
 ) -> Element:
     pipe_outer_diameter_length_tuples = get_pipe_outer_diameter_length_tuples(
         spreadsheet_document
@@ -952,7 +1034,7 @@ def create_total_pipe_length_by_outer_diameter_table(
     return create_table("Total pipe length by outer diameter", rows)
 
 
-def create_studs_nuts_and_washers_table(spreadsheet_document: Document) -> Element:
+def create_studs_nuts_and_washers_table(spreadsheet_document: SpreadsheetSnapshot) -> Element:
     number_of_blade_assembly_fasteners = spreadsheet_document.Hub.NumberOfHoles * 2
     studs_diameter_length_tuples = get_studs_diameter_length_tuples(
         spreadsheet_document
@@ -1055,7 +1137,7 @@ def create_studs_nuts_and_washers_table(spreadsheet_document: Document) -> Eleme
 
 
 def create_resin_table(
-    spreadsheet_document: Document, alternator_document: Document
+    spreadsheet_document: SpreadsheetSnapshot, resin_volumes: ResinVolumes
 ) -> Element:
     rotor_disk_radius = spreadsheet_document.Spreadsheet.RotorDiskRadius
     wind_turbine_shape = WindTurbineShape.from_string(
@@ -1068,14 +1150,8 @@ def create_resin_table(
     else:
         resin_weight_scale_factor = 1.7
 
-    stator = find_object_by_label(alternator_document, "Stator")
-    stator_resin_cast = find_descendent_by_label(stator, "ResinCast")
-    coils = find_descendent_by_label(stator, "Coils")
-    rotor_back = find_object_by_label(alternator_document, "Rotor_Back")
-    rotor_resin_cast = find_descendent_by_label(rotor_back, "Rotor_ResinCast")
-    magnets = find_descendent_by_label(rotor_back, "Rotor_Magnets")
-    stator_resin_volume = stator_resin_cast.Shape.Volume - coils.Shape.Volume
-    rotor_resin_volume = rotor_resin_cast.Shape.Volume - magnets.Shape.Volume
+    stator_resin_volume = resin_volumes["stator"]
+    rotor_resin_volume = resin_volumes["rotor"]
     number_of_rotors = get_number_of_rotors(
         spreadsheet_document.Spreadsheet.RotorTopology
     )
@@ -1117,7 +1193,7 @@ def sum_length_by_diameter(
 
 
 def get_pipe_outer_diameter_length_tuples(
-    spreadsheet_document: Document,
+    spreadsheet_document: SpreadsheetSnapshot,
 ) -> List[Tuple[float, float]]:
     return [
         (
@@ -1140,7 +1216,7 @@ def get_pipe_outer_diameter_length_tuples(
 
 
 def get_studs_diameter_length_tuples(
-    spreadsheet_document: Document,
+    spreadsheet_document: SpreadsheetSnapshot,
 ) -> List[Tuple[float, float]]:
     return [
         (
@@ -1165,35 +1241,32 @@ def get_studs_diameter_length_tuples(
     ]
 
 
-def sum_angle_bar_length(spreadsheet_document: Document) -> float:
-    rotor_disk_radius = spreadsheet_document.Spreadsheet.RotorDiskRadius
+def sum_angle_bar_length(spreadsheet_document: SpreadsheetSnapshot) -> float:
+    return sum(get_angle_bar_lengths(spreadsheet_document))
+
+
+def get_angle_bar_lengths(spreadsheet_document: SpreadsheetSnapshot) -> List[float]:
+    """Get the length of each piece of the frame cut from steel angle section."""
     wind_turbine_shape = WindTurbineShape.from_string(
         spreadsheet_document.Spreadsheet.CalculatedWindTurbineShape
     )
     if wind_turbine_shape == WindTurbineShape.T:
-        return sum(
-            [
-                round(spreadsheet_document.Alternator.TShapeTwoHoleEndBracketLength),
-                round(spreadsheet_document.Alternator.BC) * 2,
-                round(spreadsheet_document.Alternator.D),
-            ]
-        )
+        return [
+            round(spreadsheet_document.Alternator.TShapeTwoHoleEndBracketLength),
+            *[round(spreadsheet_document.Alternator.BC)] * 2,
+            round(spreadsheet_document.Alternator.D),
+        ]
     elif wind_turbine_shape == WindTurbineShape.H:
-        return sum(
-            [
-                round(spreadsheet_document.Alternator.GG) * 2,
-                round(spreadsheet_document.Alternator.HH) * 2,
-            ]
-        )
+        return [
+            *[round(spreadsheet_document.Alternator.GG)] * 2,
+            *[round(spreadsheet_document.Alternator.HH)] * 2,
+        ]
     else:
-        return sum(
-            [
-                round(spreadsheet_document.Alternator.StarShapeTwoHoleEndBracketLength)
-                * 2,
-                round(spreadsheet_document.Alternator.B) * 2,
-                round(spreadsheet_document.Alternator.CC) * 2,
-            ]
-        )
+        return [
+            *[round(spreadsheet_document.Alternator.StarShapeTwoHoleEndBracketLength)] * 2,
+            *[round(spreadsheet_document.Alternator.B)] * 2,
+            *[round(spreadsheet_document.Alternator.CC)] * 2,
+        ]
 
 
 def table(children: List[Element]) -> Element:
@@ -1294,3 +1367,138 @@ def format_screw(quantity: int, diameter: int, length: Optional[float] = None) -
 
 def get_number_of_rotors(rotor_topology: str) -> int:
     return 2 if rotor_topology == "Double" else 1
+
+
+# Tables in display order.
+# "Spreadsheet" is omitted from sheet names as every table reads from it.
+table_definition_by_id: Dict[str, TableDefinition] = {
+    "hub-plywood-pieces": {
+        "create": create_dimension_of_hub_plywood_pieces_table,
+        "sheet_names": ["Blade", "Fastener"],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "yaw-bearing-pipe-sizes": {
+        "create": create_yaw_bearing_pipe_sizes_table,
+        "sheet_names": ["HighEndStop", "Tail"],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "wheel-bearing-hub": {
+        "create": create_wheel_bearing_hub_table,
+        "sheet_names": ["Hub"],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "steel-disk-sizes": {
+        "create": create_steel_disk_sizes_table,
+        "sheet_names": [],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "frame-dimensions": {
+        "create": create_frame_dimensions_table,
+        "sheet_names": ["Alternator"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "offset": {
+        "create": create_offset_table,
+        "sheet_names": [],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "alternator-frame-to-yaw-pipe-sizes": {
+        "create": create_alternator_frame_to_yaw_pipe_sizes_table,
+        "sheet_names": ["Alternator", "HighEndStop"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+        "wind_turbine_shapes": [WindTurbineShape.T],
+    },
+    "frame-dimensions-flat-bar-top-view": {
+        "create": create_frame_dimensions_flat_bar_table_top_view,
+        "sheet_names": ["YawBearing"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+        "wind_turbine_shapes": [WindTurbineShape.H, WindTurbineShape.STAR],
+    },
+    "frame-dimensions-flat-bar-side-view": {
+        "create": create_frame_dimensions_flat_bar_table_side_view,
+        "sheet_names": ["HighEndStop", "WindTurbine", "YawBearing"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+        "wind_turbine_shapes": [WindTurbineShape.H, WindTurbineShape.STAR],
+    },
+    "steel-pipe-dimensions-for-tail": {
+        "create": create_steel_pipe_dimensions_for_tail_table,
+        "sheet_names": ["Tail"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "tail-junction-dimensions": {
+        "create": create_tail_junction_dimensions_table,
+        "sheet_names": ["Tail"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "tail-vane-dimensions": {
+        "create": create_tail_vane_dimensions_table,
+        "sheet_names": ["Fastener"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "magnets-and-coils": {
+        "create": create_magnets_and_coils_table,
+        "sheet_names": [],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "coil-winder-dimensions": {
+        "create": create_coil_winder_dimensions_table,
+        "sheet_names": ["Alternator"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "stator-mold-dimensions": {
+        "create": create_stator_mold_dimensions_table,
+        "sheet_names": ["Alternator", "Fastener"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "rotor-mold-dimensions": {
+        "create": create_rotor_mold_dimensions_table,
+        "sheet_names": ["Alternator", "Fastener"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "magnet-positioning-jig-dimensions": {
+        "create": create_magnet_positioning_jig_dimensions_table,
+        "sheet_names": ["Alternator", "Fastener"],
+        "has_image": True,
+        "requires_resin_volumes": False,
+    },
+    "various-parts-dimensions": {
+        "create": create_various_parts_dimensions_table,
+        "sheet_names": [],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "total-pipe-length-by-outer-diameter": {
+        "create": create_total_pipe_length_by_outer_diameter_table,
+        "sheet_names": ["HighEndStop", "Tail"],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "studs-nuts-and-washers": {
+        "create": create_studs_nuts_and_washers_table,
+        "sheet_names": ["Alternator", "Hub"],
+        "has_image": False,
+        "requires_resin_volumes": False,
+    },
+    "resin": {
+        "create": create_resin_table,
+        "sheet_names": [],
+        "has_image": False,
+        "requires_resin_volumes": True,
+    },
+}
@@ -0,0 +1,173 @@
+"""Module for isolating the documents of a job from documents of other jobs in the same process.
+
+FreeCAD documents are global to a process,
+so loading documents for one turbine would recompute, or on cancellation close,
+documents loaded for another turbine.
+
+A ``DocumentScope`` copies documents into a unique scratch directory,
+and tracks the documents opened from it,
+so only those are recomputed and closed:
+
+.. code-block:: python
+
+    with DocumentScope() as document_scope:
+        root_documents, spreadsheet_document = load_all(
+            magnafpm_parameters, furling_parameters, user_parameters,
+            document_scope=document_scope)
+        archive = get_freecad_archive(root_documents, spreadsheet_document)
+
+Documents are tracked by file path instead of name,
+as FreeCAD names documents uniquely (e.g. ``WindTurbine001``),
+when a document of the same name is open in another scope.
+A document's ``Label`` is still its file name without the extension.
+
+Links between documents are to relative file paths,
+so documents in a scratch directory link to other documents in the same directory.
+
+FreeCAD isn't thread-safe, so jobs in one process must still run in one thread,
+one after another or interleaved.
+
+Copying and opening documents for every job is slow,
+so jobs run one after another in a process (i.e. a worker) share the scope of the worker
+(see ``get_worker_document_scope``), and reuse documents left open by the previous job.
+A pool of worker subprocesses may also reuse scratch directories of previous workers
+(see ``use_worker_documents_path``).
+"""
+import atexit
+import logging
+import os
+import shutil
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Dict, Iterable, List, Optional, Union
+from uuid import uuid1
+
+import FreeCAD as App
+from FreeCAD import Document
+
+from .assembly_index import clear_assembly_index_cache
+from .get_documents_path import get_documents_path
+from .global_placement_resolver import clear_global_placement_cache
+from .label_index import clear_label_index_cache
+
+__all__ = [
+    'close_documents',
+    'DocumentScope',
+    'get_documents_under',
+    'get_worker_document_scope',
+    'use_worker_documents_path',
+]
+
+logger = logging.getLogger(__name__)
+
+worker_document_scope_by_pid: Dict[int, 'DocumentScope'] = {}
+
+
+class DocumentScope:
+    """Documents of a job, opened from a copy of documents in a unique scratch directory.
+
+    :param source: Directory of documents to copy, defaulting to the documents of this package.
+    :param documents_path: Optional scratch directory to reuse, copied from source only if it doesn't exist.
+                           It's owned by the caller, so it isn't removed when the scope is closed.
+    """
+
+    def __init__(self, source: Optional[Path] = None, documents_path: Optional[Path] = None) -> None:
+        self.owns_documents_path = documents_path is None
+        if documents_path is None:
+            documents_path = Path(gettempdir()).joinpath(str(uuid1()))
+        self.documents_path = Path(documents_path)
+        if not self.documents_path.exists():
+            source = get_documents_path() if source is None else source
+            logger.debug(f'Copying documents from {source} to {self.documents_path}')
+            # Copy to a temporary directory first, so a scratch directory to reuse is never partially copied.
+            temporary_path = self.documents_path.with_name(f'{self.documents_path.name}.{os.getpid()}.tmp')
+            shutil.copytree(source, temporary_path)
+            os.replace(temporary_path, self.documents_path)
+
+    def get_documents(self, sort_in_dependency_order: bool = True) -> List[Document]:
+        """Get open documents of this scope."""
+        return get_documents_under(self.documents_path, sort_in_dependency_order)
+
+    def get_document(self, label: str) -> Document:
+        """Get an open document of this scope by label (i.e. file name without extension).
+
+        :raises LookupError: If no document with the label is open.
+        """
+        for document in self.get_documents(sort_in_dependency_order=False):
+            if document.Label == label:
+                return document
+        raise LookupError(f'No document with Label "{label}" open in {self.documents_path}')
+
+    def close_documents(self) -> None:
+        """Close open documents of this scope, leaving documents of other scopes open."""
+        close_documents(self.get_documents())
+
+    def close(self) -> None:
+        """Close open documents of this scope, and remove its scratch directory unless owned by the caller."""
+        self.close_documents()
+        self.remove_documents_path()
+
+    def remove_documents_path(self) -> None:
+        if self.owns_documents_path:
+            logger.debug(f'Removing {self.documents_path}')
+            shutil.rmtree(self.documents_path, ignore_errors=True)
+
+    def __enter__(self) -> 'DocumentScope':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def get_worker_document_scope() -> DocumentScope:
+    """Get the scope shared by jobs in this process, created on first use.
+
+    Documents are left open by each job, and reused by the next job.
+    The scratch directory is removed when the process exits.
+    """
+    # Keyed by process, so a forked worker doesn't share the scope of its parent.
+    pid = os.getpid()
+    if pid not in worker_document_scope_by_pid:
+        worker_document_scope_by_pid[pid] = DocumentScope()
+    return worker_document_scope_by_pid[pid]
+
+
+def use_worker_documents_path(documents_path: Union[str, Path]) -> None:
+    """Reuse a scratch directory for the scope shared by jobs in this process.
+
+    Used by a pool of worker subprocesses,
+    so each worker reuses the scratch directory of a previous worker, instead of copying documents again.
+    """
+    pid = os.getpid()
+    document_scope = worker_document_scope_by_pid.get(pid)
+    if document_scope is None or document_scope.documents_path != Path(documents_path):
+        if document_scope is not None:
+            document_scope.close()
+        worker_document_scope_by_pid[pid] = DocumentScope(documents_path=Path(documents_path))
+
+
+@atexit.register
+def remove_worker_documents_path() -> None:
+    document_scope = worker_document_scope_by_pid.get(os.getpid())
+    if document_scope is not None:
+        document_scope.remove_documents_path()
+
+
+def get_documents_under(directory: Path, sort_in_dependency_order: bool = True) -> List[Document]:
+    """Get open documents with a file under a directory."""
+    prefix = os.path.join(os.path.realpath(directory), '')
+    document_by_name = App.listDocuments(sort_in_dependency_order)
+    return [
+        document for document in document_by_name.values()
+        if document.FileName and os.path.realpath(document.FileName).startswith(prefix)
+    ]
+
+
+def close_documents(documents: Iterable[Document]) -> None:
+    """Close documents, and clear caches of objects in them."""
+    for document in list(documents):
+        logger.debug(f'Closing document {document.Name}')
+        App.closeDocument(document.Name)
+    clear_assembly_index_cache()
+    clear_label_index_cache()
+    clear_global_placement_cache()
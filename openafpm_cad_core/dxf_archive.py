@@ -2,25 +2,34 @@ import shutil
 import zipfile
 from pathlib import Path
 from tempfile import gettempdir
-from typing import Set
+from typing import Optional, Set
 from uuid import uuid1
 
 import importDXF
 
+from .cancellation import CancellationToken
+from .document_scope import DocumentScope, get_worker_document_scope
 from .export_set_to_svg import export_set_to_svg, get_svg_style_options
 from .get_2d_projection import get_2d_projection
 from .get_dxf_export_set import get_dxf_export_set
 from .load import load_all
 from .parameter_groups import (FurlingParameters, MagnafpmParameters,
                                UserParameters)
+from .progress import ProgressListener
 from .make_get_part_count import make_get_part_count
 
 
 def load_dxf_archive(magnafpm_parameters: MagnafpmParameters,
                      furling_parameters: FurlingParameters,
-                     user_parameters: UserParameters) -> bytes:
+                     user_parameters: UserParameters,
+                     cancellation_token: Optional[CancellationToken] = None,
+                     progress_listener: Optional[ProgressListener] = None,
+                     document_scope: Optional[DocumentScope] = None) -> bytes:
     root_documents, spreadsheet_document = load_all(
-        magnafpm_parameters, furling_parameters, user_parameters)
+        magnafpm_parameters, furling_parameters, user_parameters,
+        cancellation_token=cancellation_token,
+        progress_listener=progress_listener,
+        document_scope=document_scope or get_worker_document_scope())
     return get_dxf_archive(root_documents, magnafpm_parameters)
 
 
@@ -1,5 +1,6 @@
 from FreeCAD import Document
-from typing import List
+from typing import List, Optional
+from .document_scope import DocumentScope, get_worker_document_scope
 from .export_set_to_svg import export_set_to_svg, get_svg_style_options
 from .get_dxf_export_set import get_dxf_export_set
 from .load import load_all
@@ -16,9 +17,11 @@ def load_dxf_as_svg(
     font_family: str = "sans-serif",
     foreground: str = "#FFFFFF",
     background: str = "#000000",
+    document_scope: Optional[DocumentScope] = None,
 ) -> str:
     root_documents, spreadsheet_document = load_all(
-        magnafpm_parameters, furling_parameters, user_parameters
+        magnafpm_parameters, furling_parameters, user_parameters,
+        document_scope=document_scope or get_worker_document_scope(),
     )
     return get_dxf_as_svg(
         root_documents,
@@ -1,22 +1,24 @@
-__all__ = ['find_descendent_by_label']
+from typing import Dict, Iterable, Optional
+
+from .label_index import get_descendent_by_label
+
+__all__ = ['find_descendent_by_label', 'find_descendents_by_labels']
 
 
 def find_descendent_by_label(obj, label: str):
-    if obj.Label == label:
-        return obj
-    elif obj.TypeId == 'App::Link':
-        return find_descendent_by_label(obj.LinkedObject, label)
-    elif is_link_array(obj):
-        return find_descendent_by_label(obj.Base, label)
-    elif obj.TypeId == 'App::Part':
-        for child in obj.Group:
-            grandchild = find_descendent_by_label(child, label)
-            if grandchild:
-                return grandchild
-
-
-def is_link_array(obj: object) -> bool:
-    return (
-        obj.TypeId == 'Part::FeaturePython' and
-        hasattr(obj, 'ArrayType')
-    )
+    """Find the first descendent of an object (or the object itself) with a label.
+
+    Descends into App::Link, link arrays, and App::Part.
+    Returns ``None`` if no descendent is found.
+    """
+    return get_descendent_by_label(obj).get(label)
+
+
+def find_descendents_by_labels(obj, labels: Iterable[str]) -> Dict[str, Optional[object]]:
+    """Find the first descendent of an object with each label.
+
+    Descendents are indexed with a single traversal,
+    so subsequent lookups don't re-walk the tree.
+    """
+    descendent_by_label = get_descendent_by_label(obj)
+    return {label: descendent_by_label.get(label) for label in labels}
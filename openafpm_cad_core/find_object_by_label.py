@@ -1,8 +1,10 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from FreeCAD import Console, Document
 
-__all__ = ['find_object_by_label']
+from .label_index import get_label_index
+
+__all__ = ['find_object_by_label', 'find_objects_by_labels']
 
 
 def find_object_by_label(document: Document, label: str) -> Optional[object]:
@@ -10,9 +12,20 @@ def find_object_by_label(document: Document, label: str) -> Optional[object]:
 
     Returns ``None`` if no object is found.
     """
-    objects = document.getObjectsByLabel(label)
-    if len(objects) == 0:
-        Console.PrintError(
-            f'No object with Label "{label}" found in document "{document.Name}".')
-        return None
-    return objects[0]
+    return find_objects_by_labels(document, [label])[label]
+
+
+def find_objects_by_labels(document: Document, labels: Iterable[str]) -> Dict[str, Optional[object]]:
+    """Find objects in a document by the given labels.
+
+    Values are ``None`` for labels with no object.
+    """
+    label_index = get_label_index(document)
+    object_by_label = {}
+    for label in labels:
+        obj = label_index.get_object(label)
+        if obj is None:
+            Console.PrintError(
+                f'No object with Label "{label}" found in document "{document.Name}".')
+        object_by_label[label] = obj
+    return object_by_label
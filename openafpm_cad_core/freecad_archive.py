@@ -3,18 +3,21 @@ import os
 import shutil
 from pathlib import Path
 from tempfile import gettempdir
-from typing import Dict, List
+from typing import Dict, List, Optional
 from uuid import uuid1
 
 import FreeCAD as App
 from FreeCAD import Document
 
+from .cancellation import CancellationToken
+from .document_scope import DocumentScope, close_documents, get_documents_under, get_worker_document_scope
 from .gui_document import (get_gui_document_by_path,
                            rekey_gui_document_by_path, write_gui_documents)
 from .load import load_all
 from .make_archive import make_archive
 from .parameter_groups import (FurlingParameters, MagnafpmParameters,
                                UserParameters)
+from .progress import ProgressListener
 
 __all__ = ['load_freecad_archive', 'get_freecad_archive']
 
@@ -25,12 +28,19 @@ logger = logging.getLogger(__name__)
 
 def load_freecad_archive(magnafpm_parameters: MagnafpmParameters,
                          furling_parameters: FurlingParameters,
-                         user_parameters: UserParameters) -> bytes:
+                         user_parameters: UserParameters,
+                         cancellation_token: Optional[CancellationToken] = None,
+                         progress_listener: Optional[ProgressListener] = None,
+                         document_scope: Optional[DocumentScope] = None) -> bytes:
+    """Load all documents, in the scope of the worker by default, and save them as an archive."""
     logger.debug('Loading all documents')
     root_documents, spreadsheet_document = load_all(
         magnafpm_parameters,
         furling_parameters,
-        user_parameters)
+        user_parameters,
+        cancellation_token=cancellation_token,
+        progress_listener=progress_listener,
+        document_scope=document_scope or get_worker_document_scope())
     return get_freecad_archive(root_documents, spreadsheet_document)
 
 
@@ -45,11 +55,13 @@ def get_freecad_archive(root_documents, spreadsheet_document) -> bytes:
     # Save documents to where the archive will be created from first.
     save_documents(
         root_documents,
-        spreadsheet_document.Name,
+        spreadsheet_document,
         source=document_source,
         destination=archive_source)
 
     bytes_content = make_archive(str(archive_source))
+    # Close documents reopened from the directory the archive was created from, before deleting it.
+    close_documents(get_open_documents(archive_source))
     # Delete the directory the archive was created from.
     logger.debug(f'Removing {temporary_unique_directory}')
     shutil.rmtree(temporary_unique_directory)
@@ -57,17 +69,18 @@ def get_freecad_archive(root_documents, spreadsheet_document) -> bytes:
 
 
 def save_documents(root_documents: List[Document],
-                   spreadsheet_document_name: str,
+                   spreadsheet_document: Document,
                    source: Path,
                    destination: Path) -> None:
     if not destination.exists():
         logger.debug(f'Creating {destination}')
         destination.mkdir(parents=True, exist_ok=True)
 
+    spreadsheet_document_name = spreadsheet_document.Name
     spreadsheet_document_path = save_and_close_spreadsheet_document(
-        spreadsheet_document_name, destination)
+        spreadsheet_document, destination)
 
-    part_documents = get_part_documents(spreadsheet_document_name)
+    part_documents = get_part_documents(spreadsheet_document_name, source)
     source_paths = get_paths(part_documents)
 
     root_document_filenames = [get_filename(d) for d in root_documents]
@@ -109,15 +122,15 @@ def save_document_copies_and_close(source: Path,
     return destination_by_source
 
 
-def save_and_close_spreadsheet_document(spreadsheet_document_name: str, destination: Path) -> str:
-    spreadsheet_document = App.listDocuments()[spreadsheet_document_name]
-    spreadsheet_document_filename = f'{spreadsheet_document_name}.FCStd'
+def save_and_close_spreadsheet_document(spreadsheet_document: Document, destination: Path) -> str:
+    # The label is the file name, while the name may differ (e.g. Master_of_Puppets001, see DocumentScope).
+    spreadsheet_document_filename = f'{spreadsheet_document.Label}.FCStd'
     spreadsheet_document_path = destination.joinpath(
         spreadsheet_document_filename)
     logger.debug(f'Saving spreadsheet document as {spreadsheet_document_path}')
     spreadsheet_document.saveAs(str(spreadsheet_document_path))
     logger.debug(f'Closing spreadsheet document {spreadsheet_document.Name}')
-    App.closeDocument(spreadsheet_document_name)
+    App.closeDocument(spreadsheet_document.Name)
     return str(spreadsheet_document_path)
 
 
@@ -126,7 +139,7 @@ def reopen_and_save_documents(source: Path, destination: Path, root_document_fil
         root_document_path = get_destination_path(
             root_document_filename, source, destination)
         App.openDocument(str(root_document_path))
-    documents = get_open_documents()
+    documents = get_open_documents(destination)
     for document in documents:
         if not document.Temporary:
             logger.debug(f'Saving document {document.FileName}')
@@ -142,19 +155,19 @@ def get_destination_path(document_source: str,
     return destination.joinpath(ending_path)
 
 
-def get_part_documents(spreadsheet_document_name: str) -> List[Document]:
+def get_part_documents(spreadsheet_document_name: str, source: Path) -> List[Document]:
     """Part documents are any document containing parts (i.e. not the main spreadsheet document)."""
-    documents = get_open_documents()
+    documents = get_open_documents(source)
     return [
         d for d in documents
         if d.Name != spreadsheet_document_name and not d.Temporary
     ]
 
 
-def get_open_documents() -> List[Document]:
+def get_open_documents(directory: Path) -> List[Document]:
+    """Get open documents under a directory, leaving out documents of other jobs."""
     sort_in_dependency_order = True
-    document_by_name = App.listDocuments(sort_in_dependency_order)
-    return document_by_name.values()
+    return get_documents_under(directory, sort_in_dependency_order)
 
 
 def get_filename(document: Document) -> str:
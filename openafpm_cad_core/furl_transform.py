@@ -1,51 +1,28 @@
 from pathlib import Path
-from typing import List, TypedDict
+from typing import List, Optional
 
 import FreeCAD as App
-from FreeCAD import Console, Document, Placement
+from FreeCAD import Console, Document
 
-from .find_object_by_label import find_object_by_label
+from .calculate_furl_transform import FurlTransform, Transform, placement_to_dict
+from .document_scope import DocumentScope, get_worker_document_scope
+from .find_object_by_label import find_objects_by_labels
+from .global_placement_resolver import GlobalPlacementResolver
 from .load import load_turbine
 from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
 
 __all__ = ["load_furl_transform", "get_furl_transform"]
 
 
-class Transform(TypedDict):
-    """An object representing a 3D transformation in Axis–angle representation."""
-
-    name: str
-    """Name for transform."""
-
-    position: List[float]
-    """3 element list containing x, y, and z coordinates."""
-
-    axis: List[float]
-    """Axis of rotation, 3 element list for x, y, and z axes."""
-
-    angle: float
-    """Angle of rotation (in radians)."""
-
-
-class FurlTransform(TypedDict):
-    """Transformation to furl the tail."""
-
-    maximum_angle: float
-    """The maximum angle (in degrees) the tail can furl
-    before the high end stop hits the yaw bearing pipe.
-    """
-
-    transforms: List[Transform]
-    """Series of 3D transformations needed to furl the tail."""
-
-
 def load_furl_transform(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> FurlTransform:
     wind_turbine_document, spreadsheet_document = load_turbine(
-        magnafpm_parameters, furling_parameters, user_parameters
+        magnafpm_parameters, furling_parameters, user_parameters,
+        document_scope or get_worker_document_scope(),
     )
     return get_furl_transform(wind_turbine_document, spreadsheet_document)
 
@@ -70,42 +47,19 @@ def get_furl_transforms(root_document: Document) -> List[Transform]:
     documents_path = root_document_path.parent
     tail_document_path = documents_path.joinpath("Tail", "Tail.FCStd")
     tail_document = App.openDocument(str(tail_document_path))
-    tail = find_object_by_label(tail_document, "Tail")
+    object_by_label = find_objects_by_labels(tail_document, ["Tail", "Hinge_Outer"])
+    tail = object_by_label["Tail"]
     if len(tail.InList) == 0:
         Console.PrintWarning(f"{tail.Label} has no parents.\n")
         return None
     if len(tail.InList) > 1:
         Console.PrintWarning(f"{tail.Label} has more than 1 parent. Choosing 1st.\n")
     tail_parent = tail.InList[0]
-    parent_placement = calculate_global_placement(tail_parent)
-    hinge_outer = find_object_by_label(tail_document, "Hinge_Outer")
+    # Only resolve the parents of the tail's parent, as documents were just recomputed, so nothing is cached.
+    parent_placement = GlobalPlacementResolver().get_global_placement(tail_parent)
+    hinge_outer = object_by_label["Hinge_Outer"]
     return [
         placement_to_dict("parent", parent_placement),
         placement_to_dict("tail", tail.Placement),
         placement_to_dict("hinge", hinge_outer.Placement),
     ]
-
-
-def placement_to_dict(name: str, placement: Placement) -> Transform:
-    return {
-        "name": name,
-        "position": list(placement.Base),
-        "axis": list(placement.Rotation.Axis),
-        "angle": placement.Rotation.Angle,
-    }
-
-
-def calculate_global_placement(child: object, placements: Placement = []) -> Placement:
-    placements.append(child.Placement)
-    in_list = child.InList
-    num_in = len(in_list)
-    if len(in_list) == 0:
-        global_placement = Placement()
-        placements.reverse()  # Reverse list in order of parent to child.
-        for placement in placements:
-            global_placement *= placement
-        return global_placement
-    if num_in > 1:
-        Console.PrintWarning(f"{child.Label} has more than 1 parent. Choosing 1st.\n")
-    parent = in_list[0]
-    return calculate_global_placement(parent, placements)
@@ -1,31 +1,107 @@
-"""Module for retrieving values for various wind turbine preset designs."""
-from typing import Dict, List, Union
+"""Module for retrieving values for various wind turbine preset designs.
 
+Presets may inherit from another preset via ``inheritsFrom``.
+Inheritance is resolved once when a preset is registered,
+so looking up a preset is a dict lookup.
+
+Custom presets may be registered at runtime with
+``register_preset`` or ``register_presets`` (from a JSON file).
+"""
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Union
+
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
 from .wind_turbine_shape import WindTurbineShape
 
-__all__ = ['get_default_parameters', 'get_presets']
+__all__ = [
+    'get_default_parameters',
+    'get_preset',
+    'get_presets',
+    'register_preset',
+    'register_presets'
+]
+
+parameter_group_by_name = {
+    'magnafpm': MagnafpmParameters,
+    'furling': FurlingParameters,
+    'user': UserParameters
+}
 
 
 def get_default_parameters(preset: Union[WindTurbineShape, str]) -> dict:
     """Get default parameters for "T Shape", "H Shape", "Star Shape", or another preset turbine.
+
+    Returns a copy which may be modified.
+    See ``get_preset`` for a read-only view.
+    """
+    parameters = get_preset(preset)
+    return {
+        key: dict(value) if isinstance(value, Mapping) else value
+        for key, value in parameters.items()
+    }
+
+
+def get_preset(preset: Union[WindTurbineShape, str]) -> Mapping:
+    """Get a read-only view of parameters for a preset turbine with inheritance resolved.
+
+    Cheaper than ``get_default_parameters`` as nothing is copied.
     """
     key = preset if isinstance(preset, str) else preset.value
-    parameters = preset_by_name[key]
-    if 'inheritsFrom' not in parameters:
-        return parameters
-    else:
-        parent_parameters = preset_by_name[parameters['inheritsFrom']]
-        merged_parameters = {'description': parameters['description']}
-        for group in ['magnafpm', 'furling', 'user']:
-            if group in parameters:
-                merged_parameters[group] = parent_parameters[group] | parameters[group]
-            else:
-                merged_parameters[group] = parent_parameters[group]
-        return merged_parameters
+    return resolved_preset_by_name[key]
 
 
 def get_presets() -> List[str]:
-    return list(preset_by_name.keys())
+    return list(resolved_preset_by_name.keys())
+
+
+def register_preset(name: str, preset: dict) -> None:
+    """Register a custom preset in the same format as built-in presets.
+
+    Raises ``ValueError`` if a preset with the same name is already registered,
+    ``inheritsFrom`` refers to an unknown preset, or parameters are missing.
+    """
+    register_presets_by_name({name: preset})
+
+
+def register_presets(path: Union[str, Path]) -> List[str]:
+    """Register custom presets from a JSON file mapping preset names to presets.
+
+    Presets may inherit from presets defined earlier in the same file.
+    Either all or none of the presets in the file are registered.
+
+    :returns: Names of registered presets.
+    """
+    with open(path, encoding='utf-8') as file:
+        preset_by_name_to_register = json.load(file)
+    register_presets_by_name(preset_by_name_to_register)
+    return list(preset_by_name_to_register.keys())
+
+
+def register_presets_by_name(preset_by_name_to_register: Dict[str, dict]) -> None:
+    resolved = {}
+    for name, preset in preset_by_name_to_register.items():
+        if name in resolved_preset_by_name or name in resolved:
+            raise ValueError(f'Preset "{name}" already registered.')
+        resolved[name] = resolve_preset(name, preset, resolved_preset_by_name | resolved)
+    resolved_preset_by_name.update(resolved)
+
+
+def resolve_preset(name: str, preset: dict, resolved_by_name: Dict[str, Mapping]) -> Mapping:
+    parent = {}
+    if 'inheritsFrom' in preset:
+        if preset['inheritsFrom'] not in resolved_by_name:
+            raise ValueError(f'Preset "{name}" inherits from unknown preset "{preset["inheritsFrom"]}".')
+        parent = resolved_by_name[preset['inheritsFrom']]
+    resolved = {'description': preset.get('description', '')}
+    for group, parameter_group in parameter_group_by_name.items():
+        parameters = dict(parent.get(group, {})) | preset.get(group, {})
+        missing_keys = [key for key in parameter_group.__annotations__.keys() if key not in parameters]
+        if missing_keys:
+            raise ValueError(f'Preset "{name}" is missing {group} parameters: {", ".join(missing_keys)}.')
+        resolved[group] = MappingProxyType(parameters)
+    return MappingProxyType(resolved)
 
 
 preset_by_name: Dict[str, dict] = {
@@ -532,3 +608,6 @@ preset_by_name: Dict[str, dict] = {
         }
     }
 }
+
+resolved_preset_by_name: Dict[str, Mapping] = {}
+register_presets_by_name(preset_by_name)
@@ -1,8 +1,23 @@
+"""Module to get docstrings of TypedDict keys.
+
+Docstrings are read from a table generated ahead of time
+(see ``parameter_docstrings.py``) so that source files aren't needed at runtime.
+If the table is missing a TypedDict, then its source is parsed as a fallback.
+
+The table stores a hash of the source of each TypedDict,
+which tests check to detect a table out-of-date with the source.
+
+To regenerate the table after editing ``parameter_groups.py``, run:
+
+    python -m openafpm_cad_core.get_docstring_by_key
+"""
 import ast
+import hashlib
 import inspect
 from collections import OrderedDict
 from functools import lru_cache
-from typing import TypedDict
+from pathlib import Path
+from typing import List, Optional, TypedDict
 
 __all__ = ['get_docstring_by_key']
 
@@ -25,8 +40,91 @@ class TypedDictKeyDocstringVistor(ast.NodeVisitor):
 
 @lru_cache(maxsize=None)
 def get_docstring_by_key(typed_dict: TypedDict) -> OrderedDict:
+    docstring_by_key = get_generated_docstring_by_key(typed_dict)
+    if docstring_by_key is None:
+        return parse_docstring_by_key(typed_dict)
+    return OrderedDict(docstring_by_key)
+
+
+def get_generated_docstring_by_key(typed_dict: TypedDict) -> Optional[dict]:
+    try:
+        from .parameter_docstrings import docstring_by_key_by_typed_dict_name
+    except ImportError:
+        return None
+    return docstring_by_key_by_typed_dict_name.get(typed_dict.__name__)
+
+
+def is_generated_docstring_by_key_stale(typed_dict: TypedDict) -> bool:
+    """Whether the source of a TypedDict changed since the table was generated.
+
+    Reads the source, so is meant for tests rather than runtime.
+    """
+    from .parameter_docstrings import source_hash_by_typed_dict_name
+
+    source_hash = source_hash_by_typed_dict_name.get(typed_dict.__name__)
+    return source_hash != hash_source(inspect.getsource(typed_dict))
+
+
+def hash_source(source: str) -> str:
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def parse_docstring_by_key(typed_dict: TypedDict) -> OrderedDict:
     source = inspect.getsource(typed_dict)
     tree = ast.parse(source)
     docstring_vistor = TypedDictKeyDocstringVistor()
     docstring_vistor.visit(tree)
     return docstring_vistor.docstring_by_key
+
+
+def generate_parameter_docstrings_module(typed_dicts: List[TypedDict]) -> str:
+    lines = [
+        '"""Generated by get_docstring_by_key.py. DO NOT EDIT.',
+        '',
+        'Regenerate by running:',
+        '',
+        '    python -m openafpm_cad_core.get_docstring_by_key',
+        '"""',
+        '',
+        'docstring_by_key_by_typed_dict_name = {',
+    ]
+    for typed_dict in typed_dicts:
+        lines.append(f'    {typed_dict.__name__!r}: {{')
+        for key, docstring in parse_docstring_by_key(typed_dict).items():
+            lines.append(f'        {key!r}: {format_string(docstring, indent=" " * 12)},')
+        lines.append('    },')
+    lines += ['}', '', 'source_hash_by_typed_dict_name = {']
+    for typed_dict in typed_dicts:
+        lines.append(f'    {typed_dict.__name__!r}: {hash_source(inspect.getsource(typed_dict))!r},')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def format_string(value: Optional[str], indent: str, width: int = 120) -> str:
+    """Format a string as a parenthesized implicit concatenation of lines no longer than width."""
+    if value is None:
+        return repr(value)
+    pieces = []
+    for line in value.splitlines(keepends=True):
+        while len(indent) + len(repr(line)) > width:
+            end = len(line) - 1
+            while len(indent) + len(repr(line[:end])) > width:
+                end -= 1
+            # Split after a space if possible.
+            end = line.rfind(' ', 0, end) + 1 or end
+            pieces.append(line[:end])
+            line = line[end:]
+        pieces.append(line)
+    if len(pieces) <= 1:
+        return repr(value)
+    return '(\n' + ''.join(f'{indent}{piece!r}\n' for piece in pieces) + indent[:-4] + ')'
+
+
+if __name__ == '__main__':
+    from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+
+    module = generate_parameter_docstrings_module(
+        [MagnafpmParameters, FurlingParameters, UserParameters])
+    path = Path(__file__).parent.joinpath('parameter_docstrings.py')
+    path.write_text(module, encoding='utf-8')
+    print(f'Wrote {path}')
@@ -6,22 +6,69 @@ See JSON Schema:
 https://json-schema.org/understanding-json-schema/
 """
 
-from typing import List, get_type_hints
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Union, get_type_hints
 
-from .get_default_parameters import get_default_parameters
+from .get_default_parameters import get_preset
 from .get_docstring_by_key import get_docstring_by_key
 from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
 from .pipe_size import PipeSize
 from .wind_turbine_shape import (
     WindTurbineShape,
+    get_wind_turbine_shape,
 )
 
+__all__ = ["get_parameters_schema", "get_preset_schema"]
+
 MIN_NUMBER_MAGNET = 4
 MAX_NUMBER_MAGNET = 32
 
 
 def get_parameters_schema(wind_turbine_shape: WindTurbineShape) -> dict:
-    default_parameters = get_default_parameters(wind_turbine_shape)
+    """Returns a copy which may be modified.
+    See ``get_preset_schema`` for a read-only view.
+    """
+    return thaw(get_cached_parameters_schema(wind_turbine_shape))
+
+
+def get_preset_schema(preset: Union[WindTurbineShape, str]) -> Mapping:
+    """Get a read-only view of the schema for the wind turbine shape of a preset.
+
+    Cheaper than ``get_parameters_schema`` as nothing is copied.
+    Objects are read-only mappings, and arrays are tuples.
+    """
+    parameters = get_preset(preset)
+    wind_turbine_shape = get_wind_turbine_shape(parameters["magnafpm"], parameters["user"])
+    return get_cached_parameters_schema(wind_turbine_shape)
+
+
+@lru_cache(maxsize=None)
+def get_cached_parameters_schema(wind_turbine_shape: WindTurbineShape) -> Mapping:
+    """Build schema once per shape, as a read-only view."""
+    return freeze(build_parameters_schema(wind_turbine_shape))
+
+
+def freeze(value: Any) -> Any:
+    """Convert dicts to read-only mappings, and lists to tuples, recursively."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of ``freeze``, returning a copy which may be modified."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def build_parameters_schema(wind_turbine_shape: WindTurbineShape) -> dict:
+    default_parameters = get_preset(wind_turbine_shape)
     default_flat_metal_thickness = default_parameters["user"]["FlatMetalThickness"]
     default_rotor_disk_central_hole_diameter = default_parameters["user"][
         "RotorDiskCentralHoleDiameter"
@@ -511,7 +558,7 @@ def get_yaw_pipe_diameter_enum(wind_turbine_shape: WindTurbineShape) -> List[flo
 
     For T Shape, also allow one size down from the default.
     """
-    default_parameters = get_default_parameters(wind_turbine_shape)
+    default_parameters = get_preset(wind_turbine_shape)
     default_yaw_pipe_diameter = default_parameters["user"]["YawPipeDiameter"]
     pipe_sizes = get_pipe_sizes()
     index = pipe_sizes.index(default_yaw_pipe_diameter)
@@ -551,7 +598,7 @@ def get_pipe_thickness_maximum(wind_turbine_shape: WindTurbineShape) -> float:
 def get_hub_pitch_circle_diameter_minimum(
     wind_turbine_shape: WindTurbineShape,
 ) -> float:
-    default_parameters = get_default_parameters(wind_turbine_shape)
+    default_parameters = get_preset(wind_turbine_shape)
     default_hub_pitch_circle_diameter = default_parameters["user"][
         "HubPitchCircleDiameter"
     ]
@@ -562,7 +609,7 @@ def get_hub_pitch_circle_diameter_minimum(
 
 
 def get_holes_diameter_minimum(wind_turbine_shape: WindTurbineShape) -> float:
-    default_parameters = get_default_parameters(wind_turbine_shape)
+    default_parameters = get_preset(wind_turbine_shape)
     default_holes_diameter = default_parameters["user"]["HolesDiameter"]
     if wind_turbine_shape == WindTurbineShape.T:
         return default_holes_diameter - 4
@@ -571,7 +618,7 @@ def get_holes_diameter_minimum(wind_turbine_shape: WindTurbineShape) -> float:
 
 
 def get_hub_holes_diameter_minimum(wind_turbine_shape: WindTurbineShape) -> float:
-    default_parameters = get_default_parameters(wind_turbine_shape)
+    default_parameters = get_preset(wind_turbine_shape)
     default_hub_holes_diameter = default_parameters["user"]["HubHolesDiameter"]
     if wind_turbine_shape == WindTurbineShape.T:
         return default_hub_holes_diameter - 4
@@ -636,7 +683,7 @@ def get_metal_thickness_l_maximum(wind_turbine_shape: WindTurbineShape) -> float
 
 
 def get_flat_metal_thickness_minimum(wind_turbine_shape: WindTurbineShape) -> float:
-    default_parameters = get_default_parameters(wind_turbine_shape)
+    default_parameters = get_preset(wind_turbine_shape)
     default_flat_metal_thickness = default_parameters["user"]["FlatMetalThickness"]
     if wind_turbine_shape == WindTurbineShape.T:
         return default_flat_metal_thickness - 5
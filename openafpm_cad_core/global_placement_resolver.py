@@ -0,0 +1,103 @@
+"""Module for resolving global placements of objects.
+
+The global placement of an object is the product of placements
+from the top-most parent down to the object,
+following the first parent in ``InList`` at each level.
+
+Calculating the global placement of each object separately
+multiplies the placements of shared ancestors again for every object.
+A ``GlobalPlacementResolver`` calculates each global placement once top-down,
+reusing the global placement of the parent,
+and stores global placements in a contiguous list indexed by object.
+
+Resolvers are cached per set of documents,
+and the cache is cleared whenever documents are recomputed or closed.
+
+To query few objects, create a resolver without documents,
+which resolves only the chains of parents of queried objects.
+"""
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+from FreeCAD import Console, Document, Placement
+
+from .assembly_graph import ObjectKey, get_object_key
+
+__all__ = ['GlobalPlacementResolver', 'get_global_placement_resolver', 'clear_global_placement_cache']
+
+logger = logging.getLogger(__name__)
+
+global_placement_resolver_by_document_names: Dict[Tuple[str, ...], 'GlobalPlacementResolver'] = {}
+
+
+class GlobalPlacementResolver:
+    """Global placements of objects in documents, and their parents.
+
+    Parents may be in other documents (e.g. through App::Link).
+
+    :param documents: Documents to resolve every object of up-front.
+    """
+
+    def __init__(self, documents: Iterable[Document] = ()) -> None:
+        self.index_by_key: Dict[ObjectKey, int] = {}
+        self.global_placements: List[Placement] = []
+        for document in documents:
+            for obj in document.Objects:
+                self._resolve(obj)
+
+    def get_global_placement(self, obj: object) -> Placement:
+        """Get the global placement of an object, resolving it if it's not in the indexed documents."""
+        key = get_object_key(obj)
+        if key not in self.index_by_key:
+            self._resolve(obj)
+        return self.global_placements[self.index_by_key[key]]
+
+    def get_global_placements(self, objects: Iterable[object]) -> List[Placement]:
+        """Get global placements of many objects at once."""
+        return [self.get_global_placement(obj) for obj in objects]
+
+    def _resolve(self, obj: object) -> None:
+        # Walk up to the first resolved ancestor (or top-most parent),
+        # then resolve placements top-down.
+        unresolved = []
+        while obj is not None:
+            key = get_object_key(obj)
+            if key in self.index_by_key:
+                break
+            unresolved.append((key, obj))
+            obj = get_parent(obj)
+        parent_placement = (
+            Placement() if obj is None
+            else self.global_placements[self.index_by_key[get_object_key(obj)]]
+        )
+        for key, obj in reversed(unresolved):
+            parent_placement = parent_placement * get_placement(obj)
+            self.index_by_key[key] = len(self.global_placements)
+            self.global_placements.append(parent_placement)
+
+
+def get_global_placement_resolver(documents: List[Document]) -> GlobalPlacementResolver:
+    """Get the cached global placement resolver of documents, or create one on a cache miss."""
+    key = tuple(document.Name for document in documents)
+    if key not in global_placement_resolver_by_document_names:
+        logger.debug(f'Resolving global placements of {", ".join(key)}')
+        global_placement_resolver_by_document_names[key] = GlobalPlacementResolver(documents)
+    return global_placement_resolver_by_document_names[key]
+
+
+def clear_global_placement_cache() -> None:
+    global_placement_resolver_by_document_names.clear()
+
+
+def get_parent(obj: object) -> object:
+    in_list = obj.InList
+    if len(in_list) == 0:
+        return None
+    if len(in_list) > 1:
+        Console.PrintWarning(f"{obj.Label} has more than 1 parent. Choosing 1st.\n")
+    return in_list[0]
+
+
+def get_placement(obj: object) -> Placement:
+    # Objects like spreadsheets don't have placements.
+    return getattr(obj, 'Placement', Placement())
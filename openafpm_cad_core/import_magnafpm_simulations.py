@@ -0,0 +1,237 @@
+"""Module to bulk import MagnAFPM simulation .mat files into validated parameter sets.
+
+Files are read from a directory (searched recursively), or a ``.zip`` or ``.tar`` archive,
+and streamed through a process pool which:
+
+1. reads the variables needed by ``map_magnafpm_parameters`` with ``loadmat_numpy``,
+2. maps them to MagnAFPM parameters,
+3. validates them against ``get_parameters_schema``,
+4. and hashes them with ``hash_parameters``.
+
+Parameter sets with the same hash are de-duplicated,
+and can be written to a columnar ``.npz`` or ``.parquet`` file.
+"""
+import logging
+import tarfile
+import time
+import zipfile
+from io import BytesIO
+from multiprocessing import Pool
+from pathlib import Path
+from typing import (Callable, Dict, Iterator, List, Optional, Tuple, TypedDict,
+                    Union)
+
+from .get_default_parameters import get_preset
+from .get_parameters_schema import get_cached_parameters_schema
+from .loadmat_numpy import loadmat_numpy
+from .map_magnafpm_parameters import (MAGNAFPM_VARIABLE_NAMES,
+                                      map_magnafpm_parameters)
+from .parameter_groups import (FurlingParameters, MagnafpmParameters,
+                               UserParameters)
+from .parameter_hash import hash_parameters
+from .validate_parameters import validate_parameters
+from .wind_turbine_shape import map_rotor_disk_radius_to_wind_turbine_shape
+
+__all__ = ['import_magnafpm_simulations', 'MagnafpmImport']
+
+logger = logging.getLogger(__name__)
+
+MAT_SUFFIX = '.mat'
+
+# Number of files sent to each worker process at a time.
+CHUNK_SIZE = 16
+
+
+class MagnafpmImport(TypedDict):
+    parameters_by_hash: Dict[str, MagnafpmParameters]
+    """Unique MagnAFPM parameters keyed by hash in order of first occurrence."""
+
+    sources_by_hash: Dict[str, List[str]]
+    """Files each unique set of parameters was imported from."""
+
+    error_by_source: Dict[str, str]
+    """Error message for each file which failed to import."""
+
+    file_count: int
+    """Number of files processed."""
+
+    elapsed_seconds: float
+    """Wall-clock time taken to import all files."""
+
+    files_per_second: float
+    """Throughput of the import."""
+
+
+def import_magnafpm_simulations(
+        source: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        furling_parameters: Optional[FurlingParameters] = None,
+        user_parameters: Optional[UserParameters] = None,
+        processes: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, int], None]] = None) -> MagnafpmImport:
+    """Import a directory, ``.zip``, or ``.tar`` archive of MagnAFPM simulation .mat files.
+
+    Furling and user parameters are needed to hash parameters.
+    If omitted, they default to the preset for the wind turbine shape
+    calculated from the rotor disk radius of each file.
+
+    :param source: Directory or archive containing .mat files.
+    :param output_path: Optional ``.npz`` or ``.parquet`` path to write unique parameters to
+                        with one column per MagnAFPM parameter, plus ``hash`` and ``source`` columns.
+    :param furling_parameters: Furling parameters to hash with.
+    :param user_parameters: User parameters to hash with.
+    :param processes: Number of worker processes. Defaults to the number of CPUs.
+                      Files are imported in the current process if 1.
+    :param progress_callback: Optional callback function(stage_name: str, percent: int).
+    :returns: Unique parameters, per-file errors, and throughput.
+    """
+    sources = list_sources(Path(source))
+    total = len(sources)
+    items = (
+        (name, payload, furling_parameters, user_parameters)
+        for name, payload in read_sources(Path(source), sources)
+    )
+    parameters_by_hash: Dict[str, MagnafpmParameters] = {}
+    sources_by_hash: Dict[str, List[str]] = {}
+    error_by_source: Dict[str, str] = {}
+    start = time.perf_counter()
+
+    def handle_result(i: int, result: Tuple[str, Optional[str], Optional[MagnafpmParameters], Optional[str]]):
+        name, parameter_hash, parameters, error = result
+        if error is not None:
+            logger.debug(f'Failed to import {name}: {error}')
+            error_by_source[name] = error
+        else:
+            if parameter_hash not in parameters_by_hash:
+                parameters_by_hash[parameter_hash] = parameters
+                sources_by_hash[parameter_hash] = []
+            sources_by_hash[parameter_hash].append(name)
+        if progress_callback is not None:
+            progress_callback(f'Imported {name}', round((i + 1) / total * 100))
+
+    if processes == 1:
+        for i, item in enumerate(items):
+            handle_result(i, import_simulation(item))
+    else:
+        with Pool(processes) as pool:
+            for i, result in enumerate(pool.imap(import_simulation, items, CHUNK_SIZE)):
+                handle_result(i, result)
+
+    elapsed_seconds = time.perf_counter() - start
+    files_per_second = total / elapsed_seconds if elapsed_seconds > 0 else 0.0
+    logger.info(
+        f'Imported {total} files in {elapsed_seconds:.2f}s ({files_per_second:.1f} files/s) '
+        f'with {len(parameters_by_hash)} unique and {len(error_by_source)} errors')
+    if output_path is not None:
+        write_columns(Path(output_path), parameters_by_hash, sources_by_hash)
+    return {
+        'parameters_by_hash': parameters_by_hash,
+        'sources_by_hash': sources_by_hash,
+        'error_by_source': error_by_source,
+        'file_count': total,
+        'elapsed_seconds': elapsed_seconds,
+        'files_per_second': files_per_second
+    }
+
+
+def import_simulation(
+        item: Tuple[str, Union[str, bytes], Optional[FurlingParameters], Optional[UserParameters]]
+) -> Tuple[str, Optional[str], Optional[MagnafpmParameters], Optional[str]]:
+    """Import a single simulation in a worker process.
+
+    :returns: Tuple of (name, hash, parameters, error).
+    """
+    name, payload, furling_parameters, user_parameters = item
+    try:
+        file = payload if isinstance(payload, str) else BytesIO(payload)
+        magnafpm_parameters = map_magnafpm_parameters(loadmat_numpy(file, MAGNAFPM_VARIABLE_NAMES))
+        wind_turbine_shape = map_rotor_disk_radius_to_wind_turbine_shape(
+            magnafpm_parameters['RotorDiskRadius'])
+        schema = get_cached_parameters_schema(wind_turbine_shape)
+        magnafpm_parameters = coerce_integers(
+            magnafpm_parameters, schema['properties']['magnafpm']['properties'])
+        errors = validate_parameters({'magnafpm': magnafpm_parameters}, schema)
+        if errors:
+            return name, None, None, ' '.join(errors)
+        default_parameters = get_preset(wind_turbine_shape)
+        parameter_hash = hash_parameters(
+            magnafpm_parameters,
+            default_parameters['furling'] if furling_parameters is None else furling_parameters,
+            default_parameters['user'] if user_parameters is None else user_parameters)
+        return name, parameter_hash, magnafpm_parameters, None
+    except Exception as error:
+        return name, None, None, f'{type(error).__name__}: {error}'
+
+
+def coerce_integers(parameters: dict, properties_by_key: dict) -> dict:
+    """Convert whole floats to int for parameters of type integer.
+
+    MAT-files may store integers as doubles (e.g. 10.0),
+    which would otherwise hash differently from the equivalent integer.
+    """
+    return {
+        key: int(value)
+        if (properties_by_key.get(key, {}).get('type') == 'integer' and
+            isinstance(value, float) and value.is_integer())
+        else value
+        for key, value in parameters.items()
+    }
+
+
+def list_sources(source: Path) -> List[str]:
+    if source.is_dir():
+        return [str(path) for path in sorted(source.rglob('*' + MAT_SUFFIX))]
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return [name for name in archive.namelist() if name.endswith(MAT_SUFFIX)]
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            return [member.name for member in archive.getmembers()
+                    if member.isfile() and member.name.endswith(MAT_SUFFIX)]
+    else:
+        raise ValueError(f'"{source}" must be a directory, .zip, or .tar archive.')
+
+
+def read_sources(source: Path, names: List[str]) -> Iterator[Tuple[str, Union[str, bytes]]]:
+    """Yield name and path for files in a directory,
+    or name and content for files in an archive one at a time.
+    """
+    if source.is_dir():
+        for name in names:
+            yield name, name
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for name in names:
+                yield name, archive.read(name)
+    else:
+        with tarfile.open(source) as archive:
+            for name in names:
+                yield name, archive.extractfile(name).read()
+
+
+def write_columns(output_path: Path,
+                  parameters_by_hash: Dict[str, MagnafpmParameters],
+                  sources_by_hash: Dict[str, List[str]]) -> None:
+    keys = list(MagnafpmParameters.__annotations__.keys())
+    columns = {
+        'hash': list(parameters_by_hash.keys()),
+        'source': [sources_by_hash[h][0] for h in parameters_by_hash.keys()],
+        **{key: [parameters[key] for parameters in parameters_by_hash.values()] for key in keys}
+    }
+    suffix = output_path.suffix.lower()
+    if suffix == '.npz':
+        try:
+            import numpy as np
+        except ImportError as error:
+            raise ImportError('numpy is required to write .npz files.') from error
+        np.savez_compressed(output_path, **{name: np.array(values) for name, values in columns.items()})
+    elif suffix == '.parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError('pyarrow is required to write .parquet files.') from error
+        pq.write_table(pa.table(columns), output_path)
+    else:
+        raise ValueError(f'Unsupported output format "{suffix}". Must be .npz or .parquet.')
+    logger.debug(f'Wrote {len(parameters_by_hash)} parameter sets to {output_path}')
@@ -0,0 +1,125 @@
+"""Module for indexing objects by label.
+
+``Document.getObjectsByLabel`` scans every object in a document on each call.
+A ``LabelIndex`` maps labels to objects for a document,
+and is built on first lookup.
+
+Descendents of an object by label (see ``find_descendent_by_label``)
+are also indexed with a single traversal on first lookup.
+
+Indexes are kept up-to-date by a FreeCAD document observer which
+invalidates them when objects are created, deleted, relabeled,
+or their links to other objects change.
+"""
+import logging
+from typing import Dict, List, Optional
+
+import FreeCAD as App
+from FreeCAD import Document
+
+from .assembly_graph import ObjectKey, get_object_key, is_link_array, iterate_unique_objects
+
+__all__ = ['LabelIndex', 'get_label_index', 'get_descendent_by_label', 'clear_label_index_cache']
+
+logger = logging.getLogger(__name__)
+
+# Properties which change the descendents of an object.
+TREE_PROPERTIES = {'Group', 'LinkedObject', 'Base'}
+
+label_index_by_document_name: Dict[str, 'LabelIndex'] = {}
+
+descendent_by_label_by_key: Dict[ObjectKey, Dict[str, object]] = {}
+
+
+class LabelIndex:
+    """Objects of a document by label."""
+
+    def __init__(self, document: Document) -> None:
+        self.objects_by_label: Dict[str, List[object]] = {}
+        for obj in document.Objects:
+            self.objects_by_label.setdefault(obj.Label, []).append(obj)
+
+    def get_objects(self, label: str) -> List[object]:
+        return self.objects_by_label.get(label, [])
+
+    def get_object(self, label: str) -> Optional[object]:
+        objects = self.get_objects(label)
+        return objects[0] if objects else None
+
+
+class LabelIndexObserver:
+    """Invalidates indexes when documents change.
+
+    https://wiki.freecad.org/Python_Document_Observer
+    """
+
+    def slotCreatedObject(self, obj):
+        invalidate(obj.Document.Name)
+
+    def slotDeletedObject(self, obj):
+        invalidate(obj.Document.Name)
+
+    def slotChangedObject(self, obj, prop):
+        if prop == 'Label':
+            invalidate(obj.Document.Name)
+        elif prop in TREE_PROPERTIES:
+            descendent_by_label_by_key.clear()
+
+    def slotDeletedDocument(self, document):
+        invalidate(document.Name)
+
+
+observer: Optional[LabelIndexObserver] = None
+
+
+def get_label_index(document: Document) -> LabelIndex:
+    """Get the index of a document, or index it if it's not indexed."""
+    add_observer()
+    if document.Name not in label_index_by_document_name:
+        logger.debug(f'Indexing labels of {document.Name}')
+        label_index_by_document_name[document.Name] = LabelIndex(document)
+    return label_index_by_document_name[document.Name]
+
+
+def get_descendent_by_label(obj: object) -> Dict[str, object]:
+    """Get the first descendent (or the object itself) with each label.
+
+    Descends into App::Link, link arrays, and App::Part.
+    """
+    add_observer()
+    key = get_object_key(obj)
+    if key not in descendent_by_label_by_key:
+        descendent_by_label = {}
+        for descendent in iterate_unique_objects([obj], get_children):
+            descendent_by_label.setdefault(descendent.Label, descendent)
+        descendent_by_label_by_key[key] = descendent_by_label
+    return descendent_by_label_by_key[key]
+
+
+def get_children(obj: object) -> List[object]:
+    if obj.TypeId == 'App::Link':
+        return [obj.LinkedObject]
+    elif is_link_array(obj):
+        return [obj.Base]
+    elif obj.TypeId == 'App::Part':
+        return obj.Group
+    else:
+        return []
+
+
+def invalidate(document_name: str) -> None:
+    label_index_by_document_name.pop(document_name, None)
+    # Descendents may be in other documents through links.
+    descendent_by_label_by_key.clear()
+
+
+def clear_label_index_cache() -> None:
+    label_index_by_document_name.clear()
+    descendent_by_label_by_key.clear()
+
+
+def add_observer() -> None:
+    global observer
+    if observer is None:
+        observer = LabelIndexObserver()
+        App.addDocumentObserver(observer)
@@ -1,12 +1,15 @@
 from enum import Enum, unique
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import FreeCAD as App
 from FreeCAD import Document
 
+from .cancellation import CancellationToken
+from .document_scope import DocumentScope
 from .load_root_document import load_document, load_root_document, load_root_documents
 from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .progress import ProgressListener
 
 __all__ = ["load_all", "load_turbine", "load_alernator", "load_assembly", "Assembly"]
 
@@ -26,6 +29,7 @@ def load_assembly(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ):
     load_function_by_assembly = {
         Assembly.WIND_TURBINE: load_turbine,
@@ -36,7 +40,7 @@ def load_assembly(
         Assembly.BLADE_TEMPLATE: load_blade_template,
     }
     load_function = load_function_by_assembly[assembly]
-    return load_function(magnafpm_parameters, furling_parameters, user_parameters)
+    return load_function(magnafpm_parameters, furling_parameters, user_parameters, document_scope)
 
 
 def load_all(
@@ -46,6 +50,9 @@ def load_all(
     progress_callback=None,
     progress_range=(0, 100),
     cancel_event=None,
+    cancellation_token: Optional[CancellationToken] = None,
+    progress_listener: Optional[ProgressListener] = None,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[List[Document], Document]:
     """Load all wind turbine CAD documents with optional progress reporting.
     
@@ -62,6 +69,11 @@ def load_all(
         progress_callback: Optional callback function(stage_name: str, percent: int)
         progress_range: Tuple of (start_percent, end_percent) for progress scaling
         cancel_event: Optional threading.Event to signal cancellation
+        cancellation_token: Optional CancellationToken with a deadline, instead of cancel_event
+        progress_listener: Optional callback function(event: ProgressEvent),
+            with the document, objects recomputed, and ETA (see progress.py)
+        document_scope: Optional DocumentScope to load documents from a copy in a scratch directory,
+            recomputing and closing on cancellation only those documents (see document_scope.py)
         
     Returns:
         Tuple of (root_documents, spreadsheet_document)
@@ -100,6 +112,9 @@ def load_all(
         progress_callback,
         progress_range,
         cancel_event,
+        cancellation_token,
+        progress_listener,
+        document_scope,
     )
 
 
@@ -107,12 +122,14 @@ def load_turbine(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[Document, Document]:
     return load_root_document(
         get_wind_turbine_document_path,
         magnafpm_parameters,
         furling_parameters,
         user_parameters,
+        document_scope=document_scope,
     )
 
 
@@ -124,12 +141,14 @@ def load_stator_mold(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[Document, Document]:
     return load_root_document(
         get_stator_mold_assembly_document_path,
         magnafpm_parameters,
         furling_parameters,
         user_parameters,
+        document_scope=document_scope,
     )
 
 
@@ -143,12 +162,14 @@ def load_rotor_mold(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[Document, Document]:
     return load_root_document(
         get_rotor_mold_assembly_document_path,
         magnafpm_parameters,
         furling_parameters,
         user_parameters,
+        document_scope=document_scope,
     )
 
 
@@ -162,12 +183,14 @@ def load_magnet_jig(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[Document, Document]:
     return load_root_document(
         get_magnet_jig_assembly_document_path,
         magnafpm_parameters,
         furling_parameters,
         user_parameters,
+        document_scope=document_scope,
     )
 
 
@@ -181,12 +204,14 @@ def load_coil_winder(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[Document, Document]:
     return load_root_document(
         get_coil_winder_assembly_document_path,
         magnafpm_parameters,
         furling_parameters,
         user_parameters,
+        document_scope=document_scope,
     )
 
 
@@ -200,12 +225,14 @@ def load_blade_template(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[Document, Document]:
     return load_root_document(
         get_blade_template_document_path,
         magnafpm_parameters,
         furling_parameters,
         user_parameters,
+        document_scope=document_scope,
     )
 
 
@@ -213,8 +240,13 @@ def get_blade_template_document_path(documents_path: Path) -> Path:
     return documents_path.joinpath("Blades", "Blade_Template.FCStd")
 
 
-def load_alernator(recompute_all=False) -> Document:
-    return load_document(get_alternator_document_path, recompute_all=recompute_all)
+def load_alernator(recompute_all=False,
+                   recompute_dependencies=False,
+                   document_scope: Optional[DocumentScope] = None) -> Document:
+    return load_document(get_alternator_document_path,
+                         recompute_all=recompute_all,
+                         document_scope=document_scope,
+                         recompute_dependencies=recompute_dependencies)
 
 
 def get_alternator_document_path(documents_path: Path) -> Path:
@@ -0,0 +1,88 @@
+"""Module for loading bills of materials from FreeCAD documents."""
+from typing import Dict, Iterable, List, Optional, TypedDict
+
+from FreeCAD import Document
+
+from .bill_of_materials import (BillOfMaterialsItem, FlatPart, aggregate_bills_of_materials,
+                                create_bill_of_materials)
+from .document_scope import DocumentScope, get_worker_document_scope
+from .export_set_to_svg import get_bound_box, get_material, get_thickness
+from .get_2d_projection import get_2d_projection
+from .get_dxf_export_set import get_dxf_export_set
+from .load import load_all
+from .make_get_part_count import make_get_part_count
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .spreadsheet_snapshot import take_spreadsheet_snapshot
+
+__all__ = [
+    "get_bill_of_materials",
+    "load_bill_of_materials",
+    "load_bills_of_materials",
+    "TurbineConfiguration",
+]
+
+
+class TurbineConfiguration(TypedDict):
+    magnafpm: MagnafpmParameters
+    furling: FurlingParameters
+    user: UserParameters
+    count: int
+    """Number of turbines to build with these parameters."""
+
+
+def load_bill_of_materials(magnafpm_parameters: MagnafpmParameters,
+                           furling_parameters: FurlingParameters,
+                           user_parameters: UserParameters,
+                           document_scope: Optional[DocumentScope] = None) -> List[BillOfMaterialsItem]:
+    root_documents, spreadsheet_document = load_all(
+        magnafpm_parameters, furling_parameters, user_parameters,
+        document_scope=document_scope or get_worker_document_scope())
+    return get_bill_of_materials(root_documents, spreadsheet_document, magnafpm_parameters)
+
+
+def load_bills_of_materials(configurations: Iterable[TurbineConfiguration],
+                            stock_length_by_category: Optional[Dict[str, float]] = None,
+                            kerf: float = 0,
+                            document_scope: Optional[DocumentScope] = None) -> List[BillOfMaterialsItem]:
+    """Load and aggregate bills of materials for a batch of turbines.
+
+    Documents loaded for one turbine are reused for the next turbine, and recomputed with its parameters.
+
+    See ``aggregate_bills_of_materials`` for stock length optimization.
+    """
+    bills_of_materials_with_counts = [
+        (
+            load_bill_of_materials(configuration['magnafpm'], configuration['furling'], configuration['user'],
+                                   document_scope),
+            configuration['count']
+        )
+        for configuration in configurations
+    ]
+    return aggregate_bills_of_materials(bills_of_materials_with_counts, stock_length_by_category, kerf)
+
+
+def get_bill_of_materials(root_documents: List[Document],
+                          spreadsheet_document: Document,
+                          magnafpm_parameters: MagnafpmParameters) -> List[BillOfMaterialsItem]:
+    return create_bill_of_materials(
+        take_spreadsheet_snapshot(spreadsheet_document),
+        get_flat_parts(root_documents, magnafpm_parameters))
+
+
+def get_flat_parts(root_documents: List[Document], magnafpm_parameters: MagnafpmParameters) -> List[FlatPart]:
+    """Get flat parts with the same counts, materials, and thicknesses as the DXF overview."""
+    get_part_count = make_get_part_count(root_documents, magnafpm_parameters)
+    flat_parts = []
+    for obj in get_dxf_export_set(root_documents):
+        bound_box = get_bound_box(get_2d_projection(obj))
+        if bound_box is None:
+            continue
+        flat_parts.append({
+            'label': obj.Label,
+            'count': get_part_count(obj),
+            'material': get_material(obj),
+            'thickness': round(get_thickness(obj), ndigits=2),
+            'width': min(bound_box.XLength, bound_box.YLength),
+            'length': max(bound_box.XLength, bound_box.YLength),
+        })
+    return flat_parts
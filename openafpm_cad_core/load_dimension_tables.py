@@ -0,0 +1,220 @@
+"""Module for loading dimension tables from FreeCAD documents.
+
+Resin volumes are the only values which require geometry
+from the Alternator document, and loading it requires recomputing it and the documents it links to.
+
+Therefore, resin volumes are cached in memory and on disk
+by a hash of parameters relevant to the alternator (MagnAFPM and user parameters),
+and of the Alternator document files, which may change without a new version.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from FreeCAD import Document
+
+from ._version import __version__
+
+from .dimension_tables import (
+    DimensionTables,
+    Element,
+    ResinVolumes,
+    create_dimension_tables,
+    get_dimension_table_ids,
+    get_required_sheet_names,
+)
+from .document_scope import DocumentScope, get_worker_document_scope
+from .find_descendent_by_label import find_descendents_by_labels
+from .find_object_by_label import find_objects_by_labels
+from .get_documents_path import get_documents_path
+from .load import load_alernator
+from .load_spreadsheet_document import load_spreadsheet_document
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .spreadsheet_snapshot import take_spreadsheet_snapshot
+from .wind_turbine_shape import get_wind_turbine_shape
+
+__all__ = [
+    "load_dimension_tables",
+    "load_dimension_table_by_id",
+    "get_dimension_tables",
+    "get_resin_volumes",
+    "load_resin_volumes",
+]
+
+logger = logging.getLogger(__name__)
+
+resin_volumes_by_key: Dict[str, ResinVolumes] = {}
+
+
+def load_dimension_tables(
+    magnafpm_parameters: MagnafpmParameters,
+    furling_parameters: FurlingParameters,
+    user_parameters: UserParameters,
+    img_path_prefix: str = "",
+    document_scope: Optional[DocumentScope] = None,
+) -> List[Element]:
+    document_scope = document_scope or get_worker_document_scope()
+    spreadsheet_document = load_spreadsheet_document(
+        magnafpm_parameters, furling_parameters, user_parameters, document_scope
+    )
+    resin_volumes = load_resin_volumes(
+        magnafpm_parameters, furling_parameters, user_parameters, spreadsheet_document, document_scope
+    )
+    return create_dimension_tables(
+        take_spreadsheet_snapshot(spreadsheet_document),
+        resin_volumes,
+        img_path_prefix,
+    )
+
+
+def load_dimension_table_by_id(
+    magnafpm_parameters: MagnafpmParameters,
+    furling_parameters: FurlingParameters,
+    user_parameters: UserParameters,
+    img_path_prefix: str = "",
+    table_ids: Optional[Iterable[str]] = None,
+    document_scope: Optional[DocumentScope] = None,
+) -> DimensionTables:
+    """Load a lazy mapping of table id to dimension table.
+
+    Only sheets needed by ``table_ids`` are read from the spreadsheet document,
+    and tables are created on first access.
+    Resin volumes are only loaded if the "resin" table is accessed,
+    so other tables never require loading the Alternator document.
+
+    :param table_ids: Ids of tables to include. Defaults to all tables for the wind turbine shape.
+    :param document_scope: Optional scope to load documents in, defaulting to the scope of the worker.
+    """
+    document_scope = document_scope or get_worker_document_scope()
+    spreadsheet_document = load_spreadsheet_document(
+        magnafpm_parameters, furling_parameters, user_parameters, document_scope
+    )
+    wind_turbine_shape = get_wind_turbine_shape(magnafpm_parameters, user_parameters)
+    table_ids = get_dimension_table_ids(wind_turbine_shape, table_ids)
+    return DimensionTables(
+        take_spreadsheet_snapshot(
+            spreadsheet_document, get_required_sheet_names(table_ids)
+        ),
+        lambda: load_resin_volumes(
+            magnafpm_parameters, furling_parameters, user_parameters, document_scope=document_scope
+        ),
+        img_path_prefix,
+        table_ids,
+    )
+
+
+def get_dimension_tables(
+    spreadsheet_document: Document,
+    alternator_document: Document,
+    img_path_prefix: str = "",
+) -> List[Element]:
+    """Get dimension tables from a snapshot of the spreadsheet document.
+
+    Every value is read from the spreadsheet document once,
+    and tables are created from the snapshot.
+    """
+    return create_dimension_tables(
+        take_spreadsheet_snapshot(spreadsheet_document),
+        get_resin_volumes(alternator_document),
+        img_path_prefix,
+    )
+
+
+def get_resin_volumes(alternator_document: Document) -> ResinVolumes:
+    object_by_label = find_objects_by_labels(
+        alternator_document, ["Stator", "Rotor_Back"]
+    )
+    stator_descendent_by_label = find_descendents_by_labels(
+        object_by_label["Stator"], ["ResinCast", "Coils"]
+    )
+    rotor_descendent_by_label = find_descendents_by_labels(
+        object_by_label["Rotor_Back"], ["Rotor_ResinCast", "Rotor_Magnets"]
+    )
+    return {
+        "stator": stator_descendent_by_label["ResinCast"].Shape.Volume
+        - stator_descendent_by_label["Coils"].Shape.Volume,
+        "rotor": rotor_descendent_by_label["Rotor_ResinCast"].Shape.Volume
+        - rotor_descendent_by_label["Rotor_Magnets"].Shape.Volume,
+    }
+
+
+def load_resin_volumes(
+    magnafpm_parameters: MagnafpmParameters,
+    furling_parameters: FurlingParameters,
+    user_parameters: UserParameters,
+    spreadsheet_document: Optional[Document] = None,
+    document_scope: Optional[DocumentScope] = None,
+) -> ResinVolumes:
+    """Load resin volumes from cache, or the Alternator document on a cache miss.
+
+    :param spreadsheet_document: Spreadsheet document already loaded with the given parameters.
+                                 If omitted, it's loaded on a cache miss,
+                                 as it may have been loaded with other parameters since
+                                 (e.g. by ``load_dimension_table_by_id``).
+    :param document_scope: Optional scope to load documents in, defaulting to the scope of the worker.
+    """
+    key = get_resin_volumes_cache_key(magnafpm_parameters, user_parameters)
+    if key in resin_volumes_by_key:
+        return resin_volumes_by_key[key]
+    path = get_resin_volumes_cache_path().joinpath(f"{key}.json")
+    if path.exists():
+        logger.debug(f"Reading resin volumes from {path}")
+        resin_volumes = json.loads(path.read_text())
+    else:
+        logger.debug("Loading alternator to calculate resin volumes")
+        document_scope = document_scope or get_worker_document_scope()
+        if spreadsheet_document is None:
+            load_spreadsheet_document(magnafpm_parameters, furling_parameters, user_parameters, document_scope)
+        alternator_document = load_alernator(recompute_dependencies=True, document_scope=document_scope)
+        resin_volumes = get_resin_volumes(alternator_document)
+        write_resin_volumes(path, resin_volumes)
+    resin_volumes_by_key[key] = resin_volumes
+    return resin_volumes
+
+
+def get_resin_volumes_cache_key(
+    magnafpm_parameters: MagnafpmParameters,
+    user_parameters: UserParameters,
+) -> str:
+    # Include version and Alternator documents as the CAD model may change.
+    data = json.dumps(
+        {
+            "version": __version__,
+            "alternator_documents": hash_alternator_documents(),
+            "magnafpm": dict(magnafpm_parameters),
+            "user": dict(user_parameters),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def hash_alternator_documents() -> str:
+    alternator_path = get_documents_path().joinpath("Alternator")
+    digest = hashlib.sha256()
+    for path in sorted(alternator_path.rglob("*.FCStd")):
+        digest.update(path.relative_to(alternator_path).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_resin_volumes_cache_path() -> Path:
+    # Per user, instead of the shared temporary directory, so users don't read each other's files.
+    cache_path = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if not cache_path:
+        cache_path = Path.home().joinpath(".cache")
+    return Path(cache_path).joinpath("openafpm-cad-core", "resin-volumes")
+
+
+def write_resin_volumes(path: Path, resin_volumes: ResinVolumes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so readers never see a partial file.
+    temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temporary_path.write_text(json.dumps(resin_volumes))
+    os.replace(temporary_path, path)
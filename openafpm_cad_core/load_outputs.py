@@ -0,0 +1,155 @@
+"""Module for loading many outputs from one set of FreeCAD documents.
+
+Each ``load_*`` function loads and recomputes documents,
+so loading every output for a design separately recomputes the same documents several times.
+``load_outputs`` loads all documents once, and gets each requested output from them:
+
+.. code-block:: python
+
+    outputs = load_outputs([OutputType.FREECAD_ARCHIVE, OutputType.FURL_TRANSFORM],
+                           magnafpm_parameters, furling_parameters, user_parameters)
+    furl_transform = outputs[OutputType.FURL_TRANSFORM]
+
+Outputs are got in the order of ``OUTPUT_TYPE_ORDER``,
+as getting the FreeCAD archive saves and closes documents, so it's last.
+
+Documents are loaded in a ``DocumentScope``, the scope of the worker by default,
+so loading outputs doesn't recompute or close documents of other jobs in the same process.
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import FreeCAD as App
+from FreeCAD import Document
+
+from .assembly_to_obj import get_assembly_to_obj
+from .cancellation import UNCANCELLABLE, CancellationToken
+from .document_scope import DocumentScope, get_worker_document_scope
+from .dxf_archive import get_dxf_archive
+from .dxf_as_svg import get_dxf_as_svg
+from .freecad_archive import get_freecad_archive
+from .furl_transform import get_furl_transform
+from .load import Assembly, load_all
+from .load_dimension_tables import get_dimension_tables
+from .output_type import OutputType
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .progress import ProgressListener, ProgressTracker, callback_to_listener
+
+__all__ = ['get_outputs', 'load_outputs']
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_TYPE_ORDER = [
+    OutputType.FURL_TRANSFORM,
+    OutputType.DIMENSION_TABLES,
+    OutputType.ASSEMBLY_TO_OBJ,
+    OutputType.DXF_AS_SVG,
+    OutputType.DXF_ARCHIVE,
+    OutputType.FREECAD_ARCHIVE,
+]
+"""Order to get outputs in. Getting the FreeCAD archive saves and closes documents, so it's last."""
+
+LOAD_PROGRESS_RANGE = (0, 80)
+"""Progress range of loading documents, before getting outputs."""
+
+# Default estimates of how long getting each output takes, until timings are recorded (see progress.py).
+GETTING_OUTPUT_SECONDS = 5
+GETTING_OUTPUT = 'Getting'
+
+
+def load_outputs(output_types: Iterable[OutputType],
+                 magnafpm_parameters: MagnafpmParameters,
+                 furling_parameters: FurlingParameters,
+                 user_parameters: UserParameters,
+                 assemblies: Iterable[Assembly] = (Assembly.WIND_TURBINE,),
+                 img_path_prefix: str = '',
+                 progress_callback=None,
+                 progress_listener: Optional[ProgressListener] = None,
+                 cancellation_token: CancellationToken = UNCANCELLABLE,
+                 document_scope: Optional[DocumentScope] = None) -> Dict[OutputType, Any]:
+    """Load documents once, and get each requested output from them.
+
+    :param output_types: Outputs to get.
+    :param assemblies: Assemblies to get as OBJ, if requested.
+    :param img_path_prefix: Prefix of image paths in dimension tables, if requested.
+    :param progress_callback: Optional callback function(stage_name: str, percent: int).
+    :param progress_listener: Optional listener of progress events (see progress.py).
+    :param document_scope: Optional scope to load documents in, defaulting to the scope of the worker.
+    :returns: Outputs by type.
+              OBJ is a dictionary of OBJ file contents by assembly.
+    """
+    listeners = [callback_to_listener(progress_callback)] if progress_callback else []
+    if progress_listener:
+        listeners.append(progress_listener)
+    document_scope = document_scope or get_worker_document_scope()
+    root_documents, spreadsheet_document = load_all(
+        magnafpm_parameters,
+        furling_parameters,
+        user_parameters,
+        progress_callback,
+        LOAD_PROGRESS_RANGE,
+        cancellation_token=cancellation_token,
+        progress_listener=progress_listener,
+        document_scope=document_scope)
+    progress = ProgressTracker(listeners, (LOAD_PROGRESS_RANGE[1], 100))
+    outputs = get_outputs(output_types, root_documents, spreadsheet_document, magnafpm_parameters,
+                          assemblies, img_path_prefix, progress, cancellation_token, document_scope)
+    progress.complete()
+    return outputs
+
+
+def get_outputs(output_types: Iterable[OutputType],
+                root_documents: List[Document],
+                spreadsheet_document: Document,
+                magnafpm_parameters: MagnafpmParameters,
+                assemblies: Iterable[Assembly] = (Assembly.WIND_TURBINE,),
+                img_path_prefix: str = '',
+                progress: Optional[ProgressTracker] = None,
+                cancellation_token: CancellationToken = UNCANCELLABLE,
+                document_scope: Optional[DocumentScope] = None) -> Dict[OutputType, Any]:
+    """Get each requested output from documents loaded by ``load_all``, in a scope if given."""
+    if progress is None:
+        progress = ProgressTracker()
+    if document_scope is not None:
+        # Leave documents of other jobs open when cancelled.
+        cancellation_token = cancellation_token.child(on_cancel=document_scope.close_documents)
+    requested = set(output_types)
+    ordered_output_types = [output_type for output_type in OUTPUT_TYPE_ORDER if output_type in requested]
+    progress.plan([
+        (GETTING_OUTPUT, output_type.value, GETTING_OUTPUT_SECONDS)
+        for output_type in ordered_output_types
+    ])
+    get_output_by_type = {
+        OutputType.FURL_TRANSFORM: lambda: get_furl_transform(
+            root_documents[0], spreadsheet_document),
+        OutputType.DIMENSION_TABLES: lambda: get_dimension_tables(
+            spreadsheet_document, get_alternator_document(document_scope), img_path_prefix),
+        OutputType.ASSEMBLY_TO_OBJ: lambda: {
+            assembly: get_assembly_to_obj(assembly, root_document)
+            for assembly, root_document in get_root_document_by_assembly(root_documents, assemblies)
+        },
+        OutputType.DXF_AS_SVG: lambda: get_dxf_as_svg(root_documents, magnafpm_parameters),
+        OutputType.DXF_ARCHIVE: lambda: get_dxf_archive(root_documents, magnafpm_parameters),
+        OutputType.FREECAD_ARCHIVE: lambda: get_freecad_archive(root_documents, spreadsheet_document),
+    }
+    outputs = {}
+    for output_type in ordered_output_types:
+        cancellation_token.check()
+        logger.debug(f'Getting {output_type.value}')
+        with progress.step(GETTING_OUTPUT, output_type.value):
+            outputs[output_type] = get_output_by_type[output_type]()
+    return outputs
+
+
+def get_alternator_document(document_scope: Optional[DocumentScope]) -> Document:
+    # Opened as a dependency of root documents.
+    if document_scope is None:
+        return App.getDocument('Alternator')
+    return document_scope.get_document('Alternator')
+
+
+def get_root_document_by_assembly(root_documents: List[Document],
+                                  assemblies: Iterable[Assembly]) -> List[Tuple[Assembly, Document]]:
+    # load_all loads root documents in the order assemblies are defined.
+    root_document_by_assembly = dict(zip(Assembly, root_documents))
+    return [(assembly, root_document_by_assembly[assembly]) for assembly in assemblies]
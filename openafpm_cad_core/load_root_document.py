@@ -5,13 +5,28 @@ import re
 import FreeCAD as App
 from FreeCAD import Document
 
-from .close_all_documents import close_all_documents
+from .assembly_index import clear_assembly_index_cache
+from .cancellation import UNCANCELLABLE, CancellationToken
+from .document_scope import DocumentScope
 from .get_documents_path import get_documents_path
+from .global_placement_resolver import clear_global_placement_cache
 from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .progress import ProgressListener, ProgressStep, ProgressTracker, callback_to_listener
 from .upsert_spreadsheet_document import upsert_spreadsheet_document
 
 __all__ = ["load_root_document", "load_root_documents", "load_document"]
 
+CREATING_SPREADSHEET = "Creating spreadsheet"
+OPENING_DOCUMENTS = "Opening documents for"
+RECOMPUTING_DOCUMENTS = "Recomputing documents"
+RECOMPUTING = "Recomputing"
+
+# Default estimates of how long each stage takes, until timings are recorded (see progress.py).
+CREATING_SPREADSHEET_SECONDS = 2
+OPENING_DOCUMENTS_SECONDS = 2
+RECOMPUTING_DOCUMENTS_SECONDS = 45
+RECOMPUTING_SECONDS_PER_OBJECT = 0.05
+
 
 def load_root_document(
     get_root_document_path: Callable[[Path], Path],
@@ -19,6 +34,7 @@ def load_root_document(
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
     progress_callback=None,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[List[Document], Document]:
     root_documents, spreadsheet_document = load_root_documents(
         [get_root_document_path],
@@ -26,6 +42,7 @@ def load_root_document(
         furling_parameters,
         user_parameters,
         progress_callback,
+        document_scope=document_scope,
     )
     return root_documents[0], spreadsheet_document
 
@@ -38,67 +55,54 @@ def load_root_documents(
     progress_callback=None,
     progress_range=(0, 100),
     cancel_event=None,
+    cancellation_token: Optional[CancellationToken] = None,
+    progress_listener: Optional[ProgressListener] = None,
+    document_scope: Optional[DocumentScope] = None,
 ) -> Tuple[List[Document], Document]:
-    
-    scaled_callback = create_scaled_progress_callback(progress_callback, progress_range)
-    
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-    
-    if scaled_callback:
-        scaled_callback("Initializing", 0)
+    listeners = [callback_to_listener(progress_callback)] if progress_callback else []
+    if progress_listener:
+        listeners.append(progress_listener)
+    progress = ProgressTracker(listeners, progress_range)
+    if cancellation_token is None:
+        cancellation_token = CancellationToken(cancel_event)
+    if document_scope is not None:
+        # Leave documents of other jobs open when cancelled.
+        cancellation_token = cancellation_token.child(on_cancel=document_scope.close_documents)
+    cancellation_token.check()
 
     set_preferences()
     spreadsheet_document_name = "Master_of_Puppets"
 
-    documents_path = get_documents_path()
+    documents_path = get_documents_path() if document_scope is None else document_scope.documents_path
+    doc_names = [get_document_name_from_path_function(path) for path in get_root_document_paths]
+    progress.plan(
+        [(CREATING_SPREADSHEET, None, CREATING_SPREADSHEET_SECONDS)] +
+        [(OPENING_DOCUMENTS, doc_name, OPENING_DOCUMENTS_SECONDS) for doc_name in doc_names] +
+        [(RECOMPUTING_DOCUMENTS, None, RECOMPUTING_DOCUMENTS_SECONDS)]
+    )
 
-    if scaled_callback:
-        scaled_callback("Creating spreadsheet", 5)
     spreadsheet_document_path = documents_path.joinpath(
         f"{spreadsheet_document_name}.FCStd"
     )
-    spreadsheet_document = upsert_spreadsheet_document(
-        spreadsheet_document_path,
-        magnafpm_parameters,
-        furling_parameters,
-        user_parameters,
-        cancel_event,
-    )
-
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
+    with progress.step(CREATING_SPREADSHEET):
+        spreadsheet_document = upsert_spreadsheet_document(
+            spreadsheet_document_path,
+            magnafpm_parameters,
+            furling_parameters,
+            user_parameters,
+            cancellation_token,
+        )
 
     root_documents = []
-    total_docs = len(get_root_document_paths)
-    for i, get_root_document_path in enumerate(get_root_document_paths):
-        if cancel_event is not None and cancel_event.is_set():
-            close_all_documents()
-            raise InterruptedError("Operation was cancelled")
-            
-        if scaled_callback:
-            progress = 10 + (i * 60 // total_docs)
-            doc_name = get_document_name_from_path_function(get_root_document_path)
-            scaled_callback(f"Opening documents for {doc_name}", progress)
-        document = load_document(get_root_document_path)
+    for get_root_document_path, doc_name in zip(get_root_document_paths, doc_names):
+        cancellation_token.check()
+        with progress.step(OPENING_DOCUMENTS, doc_name):
+            document = load_document(get_root_document_path, document_scope=document_scope)
         root_documents.append(document)
 
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-
-    if scaled_callback:
-        scaled_callback("Recomputing documents", 70)
-    recompute_all_documents(scaled_callback, cancel_event)
+    recompute_all_documents(progress, cancellation_token, document_scope)
 
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-
-    if scaled_callback:
-        scaled_callback("Complete", 100)
+    progress.complete()
     return root_documents, spreadsheet_document
 
 
@@ -106,13 +110,17 @@ def load_document(
     get_root_document_path: Callable[[Path], Path],
     recompute: bool = False,
     recompute_all: bool = False,
+    document_scope: Optional[DocumentScope] = None,
+    recompute_dependencies: bool = False,
 ) -> Document:
-    documents_path = get_documents_path()
+    documents_path = get_documents_path() if document_scope is None else document_scope.documents_path
     document = App.openDocument(str(get_root_document_path(documents_path)))
     if recompute:
         recompute_document(document)
+    if recompute_dependencies:
+        recompute_document_with_dependencies(document)
     if recompute_all:
-        recompute_all_documents()
+        recompute_all_documents(document_scope=document_scope)
     return document
 
 
@@ -121,34 +129,52 @@ def save_document(document: Document, path: Path, document_name: str) -> None:
     document.saveAs(str(document_path))
 
 
-def recompute_all_documents(progress_callback=None, cancel_event=None) -> None:
+def recompute_all_documents(progress: Optional[ProgressTracker] = None,
+                            cancellation_token: CancellationToken = UNCANCELLABLE,
+                            document_scope: Optional[DocumentScope] = None) -> None:
+    """Recompute open documents, or only documents of a scope."""
+    if progress is None:
+        progress = ProgressTracker()
     sort_in_dependency_order = True
-    document_by_name = App.listDocuments(sort_in_dependency_order)
-    documents = list(document_by_name.values())
-    total_docs = len(documents)
-
-    for i, document in enumerate(documents):
-        if cancel_event is not None and cancel_event.is_set():
-            close_all_documents()
-            raise InterruptedError("Operation was cancelled")
-            
-        if progress_callback:
-            progress = 70 + int((i / total_docs) * 25)  # 70-95% range
-            progress_callback(f"Recomputing {document.Name}", progress)
-        recompute_document(document, cancel_event)
-
-
-def recompute_document(document: Document, cancel_event=None) -> None:
-    for obj in document.Objects:
-        if cancel_event is not None and cancel_event.is_set():
-            close_all_documents()
-            raise InterruptedError("Operation was cancelled")
-        obj.recompute()
-    
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-    document.recompute(None, True, True)
+    if document_scope is None:
+        documents = list(App.listDocuments(sort_in_dependency_order).values())
+    else:
+        documents = document_scope.get_documents(sort_in_dependency_order)
+
+    with progress.step(RECOMPUTING_DOCUMENTS):
+        # Weight recomputing each document by its number of objects, until timings are recorded.
+        progress.replan((RECOMPUTING_DOCUMENTS, None), [
+            (RECOMPUTING, document.Label, len(document.Objects) * RECOMPUTING_SECONDS_PER_OBJECT)
+            for document in documents
+        ])
+        for document in documents:
+            # Labels are file names, which are the same in every scope, unlike names (e.g. WindTurbine001).
+            with progress.step(RECOMPUTING, document.Label, total=len(document.Objects)) as progress_step:
+                recompute_document(document, cancellation_token, progress_step)
+
+
+def recompute_document_with_dependencies(document: Document,
+                                         cancellation_token: CancellationToken = UNCANCELLABLE) -> None:
+    """Recompute a document, and documents it links to, instead of every open document."""
+    # Sorted in dependency order, including the document itself.
+    for dependency in document.getDependentDocuments(True):
+        recompute_document(dependency, cancellation_token)
+
+
+def recompute_document(document: Document,
+                       cancellation_token: CancellationToken = UNCANCELLABLE,
+                       progress_step: Optional[ProgressStep] = None) -> None:
+    with cancellation_token.step(f"Recomputing {document.Name}"):
+        for obj in document.Objects:
+            cancellation_token.checkpoint()
+            obj.recompute()
+            if progress_step is not None:
+                progress_step.advance()
+        cancellation_token.check()
+        document.recompute(None, True, True)
+    # Recomputing may change visibility, links, link arrays, and placements.
+    clear_assembly_index_cache()
+    clear_global_placement_cache()
 
 
 def set_preferences():
@@ -166,19 +192,3 @@ def get_document_name_from_path_function(get_path_func: Callable[[Path], Path])
     name = path.stem.replace("_", " ")
     # Add spaces before uppercase letters that follow lowercase letters
     return re.sub(r"([a-z])([A-Z])", r"\1 \2", name)
-
-
-def create_scaled_progress_callback(
-    progress_callback: Optional[Callable[[str, int], None]], 
-    progress_range: Tuple[int, int]
-) -> Optional[Callable[[str, int], None]]:
-    """Create a progress callback that scales progress to the given range"""
-    if not progress_callback:
-        return None
-    
-    def scaled_callback(stage: str, percent: int) -> None:
-        start, end = progress_range
-        scaled_percent = start + (percent * (end - start) // 100)
-        progress_callback(stage, scaled_percent)
-    
-    return scaled_callback
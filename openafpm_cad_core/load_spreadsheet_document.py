@@ -1,7 +1,10 @@
 """Module for loading spreadsheet document."""
 
+from typing import Optional
+
 from FreeCAD import Document
 
+from .document_scope import DocumentScope
 from .get_documents_path import get_documents_path
 from .parameter_groups import (FurlingParameters, MagnafpmParameters,
                                UserParameters)
@@ -12,9 +15,10 @@ __all__ = ['load_spreadsheet_document']
 
 def load_spreadsheet_document(magnafpm_parameters: MagnafpmParameters,
                               furling_parameters: FurlingParameters,
-                              user_parameters: UserParameters) -> Document:
+                              user_parameters: UserParameters,
+                              document_scope: Optional[DocumentScope] = None) -> Document:
     name = 'Master_of_Puppets'
-    documents_path = get_documents_path()
+    documents_path = get_documents_path() if document_scope is None else document_scope.documents_path
     spreadsheet_document_path = documents_path.joinpath(f'{name}.FCStd')
     return upsert_spreadsheet_document(spreadsheet_document_path,
                                        magnafpm_parameters,
@@ -6,18 +6,19 @@ Changes:
 * Commented out lines for handling mxCHAR_CLASS:
     # elif mc == 'mxCHAR_CLASS':
     #     return read_char_array(fd, endian, header)
+* Added ``MatFile`` for lazy access to variables.
 """
 
-__all__ = ['loadmat']
+__all__ = ['loadmat', 'MatFile']
 
 import struct
 import sys
 import zlib
 
 try:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 except ImportError:
-    from collections import Sequence
+    from collections import Mapping, Sequence
 
 from itertools import tee
 
@@ -96,6 +97,10 @@ numeric_class_etypes = {
 
 inv_mclasses = dict((v, k) for k, v in mclasses.items())
 
+# number of decompressed bytes needed to read a variable header
+# (miMATRIX tag, array flags, dimensions, and a 63 character name)
+HEADER_PEEK_NUM_BYTES = 256
+
 # data types that may be used when writing numeric data
 compressed_numeric = ['miINT32', 'miUINT16', 'miINT16', 'miUINT8']
 
@@ -262,6 +267,38 @@ def read_var_header(fd, endian):
     return header, next_pos, fd
 
 
+def peek_var_header(fd, endian):
+    """Read header of the variable at the current position
+    without reading (or fully decompressing) its data.
+
+    Return a dict with the parsed header, and the file position of next tag.
+    """
+    mtpn, num_bytes = unpack(endian, 'II', fd.read(8))
+    next_pos = fd.tell() + num_bytes
+
+    if mtpn == etypes['miCOMPRESSED']['n']:
+        # decompress just enough data to read the header
+        dcor = zlib.decompressobj()
+        data = b''
+        remaining = num_bytes
+        while len(data) < HEADER_PEEK_NUM_BYTES and (remaining > 0 or dcor.unconsumed_tail):
+            chunk = fd.read(min(HEADER_PEEK_NUM_BYTES, remaining))
+            if remaining > 0 and not chunk:
+                raise ParseError('Unexpected end of file in compressed variable')
+            remaining -= len(chunk)
+            data += dcor.decompress(dcor.unconsumed_tail + chunk,
+                                    HEADER_PEEK_NUM_BYTES - len(data))
+        fd = BytesIO(data)
+        # read full tag from the uncompressed data
+        mtpn, num_bytes = unpack(endian, 'II', fd.read(8))
+
+    if mtpn != etypes['miMATRIX']['n']:
+        raise ParseError('Expecting miMATRIX type number {}, '
+                         'got {}'.format(etypes['miMATRIX']['n'], mtpn))
+    header = read_header(fd, endian)
+    return header, next_pos
+
+
 def squeeze(array):
     """Return array contents if array contains only one element.
     Otherwise, return the full array.
@@ -404,6 +441,34 @@ class ParseError(Exception):
 #
 
 
+def read_endian(tst_str):
+    """Determine the endian format character from the
+    version and endian test bytes (bytes 124 through 128) of the header.
+
+    Raises a ``ParseError`` if the file is not a level 5 MAT-file.
+    """
+    little_endian = (tst_str[2:4] == b'IM')
+    endian = ''
+    if (sys.byteorder == 'little' and little_endian) or \
+       (sys.byteorder == 'big' and not little_endian):
+        # no byte swapping same endian
+        pass
+    elif sys.byteorder == 'little':
+        # byte swapping
+        endian = '>'
+    else:
+        # byte swapping
+        endian = '<'
+    maj_ind = int(little_endian)
+    # major version number
+    maj_val = ord(tst_str[maj_ind]) if ispy2 else tst_str[maj_ind]
+    if maj_val != 1:
+        raise ParseError('Can only read from Matlab level 5 MAT-files')
+    # the minor version number (unused value)
+    # min_val = ord(tst_str[1 - maj_ind]) if ispy2 else tst_str[1 - maj_ind]
+    return endian
+
+
 def loadmat(filename, meta=False):
     """Load data from MAT-file:
 
@@ -433,25 +498,7 @@ def loadmat(filename, meta=False):
     # endian test string
     fd.seek(124)
     tst_str = fd.read(4)
-    little_endian = (tst_str[2:4] == b'IM')
-    endian = ''
-    if (sys.byteorder == 'little' and little_endian) or \
-       (sys.byteorder == 'big' and not little_endian):
-        # no byte swapping same endian
-        pass
-    elif sys.byteorder == 'little':
-        # byte swapping
-        endian = '>'
-    else:
-        # byte swapping
-        endian = '<'
-    maj_ind = int(little_endian)
-    # major version number
-    maj_val = ord(tst_str[maj_ind]) if ispy2 else tst_str[maj_ind]
-    if maj_val != 1:
-        raise ParseError('Can only read from Matlab level 5 MAT-files')
-    # the minor version number (unused value)
-    # min_val = ord(tst_str[1 - maj_ind]) if ispy2 else tst_str[1 - maj_ind]
+    endian = read_endian(tst_str)
 
     mdict = {}
     if meta:
@@ -478,3 +525,85 @@ def loadmat(filename, meta=False):
 
     fd.close()
     return mdict
+
+
+class MatFile(Mapping):
+    """Lazy, read-only mapping of variables in a MAT-file:
+
+    with MatFile(filename) as mat:
+        names = list(mat)
+        data = mat['name']
+
+    Opening the file only scans variable headers to build an index
+    of variable names to file positions.
+
+    A variable is decompressed and parsed on first access,
+    and cached for subsequent accesses.
+    Other variables are never read into memory.
+
+    The filename argument is either a string with the filename, or
+    a seekable file like object.
+    """
+
+    def __init__(self, filename):
+        if isinstance(filename, basestring):
+            self._fd = open(filename, 'rb')
+        else:
+            self._fd = filename
+        self._position_by_name = {}
+        self._header_by_name = {}
+        self._cache = {}
+        try:
+            self._scan()
+        except Exception:
+            # Don't leak the file opened above, as no MatFile is returned to close it.
+            if isinstance(filename, basestring):
+                self._fd.close()
+            raise
+
+    def _scan(self):
+        self._fd.seek(124)
+        self._endian = read_endian(self._fd.read(4))
+        self._fd.seek(128)
+        while not eof(self._fd):
+            position = self._fd.tell()
+            hdr, next_position = peek_var_header(self._fd, self._endian)
+            name = hdr['name']
+            if name in self._position_by_name:
+                raise ParseError('Duplicate variable name "{}" in mat file.'
+                                 .format(name))
+            self._position_by_name[name] = position
+            self._header_by_name[name] = hdr
+            self._fd.seek(next_position)
+
+    def header(self, name):
+        """Return the header of a variable (class, dimensions, etc.)
+        without reading its data.
+        """
+        return self._header_by_name[name]
+
+    def __getitem__(self, name):
+        if name not in self._cache:
+            position = self._position_by_name[name]
+            self._fd.seek(position)
+            hdr, next_position, fd_var = read_var_header(self._fd, self._endian)
+            self._cache[name] = read_var_array(fd_var, self._endian, hdr)
+        return self._cache[name]
+
+    def __iter__(self):
+        return iter(self._position_by_name)
+
+    def __len__(self):
+        return len(self._position_by_name)
+
+    def __contains__(self, name):
+        return name in self._position_by_name
+
+    def close(self):
+        self._fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,331 @@
+"""
+NumPy-backed reader for level 5 MAT-files.
+
+Unlike ``loadmat``, which decodes numeric arrays element by element
+into nested lists, numeric data is decoded with ``numpy.frombuffer``
+over the raw element payloads.
+
+Files on disk are memory-mapped, so uncompressed elements are
+decoded directly from the mapping, and compressed elements are
+decompressed one at a time without reading the whole file into memory.
+
+Passing ``variable_names`` only decodes the given variables.
+For compressed elements, just enough of each element is decompressed
+to read the variable name, and the rest of the element is skipped.
+
+NumPy is optional, and only required to call ``loadmat_numpy``.
+"""
+# Postpone evaluation of annotations, so NumPy types may be annotated without NumPy.
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .loadmat import (ParseError, etypes, inv_etypes, inv_mclasses,
+                      numeric_class_etypes, read_endian)
+
+__all__ = ['loadmat_numpy']
+
+FILE_HEADER_NUM_BYTES = 128
+
+# Number of bytes to decompress when peeking the name of a compressed variable.
+# Enough for the miMATRIX tag, array flags, dimensions, and a 63 character name.
+NAME_PEEK_NUM_BYTES = 256
+
+dtype_by_etype = {
+    'miINT8': 'i1',
+    'miUINT8': 'u1',
+    'miINT16': 'i2',
+    'miUINT16': 'u2',
+    'miINT32': 'i4',
+    'miUINT32': 'u4',
+    'miSINGLE': 'f4',
+    'miDOUBLE': 'f8',
+    'miINT64': 'i8',
+    'miUINT64': 'u8',
+    'miUTF8': 'u1',
+    'miUTF16': 'u2',
+    'miUTF32': 'u4'
+}
+
+
+def loadmat_numpy(filename, variable_names: Optional[Iterable[str]] = None) -> dict:
+    """Load data from MAT-file using NumPy.
+
+    The filename argument is either a string with the filename, or
+    a file like object.
+
+    The returned dict maps variable names to values where:
+
+    * numeric arrays with one element are returned as Python scalars,
+    * other numeric arrays are returned as ``numpy.ndarray``
+      (with the leading dimension removed for single row arrays),
+    * structs are returned as dicts of fields,
+    * and cell arrays are returned as lists in column-major order.
+
+    If ``variable_names`` is given, then only those variables are decoded,
+    and reading stops as soon as all of them have been found.
+
+    A ``ParseError`` exception is raised if the MAT-file is corrupt or
+    contains a data type that cannot be parsed.
+
+    An ``ImportError`` is raised if NumPy isn't installed.
+    """
+    if np is None:
+        raise ImportError('numpy is required to read MAT-files with loadmat_numpy.')
+    wanted = None if variable_names is None else set(variable_names)
+    if isinstance(filename, str):
+        with open(filename, 'rb') as fd:
+            if fd.seek(0, 2) < FILE_HEADER_NUM_BYTES:
+                raise ParseError('File is too small to be a MAT-file')
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return read_variables(buffer, wanted)
+    else:
+        data = filename.read()
+        filename.close()
+        return read_variables(data, wanted)
+
+
+def read_variables(buffer, wanted: Optional[set]) -> dict:
+    if len(buffer) < FILE_HEADER_NUM_BYTES:
+        raise ParseError('File is too small to be a MAT-file')
+    try:
+        return read_elements_until_end(buffer, wanted)
+    except (struct.error, ValueError, zlib.error) as error:
+        # Arrays are copied out of memory-mapped files,
+        # so the traceback doesn't keep the mapping from being closed.
+        raise ParseError('MAT-file is corrupt: {}'.format(error)) from error
+
+
+def read_elements_until_end(buffer, wanted: Optional[set]) -> dict:
+    endian = read_endian(bytes(buffer[124:128])) or '='
+    mdict = {}
+    position = FILE_HEADER_NUM_BYTES
+    end = len(buffer)
+    while position < end:
+        if wanted is not None and wanted.issubset(mdict.keys()):
+            break
+        mtpn, num_bytes = struct.unpack_from(endian + 'II', buffer, position)
+        data_position = position + 8
+        next_position = data_position + num_bytes
+        if next_position > end:
+            raise ParseError('Variable at byte {} extends past the end of the file'.format(position))
+        if mtpn == etypes['miCOMPRESSED']['n']:
+            compressed = memoryview(buffer)[data_position:next_position]
+            try:
+                name, value = read_compressed_variable(compressed, endian, wanted)
+            finally:
+                compressed.release()
+        elif mtpn == etypes['miMATRIX']['n']:
+            # uncompressed elements are padded to a 64-bit boundary
+            next_position += (8 - num_bytes % 8) % 8
+            name = read_name(buffer, data_position, endian)
+            value = read_matrix(buffer, data_position, endian) if is_wanted(name, wanted) else None
+        else:
+            raise ParseError('Expecting miMATRIX type number {}, '
+                             'got {}'.format(etypes['miMATRIX']['n'], mtpn))
+        if is_wanted(name, wanted):
+            if name in mdict:
+                raise ParseError('Duplicate variable name "{}" in mat file.'
+                                 .format(name))
+            mdict[name] = value
+        position = next_position
+    return mdict
+
+
+def is_wanted(name: str, wanted: Optional[set]) -> bool:
+    return wanted is None or name in wanted
+
+
+def read_compressed_variable(compressed, endian: str, wanted: Optional[set]):
+    decompressor = zlib.decompressobj()
+    if wanted is not None:
+        prefix = decompressor.decompress(compressed, NAME_PEEK_NUM_BYTES)
+        name = read_name(prefix, 8, endian)
+        if name not in wanted:
+            return name, None
+        data = prefix + decompressor.decompress(decompressor.unconsumed_tail)
+    else:
+        data = decompressor.decompress(compressed)
+    if decompressor.flush() != b'':
+        raise ParseError('Error in compressed data.')
+    mtpn, num_bytes = struct.unpack_from(endian + 'II', data, 0)
+    if mtpn != etypes['miMATRIX']['n']:
+        raise ParseError('Expecting miMATRIX type number {}, '
+                         'got {}'.format(etypes['miMATRIX']['n'], mtpn))
+    return read_name(data, 8, endian), read_matrix(data, 8, endian)
+
+
+def read_tag(buffer, position: int, endian: str):
+    """Read data element tag at position.
+
+    Returns the data type, number of bytes, position of the data,
+    and position of the next tag.
+    """
+    mtpn, = struct.unpack_from(endian + 'I', buffer, position)
+    num_bytes = mtpn >> 16
+    if num_bytes > 0:
+        # small data element format
+        if num_bytes > 4:
+            raise ParseError('Error parsing Small Data Element (SDE) '
+                             'formatted data')
+        return mtpn & 0xFFFF, num_bytes, position + 4, position + 8
+    num_bytes, = struct.unpack_from(endian + 'I', buffer, position + 4)
+    data_position = position + 8
+    if data_position + num_bytes > len(buffer):
+        raise ParseError('Data element at byte {} extends past the end of the data'.format(position))
+    # Seek to next 64-bit boundary
+    next_position = data_position + num_bytes + (8 - num_bytes % 8) % 8
+    return mtpn, num_bytes, data_position, next_position
+
+
+def read_array(buffer, position: int, endian: str):
+    """Read a numeric data element at position as a 1D array.
+
+    Returns the array and position of the next tag.
+    """
+    mtpn, num_bytes, data_position, next_position = read_tag(buffer, position, endian)
+    if mtpn not in inv_etypes or inv_etypes[mtpn] not in dtype_by_etype:
+        raise ParseError('Unexpected data type {}'.format(mtpn))
+    dtype = np.dtype(dtype_by_etype[inv_etypes[mtpn]]).newbyteorder(endian)
+    # Copy to detach from the memory-mapped file, and convert to native byte order.
+    array = np.frombuffer(buffer, dtype=dtype,
+                          count=num_bytes // dtype.itemsize,
+                          offset=data_position).astype(dtype.newbyteorder('='))
+    return array, next_position
+
+
+def read_integers(buffer, position: int, endian: str, etype: str):
+    """Read a data element of integers of the given type at position,
+    like ``loadmat``, which raises a ``ParseError`` for other types.
+
+    Returns a tuple of integers and position of the next tag.
+    """
+    mtpn, num_bytes, data_position, next_position = read_tag(buffer, position, endian)
+    if mtpn != etypes[etype]['n']:
+        raise ParseError('Got type {}, expected {} ({})'.format(mtpn, etypes[etype]['n'], etype))
+    fmt = etypes[etype]['fmt']
+    count = num_bytes // struct.calcsize(fmt)
+    return struct.unpack_from(endian + str(count) + fmt, buffer, data_position), next_position
+
+
+def read_matrix_header(buffer, position: int, endian: str):
+    """Read array flags, dimensions, and name of the miMATRIX element
+    whose data starts at position.
+
+    Returns the header and position of the next tag.
+    """
+    flags, position = read_integers(buffer, position, endian, 'miUINT32')
+    flag_class = flags[0]
+    dims, position = read_integers(buffer, position, endian, 'miINT32')
+    mtpn, num_bytes, data_position, position = read_tag(buffer, position, endian)
+    name = bytes(buffer[data_position:data_position + num_bytes]).rstrip(b'\0').decode('latin1')
+    header = {
+        'mclass': flag_class & 0x0FF,
+        'is_complex': (flag_class >> 11 & 1) == 1,
+        'dims': dims,
+        'name': name
+    }
+    return header, position
+
+
+def read_name(buffer, position: int, endian: str) -> str:
+    try:
+        header, _ = read_matrix_header(buffer, position, endian)
+    except (struct.error, ValueError):
+        raise ParseError('Unable to read variable name')
+    return header['name']
+
+
+def read_matrix(buffer, position: int, endian: str):
+    """Read variable array (of any supported type) whose data starts at position."""
+    header, position = read_matrix_header(buffer, position, endian)
+    mc = inv_mclasses[header['mclass']]
+
+    if mc in numeric_class_etypes or mc == 'mxCHAR_CLASS':
+        return read_numeric_array(buffer, position, endian, header, mc)
+    elif mc == 'mxSPARSE_CLASS':
+        raise ParseError('Sparse matrices not supported')
+    elif mc == 'mxCELL_CLASS':
+        return read_cell_array(buffer, position, endian, header)
+    elif mc == 'mxSTRUCT_CLASS':
+        return read_struct_array(buffer, position, endian, header)
+    elif mc == 'mxOBJECT_CLASS':
+        raise ParseError('Object classes not supported')
+    elif mc == 'mxFUNCTION_CLASS':
+        raise ParseError('Function classes not supported')
+    elif mc == 'mxOPAQUE_CLASS':
+        raise ParseError('Anonymous function classes not supported')
+
+
+def read_numeric_array(buffer, position: int, endian: str, header: dict, mc: str):
+    if header['is_complex']:
+        raise ParseError('Complex arrays are not supported')
+    array, _ = read_array(buffer, position, endian)
+    size = int(np.prod(header['dims']))
+    if array.size == 0 and size > 0:
+        # Like ``loadmat``, which doesn't decode arrays without data.
+        return None
+    if array.size != size:
+        raise ParseError('Got {} elements for dimensions {}'.format(array.size, header['dims']))
+    if mc == 'mxCHAR_CLASS':
+        return read_char_array(array, header['dims'])
+    return squeeze(array.reshape(header['dims'], order='F'))
+
+
+def squeeze(array: np.ndarray):
+    """Return a Python scalar if array contains only one element.
+    Otherwise, return the array without a leading row dimension of one.
+    """
+    if array.size == 1:
+        return array.item()
+    if array.ndim > 1 and array.shape[0] == 1:
+        return array[0]
+    return array
+
+
+def read_char_array(array: np.ndarray, dims: tuple):
+    rows = array.reshape(dims, order='F')
+    strings = [''.join(map(chr, row)) for row in rows]
+    return strings[0] if len(strings) == 1 else strings
+
+
+def read_elements(buffer, position: int, endian: str, count: int):
+    """Read count consecutive miMATRIX elements starting at position."""
+    values = []
+    for _ in range(count):
+        mtpn, num_bytes, data_position, position = read_tag(buffer, position, endian)
+        if mtpn != etypes['miMATRIX']['n']:
+            raise ParseError('Expecting miMATRIX type number {}, '
+                             'got {}'.format(etypes['miMATRIX']['n'], mtpn))
+        values.append(read_matrix(buffer, data_position, endian) if num_bytes else None)
+    return values
+
+
+def read_cell_array(buffer, position: int, endian: str, header: dict):
+    values = read_elements(buffer, position, endian, int(np.prod(header['dims'])))
+    return values[0] if len(values) == 1 else values
+
+
+def read_struct_array(buffer, position: int, endian: str, header: dict) -> dict:
+    (field_name_length,), position = read_integers(buffer, position, endian, 'miINT32')
+    if field_name_length == 0 or field_name_length > 32:
+        raise ParseError('Unexpected field name length: {}'.format(field_name_length))
+    mtpn, num_bytes, data_position, position = read_tag(buffer, position, endian)
+    names = bytes(buffer[data_position:data_position + num_bytes])
+    fields = [names[i:i + field_name_length].rstrip(b'\0').decode('latin1')
+              for i in range(0, num_bytes, field_name_length)]
+    count = int(np.prod(header['dims']))
+    values = read_elements(buffer, position, endian, count * len(fields))
+    array = {}
+    for i, field in enumerate(fields):
+        field_values = values[i::len(fields)]
+        array[field] = field_values[0] if count == 1 else field_values
+    return array
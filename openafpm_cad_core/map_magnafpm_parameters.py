@@ -2,7 +2,34 @@ from math import isclose
 
 from .parameter_groups import MagnafpmParameters
 
-__all__ = ['map_magnafpm_parameters']
+__all__ = ['map_magnafpm_parameters', 'MAGNAFPM_VARIABLE_NAMES']
+
+# Variables read from MagnAFPM .mat files by map_magnafpm_parameters.
+# Pass as variable_names to loadmat_numpy to skip decoding everything else.
+MAGNAFPM_VARIABLE_NAMES = (
+    'Rturb',
+    'rotor',
+    'Rout',
+    'Rin',
+    'hr',
+    'la',
+    'wm',
+    'hm',
+    'BHmax',
+    'magnet_num',
+    'tw',
+    'coil_type',
+    'wc',
+    'coil_hole_Rout_constr',
+    'coil_hole_Rin_constr',
+    'g',
+    'dist_magnet_Rin',
+    'q',
+    'mcu_constr',
+    'dc',
+    'No_wires_at_hand',
+    'Nc'
+)
 
 
 def map_magnafpm_parameters(magnafpm: dict) -> MagnafpmParameters:
@@ -0,0 +1,14 @@
+"""Module containing types of outputs loaded from FreeCAD documents."""
+from enum import Enum, unique
+
+__all__ = ['OutputType']
+
+
+@unique
+class OutputType(Enum):
+    FREECAD_ARCHIVE = 'FCStd zip'
+    DXF_ARCHIVE = 'DXF zip'
+    DXF_AS_SVG = 'SVG'
+    ASSEMBLY_TO_OBJ = 'OBJ'
+    FURL_TRANSFORM = 'furl transform'
+    DIMENSION_TABLES = 'dimension tables'
@@ -0,0 +1,265 @@
+"""Generated by get_docstring_by_key.py. DO NOT EDIT.
+
+Regenerate by running:
+
+    python -m openafpm_cad_core.get_docstring_by_key
+"""
+
+docstring_by_key_by_typed_dict_name = {
+    'MagnafpmParameters': {
+        'RotorDiameter': (
+            'The width of the circle swept by the rotating blades.\n'
+            '\n'
+            '    Also referred to as the "turbine diameter".\n'
+            '    '
+        ),
+        'RotorTopology': (
+            "One of 'Double', 'Single and metal disk', and 'Single'.\n"
+            '\n'
+            '\n'
+            '    Two magnet rotors sandwiching the stator is most common.\n'
+            '\n'
+            '    The single rotor is featured in the 1.2m diameter turbine,\n'
+            '    and the single rotor with magnet disk is featured in the 1.8m\n'
+            '    diameter design in "A Wind Turbine Recipe Book (2014)".\n'
+            '\n'
+            '    The single rotor topologies for smaller designs is due to\n'
+            '    using the same 46x30x10mm magnets used in larger designs.\n'
+            '\n'
+            '    A double rotor topology can be used in smaller designs by\n'
+            '    using smaller magnets.\n'
+            '\n'
+            '    See "Rotor mounting options" section on the right-hand side of page 46 in "A Wind Turbine Recipe Book '
+            '(2014)".\n'
+            '    '
+        ),
+        'RotorDiskRadius': 'Outer radius of rotor disk(s) for the generator.',
+        'RotorDiskInnerRadius': 'Inner radius of the effective length of the generator.',
+        'RotorDiskThickness': (
+            'Thickness of rotor disk.\n'
+            '\n'
+            '    See "Rotor Disk Thickness" section at:\n'
+            '        https://openafpm.net/design-tips\n'
+            '    '
+        ),
+        'MagnetLength': (
+            'Length of magnet.\n'
+            '\n'
+            '    Not always the longest dimension of the magnet,\n'
+            '    but the radial dimension of the magnet\n'
+            '    (in terms of the rotor circle).\n'
+            '    '
+        ),
+        'MagnetWidth': (
+            'Width of magnet.\n'
+            '\n'
+            '    Not always shorter than MagnetLength,\n'
+            '    but the tangential dimension of the magnet\n'
+            '    (in terms of the rotor circle).\n'
+            '    '
+        ),
+        'MagnetThickness': (
+            'Thickness of magnet.\n'
+            '\n'
+            '    See "Magnet Thickness" section at:\n'
+            '        https://openafpm.net/design-tips\n'
+            '    '
+        ),
+        'MagnetMaterial': (
+            'Material and grade of the magnet.\n'
+            '\n'
+            '    Neodymium magnets are more powerful than Ferrite magnets.\n'
+            '\n'
+            '    However, Ferrite magnets are immune to corrosion and cheaper than Neodymium magnets.\n'
+            '\n'
+            '    See "Number of Poles" and "Winding Type" sections at:\n'
+            '        https://openafpm.net/design-tips\n'
+            '    '
+        ),
+        'NumberMagnet': 'Number of magnets per rotor disk.',
+        'StatorThickness': 'Thickness of stator.',
+        'CoilType': (
+            'Type of coil: (1) rectangular, (2) keyhole, or (3) triangular.\n'
+            '\n'
+            '    See Winding Type section at:\n'
+            '        https://openafpm.net/design-tips\n'
+            '    '
+        ),
+        'CoilLegWidth': (
+            'Distance from the inner-most edge, surrounding the hole, to the outer-most edge of the coil.\n'
+            '\n'
+            '    See "Wire sizes and power losses" section on page 55 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'CoilHoleWidthAtOuterRadius': (
+            'Width of coil hole at the outer radius of the effective length of the generator.\n'
+            '\n'
+            '    Also corresponds to the width of the coil hole at the outer radius of the rotor disk(s).\n'
+            '\n'
+            '    In conjuction with CoilHoleWidthAtInnerRadius, controls the type of coil:\n'
+            '\n'
+            '    * rectangular\n'
+            '    * keyhole\n'
+            '    * or triangular\n'
+            '\n'
+            '    See Winding Type section at:\n'
+            '        https://openafpm.net/design-tips\n'
+            '\n'
+            '    "Coil hole at R out" in Winding Type diagram.\n'
+            '    '
+        ),
+        'CoilHoleWidthAtInnerRadius': (
+            'Width of coil hole at the inner radius of the effective length of the generator.\n'
+            '\n'
+            '    Also corresponds to the width of the coil hole at the outer radius of the rotor disk(s)\n'
+            '    minus the magnet length and a small offset to align the corners of the magnets to the rotor disk.\n'
+            '\n'
+            '    In conjuction with CoilHoleWidthAtOuterRadius, controls the type of coil:\n'
+            '\n'
+            '    * rectangular\n'
+            '    * keyhole\n'
+            '    * or triangular\n'
+            '\n'
+            '    See Winding Type section at:\n'
+            '        https://openafpm.net/design-tips\n'
+            '\n'
+            '    "Coil hole at R in" in Winding Type diagram.\n'
+            '    '
+        ),
+        'MechanicalClearance': 'Air gap distance between stator and one rotor disk.',
+        'InnerDistanceBetweenMagnets': (
+            'The distance between two consecutive magnets at the inner radius.\n'
+            '\n'
+            '    For determining which kind of Magnet Jig to use: inner or outer.\n'
+            '    '
+        ),
+        'NumberOfCoilsPerPhase': (
+            'Number of coils in a phase.\n'
+            '\n'
+            '    **Phase** is defined as:\n'
+            '\n'
+            '        The timing of the cyclical aternation of voltage in a circuit.\n'
+            '        Different phases will peak at different times.\n'
+            '\n'
+            "        A group of coils with the same timing is known as a 'phase'.\n"
+            '\n'
+            '    — page 61, Glossary section of "A Wind Turbine Recipe Book (2014)".\n'
+            '\n'
+            '    See "Three-phase stators" section on page 35 and\n'
+            '    "Connecting the coils" section on page 38 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'WireWeight': (
+            'Total copper mass for coils in kilograms including two extra coils for contingency.\n'
+            '    '
+        ),
+        'WireDiameter': (
+            'Diameter of copper wire in coils.\n'
+            '    '
+        ),
+        'NumberOfWiresInHand': (
+            'Number of wires in hand when winding a coil.\n'
+            '    '
+        ),
+        'TurnsPerCoil': (
+            'Number of turns per coil.\n'
+            '    '
+        ),
+    },
+    'FurlingParameters': {
+        'VerticalPlaneAngle': (
+            'Angle between outer pipe of yaw-bearing and inner pipe of tail hinge (in degrees).\n'
+            '\n'
+            '    See "The inclined hinge" section on pages 30 - 31 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'HorizontalPlaneAngle': (
+            'Angle of the alternator frame from a horizontal plane when welding the tail hinge (in degrees).\n'
+            '\n'
+            '    See "The inclined hinge" section on pages 30 - 31 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'BoomLength': (
+            'Length of tail boom pipe.\n'
+            '\n'
+            '    See "Tail boom" section on page 31 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'BoomPipeDiameter': (
+            'Outer diameter of tail boom pipe including thickness.\n'
+            '\n'
+            '    See "Tail boom" section on page 31 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'BoomPipeThickness': (
+            'Thickness of tail boom pipe.\n'
+            '    '
+        ),
+        'VaneLength': 'Length of vane.',
+        'VaneWidth': 'Width of vane.',
+        'VaneThickness': 'Thickness of vane.',
+        'BracketLength': 'Length of vane brackets.',
+        'BracketWidth': 'Width of vane brackets.',
+        'BracketThickness': 'Thickness of vane brackets.',
+        'Offset': (
+            'Distance from center of alternator to yaw-bearing for furling action.\n'
+            '\n'
+            '    For T shape, ``Offset`` is used in calculation of ``X``.\n'
+            '\n'
+            '    Where ``X`` is described on the right-hand side of page 26 of "A Wind Turbine Recipe Book (2014)".\n'
+            '\n'
+            '    For H Shape, see "Mounting the alternator to the yaw bearing" section\n'
+            '    on page 27 of "A Wind Turbine Recipe Book (2014)".\n'
+            '\n'
+            '    Notably, the diagram on the left-hand side of page 29.\n'
+            '\n'
+            '    Further discussion can be found in "The tail" section on page 30.\n'
+            '    '
+        ),
+    },
+    'UserParameters': {
+        'WindTurbineShape': (
+            "The shape of the wind turbine: one of 'Calculated', 'T', 'H', or 'Star'.\n"
+            '\n'
+            '    The shape of the turbine controls the topology of the model.\n'
+            '\n'
+            "    'Calculated' means the shape is determined from rotor disk radius.\n"
+            '\n'
+            '    Its name is based on the shape of the frame.\n'
+            '    '
+        ),
+        'BladeWidth': (
+            'The width of the blade near the root.\n'
+            '\n'
+            '    The width depends on available wood.\n'
+            '\n'
+            '    If no value is specified, then it defaults to the minimum.\n'
+            '\n'
+            '    See "Selecting the wood" section on the right-hand side\n'
+            '    of page 15 and "The blank shapes" section on page 16\n'
+            '    of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'RotorDiskCentralHoleDiameter': 'Diameter of central hole for rotor disk.',
+        'HolesDiameter': 'Diameter of various holes like stator mounting holes and vane bracket holes.',
+        'MetalLengthL': 'Width of angle bars used in frame.',
+        'MetalThicknessL': 'Thickness of angle bars used in frame.',
+        'FlatMetalThickness': 'Thickness of various flat metal pieces which can be cut by a 2D CNC laser cutter.',
+        'YawPipeDiameter': 'Outer diameter of yaw bearing pipe including thickness.',
+        'PipeThickness': 'Thickness of yaw bearing and tail hinge pipes.',
+        'RotorResinMargin': (
+            'Margin of resin to surround and protect the outer edge of the magnets.\n'
+            '\n'
+            '    See left-hand side of page 42 of "A Wind Turbine Recipe Book (2014)".\n'
+            '    '
+        ),
+        'HubPitchCircleDiameter': 'Diameter of circle which passes through center of hub holes.',
+        'HubHolesDiameter': 'Diameter of hub holes.',
+    },
+}
+
+source_hash_by_typed_dict_name = {
+    'MagnafpmParameters': 'dc42579319d55222caebbf89a300394400f2602abbb3f5556fa2bd3995a85136',
+    'FurlingParameters': '9aafe4cd003e00aea73ff250828b182887f975c3f3149cc0c5bb6938a667945a',
+    'UserParameters': '757db7aba62b43f6eefcc7a78f2d3feb8817bc14528306f0dbcf3e8b282276e5',
+}
@@ -8,20 +8,21 @@ The algorithm is as follows:
 5. Concatenate all values together with a '-'.
 """
 
-import copy
 import string
-from typing import List, TypedDict
+from functools import lru_cache
+from typing import List, TypedDict, Union
 
+from .get_default_parameters import get_preset
 from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
-from .get_parameters_schema import get_parameters_schema
-from .wind_turbine_shape import WindTurbineShape, map_rotor_disk_radius_to_wind_turbine_shape
+from .get_parameters_schema import get_cached_parameters_schema
+from .wind_turbine_shape import WindTurbineShape, get_wind_turbine_shape, map_rotor_disk_radius_to_wind_turbine_shape
 
 # https://en.wikipedia.org/wiki/Base62
 CHARSET = string.digits + string.ascii_uppercase + string.ascii_lowercase
 VALUE_DELIMITER = "-"
 DECIMAL_DELIMITER = "."
 
-__all__ = ["hash_parameters", "unhash_parameters"]
+__all__ = ["hash_parameters", "unhash_parameters", "get_preset_hash"]
 
 
 def hash_parameters(
@@ -29,14 +30,8 @@ def hash_parameters(
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
 ) -> str:
-    wind_turbine_shape = user_parameters["WindTurbineShape"]
-    if wind_turbine_shape == "Calculated":
-        wind_turbine_shape = map_rotor_disk_radius_to_wind_turbine_shape(
-            magnafpm_parameters["RotorDiskRadius"]
-        )
-    else:
-        wind_turbine_shape = WindTurbineShape.from_string(wind_turbine_shape)
-    schema = get_parameters_schema(wind_turbine_shape)
+    wind_turbine_shape = get_wind_turbine_shape(magnafpm_parameters, user_parameters)
+    schema = get_cached_parameters_schema(wind_turbine_shape)
     parameters_by_group = convert_enum_values_to_integers(
         {
             "magnafpm": magnafpm_parameters,
@@ -61,7 +56,9 @@ def unhash_parameters(parameter_hash: str) -> dict:
     group_keys = get_group_keys()
     values = list(map(decode, parameter_hash.split(VALUE_DELIMITER)))
     rotor_disk_radius = values[2]
-    schema = get_parameters_schema(rotor_disk_radius)
+    schema = get_cached_parameters_schema(
+        map_rotor_disk_radius_to_wind_turbine_shape(rotor_disk_radius)
+    )
     i = 0
     for group, group_keys in zip(groups, group_keys):
         group_properties = schema["properties"][group]["properties"]
@@ -76,6 +73,18 @@ def unhash_parameters(parameter_hash: str) -> dict:
     return parameters_by_group
 
 
+@lru_cache(maxsize=None)
+def get_preset_hash(preset: Union[WindTurbineShape, str]) -> str:
+    """Get hash of a preset's parameters.
+
+    Computed once per preset, as registered presets can't change.
+    """
+    parameters = get_preset(preset)
+    return hash_parameters(
+        parameters["magnafpm"], parameters["furling"], parameters["user"]
+    )
+
+
 def get_group_keys():
     return map(get_keys, [MagnafpmParameters, FurlingParameters, UserParameters])
 
@@ -131,12 +140,17 @@ def decode(string, alphabet=CHARSET):
 
 
 def convert_enum_values_to_integers(parameters_by_group: dict, schema: dict) -> dict:
-    parameters_by_group_copy = copy.deepcopy(parameters_by_group)
-    for group, parameters in parameters_by_group_copy.items():
+    converted_parameters_by_group = {}
+    for group, parameters in parameters_by_group.items():
         group_properties = schema["properties"][group]["properties"]
-        for key, value in parameters.items():
-            parameter_properties = group_properties[key]
-            if "enum" in parameter_properties:
-                enum = parameter_properties["enum"]
-                parameters[key] = enum.index(value)
-    return parameters_by_group_copy
+        converted_parameters_by_group[group] = {
+            key: convert_enum_value_to_integer(value, group_properties[key])
+            for key, value in parameters.items()
+        }
+    return converted_parameters_by_group
+
+
+def convert_enum_value_to_integer(value, parameter_properties: dict):
+    if "enum" in parameter_properties:
+        return parameter_properties["enum"].index(value)
+    return value
@@ -0,0 +1,164 @@
+"""Module for vectors, rotations, and placements without FreeCAD.
+
+Mirrors the subset of ``FreeCAD.Vector``, ``FreeCAD.Rotation``, and ``FreeCAD.Placement``
+used by spreadsheet formulas and transforms,
+including attribute names (e.g. ``Base``, ``Rotation``, ``Axis``, ``Angle``, and ``Length``),
+so values may be used interchangeably where only those attributes are read.
+
+Like FreeCAD:
+
+* rotations are stored as unit quaternions in the form (x, y, z, w),
+* ``Rotation.Angle`` is in radians, and
+* a rotation of zero degrees remembers the axis it was created with.
+"""
+import math
+from typing import Iterator, Tuple, Union
+
+__all__ = ['Vector', 'Rotation', 'Placement']
+
+# Same as Base::Vector3d::epsilon() in FreeCAD.
+EPSILON = 2.2204460492503131e-16
+
+
+class Vector:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter((self.x, self.y, self.z))
+
+    def __repr__(self) -> str:
+        return f'Vector ({self.x}, {self.y}, {self.z})'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Vector) and tuple(self) == tuple(other)
+
+    def __add__(self, other: 'Vector') -> 'Vector':
+        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: 'Vector') -> 'Vector':
+        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self) -> 'Vector':
+        return Vector(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other: Union['Vector', float]) -> Union['Vector', float]:
+        # Like FreeCAD, multiplying two vectors is the dot product.
+        if isinstance(other, Vector):
+            return self.dot(other)
+        return Vector(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other: float) -> 'Vector':
+        return self * other
+
+    def __truediv__(self, other: float) -> 'Vector':
+        return Vector(self.x / other, self.y / other, self.z / other)
+
+    def dot(self, other: 'Vector') -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: 'Vector') -> 'Vector':
+        return Vector(self.y * other.z - self.z * other.y,
+                      self.z * other.x - self.x * other.z,
+                      self.x * other.y - self.y * other.x)
+
+    @property
+    def Length(self) -> float:
+        return math.sqrt(self.dot(self))
+
+    def normalize(self) -> 'Vector':
+        length = self.Length
+        if length < EPSILON:
+            raise ValueError('Cannot normalize null vector')
+        return self / length
+
+
+class Rotation:
+    __slots__ = ('Q', '_axis')
+
+    def __init__(self,
+                 axis: Vector = None,
+                 angle: float = 0.0,
+                 q: Tuple[float, float, float, float] = None) -> None:
+        """Create a rotation from an axis and angle in degrees, or a quaternion.
+
+        Defaults to the identity rotation about the z-axis.
+        Like FreeCAD, a null axis is the z-axis (e.g. for ``rotation(vector(0; 0; 0); 0)``).
+        """
+        if q is not None:
+            length = math.sqrt(sum(c * c for c in q))
+            self.Q = tuple(c / length for c in q)
+            xyz = Vector(*self.Q[:3])
+            self._axis = xyz.normalize() if xyz.Length >= EPSILON else Vector(0, 0, 1)
+            return
+        axis = Vector(0, 0, 1) if axis is None or axis.Length < EPSILON else axis.normalize()
+        radians = math.radians(angle) % (2 * math.pi)
+        scale = math.sin(radians / 2)
+        self.Q = (axis.x * scale, axis.y * scale, axis.z * scale, math.cos(radians / 2))
+        self._axis = axis
+
+    def __repr__(self) -> str:
+        return f'Rotation {self.Q}'
+
+    @property
+    def Axis(self) -> Vector:
+        xyz = Vector(*self.Q[:3])
+        if xyz.Length < EPSILON:
+            return Vector(*self._axis)
+        return xyz.normalize()
+
+    @property
+    def Angle(self) -> float:
+        """Angle in radians in the range [0, 2π]."""
+        return 2 * math.acos(max(-1.0, min(1.0, self.Q[3])))
+
+    def __mul__(self, other: Union['Rotation', Vector]) -> Union['Rotation', Vector]:
+        if isinstance(other, Vector):
+            return self.multVec(other)
+        x1, y1, z1, w1 = self.Q
+        x2, y2, z2, w2 = other.Q
+        return Rotation(q=(w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                           w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                           w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+                           w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2))
+
+    def multVec(self, vector: Vector) -> Vector:
+        x, y, z, w = self.Q
+        u = Vector(x, y, z)
+        # v' = v + 2w(u × v) + 2u × (u × v)
+        t = u.cross(vector) * 2
+        return vector + t * w + u.cross(t)
+
+    def inverted(self) -> 'Rotation':
+        x, y, z, w = self.Q
+        inverse = Rotation(q=(-x, -y, -z, w))
+        inverse._axis = -self._axis
+        return inverse
+
+
+class Placement:
+    __slots__ = ('Base', 'Rotation')
+
+    def __init__(self, base: Vector = None, rotation: Rotation = None) -> None:
+        self.Base = Vector() if base is None else base
+        self.Rotation = Rotation() if rotation is None else rotation
+
+    def __repr__(self) -> str:
+        return f'Placement [Pos={tuple(self.Base)}, Rot={self.Rotation.Q}]'
+
+    def __mul__(self, other: Union['Placement', Vector]) -> Union['Placement', Vector]:
+        if isinstance(other, Vector):
+            return self.multVec(other)
+        return Placement(self.Rotation.multVec(other.Base) + self.Base,
+                         self.Rotation * other.Rotation)
+
+    def multVec(self, vector: Vector) -> Vector:
+        return self.Rotation.multVec(vector) + self.Base
+
+    def inverse(self) -> 'Placement':
+        rotation = self.Rotation.inverted()
+        return Placement(-rotation.multVec(self.Base), rotation)
@@ -0,0 +1,281 @@
+"""Module for reporting progress of loading documents.
+
+Progress is reported as a stream of ``ProgressEvent`` dictionaries,
+with the stage, document, objects done out of the total, elapsed time, and estimated time remaining.
+
+Each step of loading (e.g. recomputing a document) is weighted by how long it took before,
+recorded in ``ProgressTimings``,
+so the percent complete and ETA reflect recompute dominating the time to load documents.
+
+Events may be consumed by a listener,
+by a ``progress_callback(stage, percent)`` (see ``callback_to_listener``),
+or as an async iterator (see ``ProgressStream``).
+"""
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+
+__all__ = [
+    'callback_to_listener',
+    'get_progress_listener',
+    'ProgressEvent',
+    'ProgressListener',
+    'ProgressStream',
+    'ProgressTimings',
+    'ProgressTracker',
+    'progress_timings',
+]
+
+
+class ProgressEvent(TypedDict):
+    stage: str
+    """Stage of loading (e.g. "Recomputing")."""
+
+    document: Optional[str]
+    """Name of document the stage is for, if any."""
+
+    message: str
+    """Human-readable description of stage and document (e.g. "Recomputing WindTurbine")."""
+
+    done: int
+    """Number of objects done in the current step."""
+
+    total: int
+    """Total number of objects in the current step, or 0 if unknown."""
+
+    percent: int
+    """Percent complete, scaled to the progress range."""
+
+    elapsed: float
+    """Seconds since loading started."""
+
+    eta: Optional[float]
+    """Estimated seconds remaining, or None if unknown."""
+
+
+ProgressListener = Callable[[ProgressEvent], None]
+
+StepKey = Tuple[str, Optional[str]]
+"""Stage and document of a step."""
+
+COMPLETE = 'Complete'
+
+
+class ProgressTimings:
+    """Historical seconds each step took, keyed by stage and document.
+
+    New timings are averaged with previous timings, so estimates adapt to the machine documents are loaded on.
+    Timings may be saved to and loaded from a JSON file to be kept between processes.
+
+    :param smoothing: Weight of a new timing relative to previous timings, from 0 to 1.
+    """
+
+    def __init__(self, seconds_by_key: Optional[Dict[str, float]] = None, smoothing: float = 0.5) -> None:
+        self.seconds_by_key: Dict[str, float] = dict(seconds_by_key or {})
+        self.smoothing = smoothing
+
+    def estimate(self, stage: str, document: Optional[str], default: float) -> float:
+        return self.seconds_by_key.get(format_step_key((stage, document)), default)
+
+    def record(self, stage: str, document: Optional[str], seconds: float) -> None:
+        key = format_step_key((stage, document))
+        previous = self.seconds_by_key.get(key)
+        self.seconds_by_key[key] = (
+            seconds if previous is None
+            else previous + self.smoothing * (seconds - previous)
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ProgressTimings':
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.seconds_by_key, f, indent=2, sort_keys=True)
+
+
+progress_timings = ProgressTimings()
+"""Timings recorded by loading documents in this process, used by default."""
+
+
+class ProgressStep:
+    """A step in progress, advanced as each object is done."""
+
+    def __init__(self, tracker: 'ProgressTracker', key: StepKey, total: int) -> None:
+        self.tracker = tracker
+        self.key = key
+        self.done = 0
+        self.total = total
+
+    def advance(self, count: int = 1) -> None:
+        self.done += count
+        self.tracker.emit(self, force=self.done >= self.total)
+
+
+class ProgressTracker:
+    """Tracks progress through planned steps, emitting ``ProgressEvent`` to listeners.
+
+    :param listeners: Listeners of events.
+    :param progress_range: Range to scale percent complete to, e.g. ``(0, 80)``.
+    :param timings: Historical timings to weight steps by, and to record timings of steps to.
+    :param min_interval: Minimum seconds between events while advancing a step.
+    """
+
+    def __init__(self,
+                 listeners: Iterable[ProgressListener] = (),
+                 progress_range: Tuple[int, int] = (0, 100),
+                 timings: ProgressTimings = progress_timings,
+                 min_interval: float = 0.1) -> None:
+        self.listeners = list(listeners)
+        self.progress_range = progress_range
+        self.timings = timings
+        self.min_interval = min_interval
+        self.estimate_by_key: Dict[StepKey, float] = {}
+        self.seconds_by_key: Dict[StepKey, float] = {}
+        """Seconds each completed step took."""
+
+        self.start_time = time.monotonic()
+        self.last_emit_time = -float('inf')
+        self.last_percent = 0
+
+    def plan(self, steps: List[Tuple[str, Optional[str], float]]) -> None:
+        """Plan steps, with default estimates in seconds for steps without historical timings."""
+        for stage, document, default in steps:
+            self.estimate_by_key[(stage, document)] = self.timings.estimate(stage, document, default)
+
+    def replan(self, key: StepKey, steps: List[Tuple[str, Optional[str], float]]) -> None:
+        """Replace a planned step with more detailed steps (e.g. once documents to recompute are known)."""
+        self.estimate_by_key.pop(key, None)
+        self.plan(steps)
+
+    @contextmanager
+    def step(self, stage: str, document: Optional[str] = None, total: int = 0) -> Iterator[ProgressStep]:
+        """Run a step, recording how long it took."""
+        key = (stage, document)
+        if key not in self.estimate_by_key:
+            self.plan([(stage, document, 0)])
+        progress_step = ProgressStep(self, key, total)
+        self.emit(progress_step, force=True)
+        start_time = time.monotonic()
+        yield progress_step
+        seconds = time.monotonic() - start_time
+        self.seconds_by_key[key] = seconds
+        self.timings.record(stage, document, seconds)
+
+    def complete(self) -> None:
+        self.emit(ProgressStep(self, (COMPLETE, None), 0), force=True)
+
+    def emit(self, progress_step: ProgressStep, force: bool = False) -> None:
+        now = time.monotonic()
+        if not self.listeners or (not force and now - self.last_emit_time < self.min_interval):
+            return
+        self.last_emit_time = now
+        fraction, eta = self.estimate(progress_step)
+        start, end = self.progress_range
+        # Estimates change as steps complete, so don't let progress go backwards.
+        self.last_percent = max(self.last_percent, start + int(fraction * (end - start)))
+        stage, document = progress_step.key
+        event: ProgressEvent = {
+            'stage': stage,
+            'document': document,
+            'message': stage if document is None else f'{stage} {document}',
+            'done': progress_step.done,
+            'total': progress_step.total,
+            'percent': self.last_percent,
+            'elapsed': now - self.start_time,
+            'eta': eta,
+        }
+        for listener in self.listeners:
+            listener(event)
+
+    def estimate(self, progress_step: ProgressStep) -> Tuple[float, Optional[float]]:
+        """Estimate fraction complete, and seconds remaining."""
+        if progress_step.key == (COMPLETE, None):
+            return 1, 0
+        total_estimate = sum(self.estimate_by_key.values())
+        if total_estimate == 0:
+            return 0, None
+        step_fraction = progress_step.done / progress_step.total if progress_step.total else 0
+        step_estimate = self.estimate_by_key.get(progress_step.key, 0)
+        completed_keys = [key for key in self.seconds_by_key if key in self.estimate_by_key]
+        completed_estimate = sum(self.estimate_by_key[key] for key in completed_keys)
+        done_estimate = completed_estimate + step_estimate * step_fraction
+        remaining_estimate = total_estimate - done_estimate
+        # Scale remaining estimate by how much faster or slower completed steps were than estimated.
+        if completed_estimate > 0:
+            remaining_estimate *= sum(self.seconds_by_key[key] for key in completed_keys) / completed_estimate
+        return min(done_estimate / total_estimate, 1), max(remaining_estimate, 0)
+
+
+def callback_to_listener(progress_callback: Callable[[str, int], None]) -> ProgressListener:
+    """Adapt a ``progress_callback(stage, percent)`` to a listener of events."""
+    def listener(event: ProgressEvent) -> None:
+        progress_callback(event['message'], event['percent'])
+    return listener
+
+
+def get_progress_listener(progress_callback: Optional[Callable[[str, int], None]],
+                          progress_listener: Optional[ProgressListener]) -> Optional[ProgressListener]:
+    """Combine an optional ``progress_callback`` and listener into one listener."""
+    if progress_callback is None:
+        return progress_listener
+    callback_listener = callback_to_listener(progress_callback)
+    if progress_listener is None:
+        return callback_listener
+
+    def listener(event):
+        callback_listener(event)
+        progress_listener(event)
+    return listener
+
+
+class ProgressStream:
+    """Listener of events which may be consumed as an async iterator.
+
+    Documents are loaded in another thread,
+    while events are iterated in the event loop the stream was created in:
+
+    .. code-block:: python
+
+        stream = ProgressStream()
+        future = loop.run_in_executor(executor, partial(load_all, ..., progress_listener=stream))
+        future.add_done_callback(lambda _: stream.close())
+        async for event in stream:
+            print(event['message'], event['percent'], event['eta'])
+
+    Iteration stops after the "Complete" event at 100 percent, or when the stream is closed.
+    Loading may complete at less than 100 percent, when followed by other steps (see ``progress_range``).
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    def __call__(self, event: ProgressEvent) -> None:
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
+    def __aiter__(self) -> 'ProgressStream':
+        return self
+
+    async def __anext__(self) -> ProgressEvent:
+        if self.closed:
+            raise StopAsyncIteration
+        event = await self.queue.get()
+        if event is None or (event['stage'] == COMPLETE and event['percent'] >= 100):
+            self.closed = True
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+def format_step_key(key: StepKey) -> str:
+    stage, document = key
+    return stage if document is None else f'{stage}: {document}'
@@ -0,0 +1,159 @@
+"""Module for coalescing identical requests for outputs loaded from FreeCAD documents.
+
+When many clients request the same output for the same parameters at once (e.g. a popular preset),
+only the first request loads documents,
+and the rest wait on the same computation, sharing its result and progress events:
+
+.. code-block:: python
+
+    archive = await aload_output(OutputType.FREECAD_ARCHIVE,
+                                 magnafpm_parameters, furling_parameters, user_parameters,
+                                 progress_listener=stream)
+
+Requests are keyed by output type, ``hash_parameters``, and any additional arguments.
+Results aren't cached; once the computation finishes, the next request starts a new one.
+
+The computation is cancelled only when every waiting request is cancelled.
+"""
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+
+from .output_type import OutputType
+from .parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+from .parameter_hash import hash_parameters
+from .progress import ProgressEvent, ProgressListener, ProgressStream, get_progress_listener
+
+if TYPE_CHECKING:
+    from .async_load import FreeCADWorkerPool
+
+__all__ = ['aload_output', 'OutputType', 'SingleFlight', 'single_flight']
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class Flight:
+    """A computation in flight, and the requests waiting on it."""
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Task] = None
+        self.listeners: List[ProgressListener] = []
+        self.last_event: Optional[ProgressEvent] = None
+        self.waiter_count = 0
+
+    def broadcast(self, event: ProgressEvent) -> None:
+        self.last_event = event
+        for listener in list(self.listeners):
+            listener(event)
+
+
+class SingleFlight:
+    """Runs at most one computation per key at a time, shared by concurrent requests."""
+
+    def __init__(self) -> None:
+        self.flight_by_key: Dict[Hashable, Flight] = {}
+
+    async def run(self,
+                  key: Hashable,
+                  create_coroutine: Callable[[ProgressListener], Awaitable[T]],
+                  progress_listener: Optional[ProgressListener] = None) -> T:
+        """Wait on the computation in flight for a key, or start one.
+
+        :param create_coroutine: Function creating the computation, given a listener of its progress events.
+        :param progress_listener: Optional listener of progress events.
+                                  Requests joining a computation in flight first receive its latest event.
+                                  A ``ProgressStream`` is closed when the request finishes.
+        """
+        flight = self.flight_by_key.get(key)
+        if flight is None:
+            flight = Flight()
+            flight.task = asyncio.ensure_future(create_coroutine(flight.broadcast))
+            self.flight_by_key[key] = flight
+            flight.task.add_done_callback(lambda _: self.remove(key, flight))
+        else:
+            logger.debug(f'Joining computation in flight for {key}')
+        if progress_listener is not None:
+            if flight.last_event is not None:
+                progress_listener(flight.last_event)
+            flight.listeners.append(progress_listener)
+        flight.waiter_count += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiter_count -= 1
+            if progress_listener is not None:
+                flight.listeners.remove(progress_listener)
+                if isinstance(progress_listener, ProgressStream):
+                    progress_listener.close()
+            if flight.waiter_count == 0 and not flight.task.done():
+                logger.debug(f'Cancelling computation for {key}, as every request was cancelled')
+                # Cancelling may take a grace period to stop the worker,
+                # so new requests start a new computation instead of joining a cancelled one.
+                self.remove(key, flight)
+                flight.task.cancel()
+
+    def remove(self, key: Hashable, flight: Flight) -> None:
+        if self.flight_by_key.get(key) is flight:
+            del self.flight_by_key[key]
+
+
+single_flight = SingleFlight()
+"""Default single-flight layer shared by ``aload_output``."""
+
+
+async def aload_output(output_type: OutputType,
+                       magnafpm_parameters: MagnafpmParameters,
+                       furling_parameters: FurlingParameters,
+                       user_parameters: UserParameters,
+                       *args: Any,
+                       progress_callback: Optional[Callable[[str, int], None]] = None,
+                       progress_listener: Optional[ProgressListener] = None,
+                       timeout: Optional[float] = None,
+                       step_timeout: Optional[float] = None,
+                       pool: Optional['FreeCADWorkerPool'] = None) -> Any:
+    """Load an output in a worker subprocess, coalescing identical concurrent requests.
+
+    Additional arguments are passed after parameters (e.g. ``img_path_prefix`` for dimension tables),
+    except ``Assembly`` for OBJ which is passed before parameters.
+
+    ``timeout``, ``step_timeout``, and ``pool`` of the request starting the computation apply to all requests.
+    """
+    key = (output_type, hash_parameters(magnafpm_parameters, furling_parameters, user_parameters), args)
+
+    def create_coroutine(listener: ProgressListener) -> Awaitable[Any]:
+        aload = get_aload_by_output_type()[output_type]
+        kwargs = {'timeout': timeout, 'step_timeout': step_timeout, 'pool': pool}
+        if output_type in PROGRESS_OUTPUT_TYPES:
+            kwargs['progress_listener'] = listener
+        if output_type == OutputType.ASSEMBLY_TO_OBJ:
+            assembly, *rest = args
+            return aload(assembly, magnafpm_parameters, furling_parameters, user_parameters, *rest, **kwargs)
+        return aload(magnafpm_parameters, furling_parameters, user_parameters, *args, **kwargs)
+
+    try:
+        return await single_flight.run(
+            key, create_coroutine, get_progress_listener(progress_callback, progress_listener))
+    finally:
+        if isinstance(progress_listener, ProgressStream):
+            progress_listener.close()
+
+
+def get_aload_by_output_type() -> Dict[OutputType, Callable[..., Awaitable[Any]]]:
+    # Imported lazily, as async_load imports FreeCAD, so SingleFlight may be used without FreeCAD.
+    from .async_load import (aload_assembly_to_obj, aload_dimension_tables, aload_dxf_archive, aload_dxf_as_svg,
+                             aload_freecad_archive, aload_furl_transform)
+
+    return {
+        OutputType.FREECAD_ARCHIVE: aload_freecad_archive,
+        OutputType.DXF_ARCHIVE: aload_dxf_archive,
+        OutputType.DXF_AS_SVG: aload_dxf_as_svg,
+        OutputType.ASSEMBLY_TO_OBJ: aload_assembly_to_obj,
+        OutputType.FURL_TRANSFORM: aload_furl_transform,
+        OutputType.DIMENSION_TABLES: aload_dimension_tables,
+    }
+
+
+PROGRESS_OUTPUT_TYPES = {OutputType.FREECAD_ARCHIVE, OutputType.DXF_ARCHIVE}
+"""Output types which report progress."""
@@ -1,11 +1,13 @@
 """Package exposing members for defining FreeCAD spreadsheets."""
 from .cell import Alignment, Cell, Color, Style
+from .cells_to_xml import cells_to_xml
 from .populate_spreadsheet import populate_spreadsheet
 
 __all__ = [
     'Alignment',
     'Color',
     'Cell',
+    'cells_to_xml',
     'Style',
     'populate_spreadsheet'
 ]
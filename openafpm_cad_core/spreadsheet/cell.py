@@ -4,8 +4,10 @@
 #   https://stackoverflow.com/a/42845998
 from __future__ import annotations
 
+import sys
 from enum import Enum, unique
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 
 __all__ = [
     'Cell',
@@ -82,39 +84,61 @@ class Color(Enum):
 
 
 class Cell:
-    """Represents a cell in a FreeCAD spreadsheet."""
+    """Represents a cell in a FreeCAD spreadsheet.
+
+    Cells are immutable, and have no per-instance ``__dict__``.
+    Styles, colors, and aliases are interned,
+    so the thousands of cells defined by the ``*_cells.py`` modules share them.
+    """
+
+    __slots__ = (
+        'content',
+        'alias',
+        'styles',
+        'horizontal_alignment',
+        'vertical_alignment',
+        'background',
+        'foreground'
+    )
 
     def __init__(self,
                  content: str = '',
                  alias: str = '',
-                 styles: List[Style] = [],
+                 styles: Iterable[Style] = (),
                  horizontal_alignment: Alignment = Alignment.LEFT,
                  vertical_alignment: Alignment = Alignment.VERTICAL_CENTER,
                  background: Tuple[float, float,
                                    float, float] = Color.WHITE.value,
                  foreground: Tuple[float, float, float, float] = Color.BLACK.value) -> None:
-        self.content = content
-        self.alias = alias
-        self.styles = styles
-        self.horizontal_alignment = horizontal_alignment
-        self.vertical_alignment = vertical_alignment
-        self.background = background
-        self.foreground = foreground
+        initialize = super().__setattr__
+        initialize('content', content)
+        initialize('alias', sys.intern(alias))
+        initialize('styles', intern_value(tuple(styles)))
+        initialize('horizontal_alignment', horizontal_alignment)
+        initialize('vertical_alignment', vertical_alignment)
+        initialize('background', intern_value(tuple(background)))
+        initialize('foreground', intern_value(tuple(foreground)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
 
     @property
     def style(self) -> str:
-        return Style.encode(self.styles)
+        return encode_styles(self.styles)
 
     @property
     def alignment(self) -> str:
-        return Alignment.encode((self.horizontal_alignment, self.vertical_alignment))
+        return encode_alignments((self.horizontal_alignment, self.vertical_alignment))
 
     def __repr__(self) -> str:
         kwargs = ''
         if self.alias:
             kwargs += f"alias='{self.alias}'"
         if len(self.styles) > 0:
-            kwargs += f', styles={self.styles}'
+            kwargs += f', styles={list(self.styles)}'
         if self.horizontal_alignment != Alignment.LEFT:
             kwargs += f', horizontal_alignment=Alignment.{self.horizontal_alignment.name}'
         if self.vertical_alignment != Alignment.VERTICAL_CENTER:
@@ -130,3 +154,21 @@ class Cell:
 
     def __str__(self) -> str:
         return self.content
+
+
+interned_values: Dict[tuple, tuple] = {}
+
+
+def intern_value(value: tuple) -> tuple:
+    """Return a shared instance of an equal tuple of styles or color components."""
+    return interned_values.setdefault(value, value)
+
+
+@lru_cache(maxsize=None)
+def encode_styles(styles: Tuple[Style, ...]) -> str:
+    return Style.encode(styles)
+
+
+@lru_cache(maxsize=None)
+def encode_alignments(alignments: Tuple[Alignment, Alignment]) -> str:
+    return Alignment.encode(alignments)
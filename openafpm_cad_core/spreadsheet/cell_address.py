@@ -0,0 +1,32 @@
+"""Module for addressing cells of a spreadsheet (e.g. ``A1``)."""
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from .cell import Cell
+from .column_number_mappers import map_number_to_column
+
+__all__ = ['enumerate_cells', 'get_cell_address']
+
+
+def enumerate_cells(cells: List[List[Cell]]) -> Iterable[Tuple[str, Cell]]:
+    """Enumerate the address and cell of each cell, row by row."""
+    column_count = max(map(len, cells), default=0)
+    for addresses, row in zip(get_address_table(len(cells), column_count), cells):
+        yield from zip(addresses, row)
+
+
+def get_cell_address(row_index: int, col_index: int) -> str:
+    return map_number_to_column(col_index + 1) + str(row_index + 1)
+
+
+@lru_cache(maxsize=32)
+def get_address_table(row_count: int, column_count: int) -> Tuple[Tuple[str, ...], ...]:
+    """Get addresses of cells indexed by row and column index.
+
+    Cached, as sheets of the same size are populated every time documents are loaded.
+    """
+    columns = [map_number_to_column(number) for number in range(1, column_count + 1)]
+    return tuple(
+        tuple(column + str(row_number) for column in columns)
+        for row_number in range(1, row_count + 1)
+    )
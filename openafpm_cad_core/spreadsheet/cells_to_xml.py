@@ -0,0 +1,79 @@
+"""Module for serializing cells to the XML of a FreeCAD spreadsheet's cells property.
+
+A ``Spreadsheet::Sheet`` saves its cells as XML (see ``Document.xml`` in a ``.FCStd`` file):
+
+.. code-block:: xml
+
+    <Cells Count="1" xlink="1">
+        <XLinks count="0">
+        </XLinks>
+        <Cell address="A1" content="=2 * 3" alignment="left|vcenter" style="bold"
+              foregroundColor="#000000ff" backgroundColor="#ffffffff" alias="Six" />
+    </Cells>
+
+The same XML may be loaded into a sheet in one call with ``restorePropertyContent``,
+instead of setting the content, alias, style, alignment, and colors of each cell separately.
+
+See also, `FreeCAD source code`__.
+
+__ https://github.com/FreeCAD/FreeCAD/blob/1.0.0/src/Mod/Spreadsheet/App/Cell.cpp#L1025-L1071
+"""
+import io
+import zipfile
+from typing import List, Tuple
+from xml.sax.saxutils import quoteattr
+
+from .cell import Cell
+from .cell_address import enumerate_cells
+
+__all__ = ['cells_to_xml', 'cells_to_property_content']
+
+# Same as Property::encodeAttribute in FreeCAD.
+ENTITY_BY_CHARACTER = {
+    '\n': '&#10;',
+    '\r': '&#13;',
+    '\t': '&#9;'
+}
+
+
+def cells_to_xml(cells: List[List[Cell]]) -> str:
+    """Serialize cells to the XML of a sheet's ``cells`` property."""
+    elements = []
+    for address, cell in enumerate_cells(cells):
+        attributes = [
+            f'address="{address}"',
+            f'content={encode_attribute(cell.content)}',
+            f'alignment="{cell.alignment}"',
+            f'foregroundColor="{encode_color(cell.foreground)}"',
+            f'backgroundColor="{encode_color(cell.background)}"'
+        ]
+        if cell.style:
+            attributes.append(f'style="{cell.style}"')
+        if cell.alias:
+            attributes.append(f'alias={encode_attribute(cell.alias)}')
+        elements.append(f'<Cell {" ".join(attributes)} />')
+    return (
+        f'<Cells Count="{len(elements)}" xlink="1">\n'
+        '<XLinks count="0">\n</XLinks>\n' +
+        '\n'.join(elements) +
+        '\n</Cells>\n'
+    )
+
+
+def cells_to_property_content(cells: List[List[Cell]]) -> bytes:
+    """Serialize cells in the format of ``dumpPropertyContent``,
+    a zip archive with the property's XML in a ``Property.xml`` entry.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('Property.xml', cells_to_xml(cells))
+    return buffer.getvalue()
+
+
+def encode_attribute(value: str) -> str:
+    return quoteattr(value, ENTITY_BY_CHARACTER)
+
+
+def encode_color(color: Tuple[float, float, float, float]) -> str:
+    """Encode a color as a hex string in the form #rrggbbaa."""
+    return '#' + ''.join(f'{round(component * 255):02x}' for component in color)
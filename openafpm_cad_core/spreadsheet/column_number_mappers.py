@@ -1,8 +1,21 @@
-"""Module containing functions to map a number to a column and vise-versa."""
+"""Module containing functions to map a number to a column and vise-versa.
+
+Columns up to ``ZZ``, the last column of a FreeCAD spreadsheet, are looked up from precomputed tables.
+"""
 import string
+from itertools import product
+from typing import Dict, Tuple
 
 __all__ = ['map_number_to_column', 'map_column_to_number']
 
+COLUMNS: Tuple[str, ...] = (
+    tuple(string.ascii_uppercase) +
+    tuple(first + second for first, second in product(string.ascii_uppercase, repeat=2))
+)
+"""Columns from ``A`` to ``ZZ``, indexed by number minus 1."""
+
+NUMBER_BY_COLUMN: Dict[str, int] = {column: number for number, column in enumerate(COLUMNS, start=1)}
+
 
 def map_number_to_column(number: int) -> str:
     """Maps a number representing a column to a number.
@@ -29,15 +42,18 @@ def map_number_to_column(number: int) -> str:
 
     >>> map_number_to_column(702)
     'ZZ'
+
+    >>> map_number_to_column(703)
+    'AAA'
     """
+    if 0 < number <= len(COLUMNS):
+        return COLUMNS[number - 1]
     if number < 1:
         raise ValueError('Number {} must be greater than 0.'.format(number))
     num_letters = len(string.ascii_uppercase)
-    if number > num_letters:
-        first = map_number_to_column((number - 1) // num_letters)
-        second = map_number_to_column(number % num_letters)
-        return first + second
-    return string.ascii_uppercase[number - 1]
+    first = map_number_to_column((number - 1) // num_letters)
+    second = string.ascii_uppercase[(number - 1) % num_letters]
+    return first + second
 
 
 def map_column_to_number(column: str) -> int:
@@ -63,7 +79,12 @@ def map_column_to_number(column: str) -> int:
 
     >>> map_column_to_number('ZZ')
     702
+
+    >>> map_column_to_number('AAA')
+    703
     """
+    if column in NUMBER_BY_COLUMN:
+        return NUMBER_BY_COLUMN[column]
     sum = 0
     for char in column:
         if char not in string.ascii_uppercase:
@@ -1,13 +1,19 @@
-from typing import Iterable, List, Tuple
+import logging
+from typing import List
 
-from ..close_all_documents import close_all_documents
+from ..cancellation import UNCANCELLABLE, CancellationToken
 from .cell import Cell
-from .column_number_mappers import map_number_to_column
+from .cell_address import enumerate_cells
+from .cells_to_xml import cells_to_property_content
 
 __all__ = ['populate_spreadsheet']
 
+logger = logging.getLogger(__name__)
 
-def populate_spreadsheet(spreadsheet: object, cells: List[List[Cell]], cancel_event=None) -> None:
+
+def populate_spreadsheet(spreadsheet: object,
+                         cells: List[List[Cell]],
+                         cancellation_token: CancellationToken = UNCANCELLABLE) -> None:
     """Populates a spreadsheet object with the given cells.
 
     .. code-block:: python
@@ -15,41 +21,38 @@ def populate_spreadsheet(spreadsheet: object, cells: List[List[Cell]], cancel_ev
         spreadsheet = document.addObject('Spreadsheet::Sheet', name)
         populate_spreadsheet(spreadsheet, cells)
 
+    Cells are loaded in one call from XML (see ``cells_to_xml``),
+    falling back to setting each cell separately if the sheet fails to load the XML.
+
+    :raises ValueError: If an alias is defined more than once.
     """
+    validate_aliases(cells)
+    cancellation_token.check()
+    try:
+        spreadsheet.restorePropertyContent('cells', cells_to_property_content(cells))
+        return
+    except Exception as exception:
+        logger.warning(f'Failed to populate {spreadsheet.Name} from XML, populating each cell: {exception}')
+        spreadsheet.clearAll()
     for cell_address, cell in enumerate_cells(cells):
-        if cancel_event is not None and cancel_event.is_set():
-            close_all_documents()
-            raise InterruptedError("Operation was cancelled")
-        populate_spreadsheet_with_cell(spreadsheet, cell_address, cell, cancel_event)
-
-
-def enumerate_cells(cells: List[List[Cell]]) -> Iterable[Tuple[str, Cell]]:
-    for row_index in range(len(cells)):
-        for col_index in range(len(cells[row_index])):
-            cell_address = get_cell_address(row_index, col_index)
-            cell = cells[row_index][col_index]
-            yield cell_address, cell
+        cancellation_token.checkpoint()
+        populate_spreadsheet_with_cell(spreadsheet, cell_address, cell)
 
 
-def get_cell_address(row_index: int, col_index: int) -> str:
-    row_num = row_index + 1
-    col_num = col_index + 1
-    column = map_number_to_column(col_num)
-    cell_address = column + str(row_num)
-    return cell_address
+def validate_aliases(cells: List[List[Cell]]) -> None:
+    aliases = set()
+    for row in cells:
+        for cell in row:
+            if cell.alias in aliases:
+                raise ValueError(f'Alias "{cell.alias}" already defined')
+            if cell.alias:
+                aliases.add(cell.alias)
 
 
 def populate_spreadsheet_with_cell(spreadsheet: object,
                                    cell_address: str,
-                                   cell: Cell,
-                                   cancel_event=None) -> None:
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-        
+                                   cell: Cell) -> None:
     spreadsheet.set(cell_address, cell.content)
-    if spreadsheet.getCellFromAlias(cell.alias) is not None:
-        raise ValueError(f'Alias "{cell.alias}" already defined')
     spreadsheet.setAlias(cell_address, cell.alias)
     spreadsheet.setStyle(cell_address, cell.style)
     spreadsheet.setAlignment(cell_address, cell.alignment)
@@ -0,0 +1,469 @@
+"""Module for evaluating spreadsheet cells without FreeCAD.
+
+Supports the subset of FreeCAD's expression syntax used by the ``*_cells.py`` modules:
+
+* numbers with optional units (e.g. ``5deg`` or ``2 mm``),
+* strings (e.g. ``<<T>>``),
+* references to aliases in the same sheet (``Alias`` or ``.Alias``)
+  and other sheets (``Sheet.Alias``),
+* attributes of vectors, rotations, and placements (e.g. ``.Placement.Base.x``),
+* arithmetic (``+ - * / % ^``), comparisons, and conditionals (``condition ? a : b``),
+* and common functions (e.g. ``cos``, ``sqrt``, ``vector``, ``rotation``, and ``placement``).
+
+Like FreeCAD, lengths are in millimeters, and angles are in degrees.
+Trigonometric functions take and return degrees.
+
+See also, `FreeCAD expressions`__.
+
+__ https://wiki.freecad.org/Expressions
+
+Only cells needed by requested aliases are evaluated:
+
+.. code-block:: python
+
+    evaluator = SpreadsheetEvaluator(get_cells_by_spreadsheet_name(magnafpm, furling, user))
+    evaluator.evaluate('HighEndStop', 'MaximumFurlAngle')
+"""
+import math
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .placement_math import Placement, Rotation, Vector
+from .spreadsheet.cell import Cell
+
+__all__ = ['SpreadsheetEvaluator', 'FormulaError', 'iterate_references', 'parse']
+
+# Multipliers to convert units to millimeters or degrees.
+unit_multiplier_by_symbol = {
+    'um': 0.001,
+    'mm': 1.0,
+    'cm': 10.0,
+    'dm': 100.0,
+    'm': 1000.0,
+    'km': 1000000.0,
+    'in': 25.4,
+    'ft': 304.8,
+    'deg': 1.0,
+    '°': 1.0,
+    'rad': 180 / math.pi
+}
+
+TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?:\s*(?P<unit>[a-zA-Z°]+))? |
+        (?P<string><<.*?>>) |
+        (?P<identifier>[A-Za-z_][A-Za-z0-9_]*) |
+        (?P<operator>==|!=|<=|>=|[-+*/%^()?:;,.<>#])
+    )
+''', re.VERBOSE)
+
+LITERAL_PATTERN = re.compile(
+    r'(?P<sign>[-+]?)\s*(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(?P<unit>[a-zA-Z°]+)?')
+
+constant_by_name = {
+    'pi': math.pi,
+    'e': math.e,
+    'True': True,
+    'False': False
+}
+
+COMPARISON_OPERATORS = {'==', '!=', '<=', '>=', '<', '>'}
+
+function_by_operator: Dict[str, Callable[[Any, Any], Any]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '>': operator.gt,
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': math.fmod,
+    '^': math.pow
+}
+
+
+class FormulaError(ValueError):
+    """Raised when a formula cannot be parsed or evaluated."""
+
+    def __init__(self, message: str, cell: str = None) -> None:
+        super().__init__(f'{cell}: {message}' if cell else message)
+        self.cell = cell
+        """Sheet and alias of the cell the error occurred in (e.g. ``Tail.BoomLength``)."""
+
+
+class SpreadsheetEvaluator:
+    """Lazily evaluates aliased cells of spreadsheets.
+
+    :param cells_by_spreadsheet_name: Cells keyed by sheet name,
+                                      as returned by ``get_cells_by_spreadsheet_name``.
+    """
+
+    def __init__(self, cells_by_spreadsheet_name: Dict[str, List[List[Cell]]]) -> None:
+        self._content_by_alias_by_sheet_name = {
+            sheet_name: {
+                cell.alias: cell.content
+                for row in cells for cell in row if cell.alias
+            }
+            for sheet_name, cells in cells_by_spreadsheet_name.items()
+        }
+        self._value_by_key: Dict[Tuple[str, str], Any] = {}
+        self._evaluating_keys: Set[Tuple[str, str]] = set()
+
+    def evaluate(self, sheet_name: str, alias: str) -> Any:
+        """Evaluate an aliased cell, and cells it references.
+
+        :raises FormulaError: If the alias doesn't exist, or the formula is invalid or circular.
+        """
+        key = (sheet_name, alias)
+        if key in self._value_by_key:
+            return self._value_by_key[key]
+        try:
+            content = self._content_by_alias_by_sheet_name[sheet_name][alias]
+        except KeyError:
+            raise FormulaError(f'No alias "{alias}" in sheet "{sheet_name}".') from None
+        if key in self._evaluating_keys:
+            raise FormulaError(f'Circular reference to {sheet_name}.{alias}.')
+        self._evaluating_keys.add(key)
+        try:
+            if content.startswith('='):
+                expression = parse(content[1:], frozenset(self._content_by_alias_by_sheet_name[sheet_name].keys()),
+                                   frozenset(self._content_by_alias_by_sheet_name.keys()))
+                value = self._evaluate_expression(sheet_name, expression)
+            else:
+                value = parse_literal(content)
+        except FormulaError as error:
+            # Only report the cell the error occurred in, and not cells referencing it.
+            if error.cell is not None:
+                raise
+            raise FormulaError(str(error), cell=f'{sheet_name}.{alias}') from None
+        finally:
+            self._evaluating_keys.discard(key)
+        self._value_by_key[key] = value
+        return value
+
+    def _evaluate_expression(self, sheet_name: str, expression: tuple) -> Any:
+        kind = expression[0]
+        if kind == 'literal':
+            return expression[1]
+        elif kind == 'reference':
+            _, referenced_sheet_name, alias = expression
+            return self.evaluate(referenced_sheet_name or sheet_name, alias)
+        elif kind == 'attribute':
+            _, operand, name = expression
+            value = self._evaluate_expression(sheet_name, operand)
+            # Numbers are plain floats instead of quantities.
+            if name == 'Value' and isinstance(value, (int, float)):
+                return value
+            try:
+                return getattr(value, name)
+            except AttributeError:
+                raise FormulaError(f'{type(value).__name__} has no attribute "{name}".') from None
+        elif kind == 'conditional':
+            _, condition, if_true, if_false = expression
+            branch = if_true if self._evaluate_expression(sheet_name, condition) else if_false
+            return self._evaluate_expression(sheet_name, branch)
+        elif kind == 'call':
+            _, name, arguments = expression
+            return call_function(name, [self._evaluate_expression(sheet_name, a) for a in arguments])
+        elif kind == 'unary':
+            return -self._evaluate_expression(sheet_name, expression[1])
+        else:
+            _, symbol, left, right = expression
+            return apply_operator(symbol,
+                                  self._evaluate_expression(sheet_name, left),
+                                  self._evaluate_expression(sheet_name, right))
+
+
+def parse_literal(content: str) -> Any:
+    """Parse non-formula cell content as a number (with an optional unit) or string."""
+    match = LITERAL_PATTERN.fullmatch(content.strip())
+    if match is None:
+        return content
+    value = to_number(match.group('number'), match.group('unit'))
+    return -value if match.group('sign') == '-' else value
+
+
+def to_number(number: str, unit: str = None) -> float:
+    value = float(number)
+    if unit is None:
+        return value
+    if unit not in unit_multiplier_by_symbol:
+        raise FormulaError(f'Unsupported unit "{unit}".')
+    return value * unit_multiplier_by_symbol[unit]
+
+
+def tokenize(formula: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    formula = formula.rstrip()
+    while position < len(formula):
+        match = TOKEN_PATTERN.match(formula, position)
+        if match is None or match.end() == position:
+            raise FormulaError(f'Unexpected character at "{formula[position:]}".')
+        kind = match.lastgroup if match.lastgroup != 'unit' else 'number'
+        if kind == 'number':
+            tokens.append(('number', to_number(match.group('number'), match.group('unit'))))
+        elif kind == 'string':
+            tokens.append(('string', match.group('string')[2:-2]))
+        else:
+            tokens.append((kind, match.group(kind)))
+        position = match.end()
+    tokens.append(('end', ''))
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def parse(formula: str, aliases: frozenset, sheet_names: frozenset) -> tuple:
+    """Parse a formula (without the leading "=") into a tree of tuples.
+
+    Parsed formulas are cached, since formulas are mostly the same for different parameters.
+    """
+    return Parser(tokenize(formula), aliases, sheet_names).parse()
+
+
+def iterate_references(expression: tuple) -> Iterator[Tuple[Optional[str], str]]:
+    """Iterate (sheet name, alias) pairs referenced by a parsed formula.
+
+    Sheet name is ``None`` for references to the same sheet.
+    """
+    stack = [expression]
+    while stack:
+        expression = stack.pop()
+        kind = expression[0]
+        if kind == 'reference':
+            yield expression[1], expression[2]
+        elif kind == 'attribute':
+            stack.append(expression[1])
+        elif kind == 'conditional':
+            stack.extend(expression[1:])
+        elif kind == 'call':
+            stack.extend(expression[2])
+        elif kind == 'unary':
+            stack.append(expression[1])
+        elif kind == 'binary':
+            stack.extend(expression[2:])
+
+
+class Parser:
+    """Recursive descent parser ordered from lowest to highest precedence."""
+
+    def __init__(self, tokens: List[Tuple[str, Any]], aliases: frozenset, sheet_names: frozenset) -> None:
+        self.tokens = tokens
+        self.position = 0
+        self.aliases = aliases
+        self.sheet_names = sheet_names
+
+    def parse(self) -> tuple:
+        expression = self.parse_conditional()
+        self.expect('end')
+        return expression
+
+    def peek(self, offset: int = 0) -> Tuple[str, Any]:
+        return self.tokens[min(self.position + offset, len(self.tokens) - 1)]
+
+    def next(self) -> Tuple[str, Any]:
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def accept(self, *values: str) -> bool:
+        kind, value = self.peek()
+        if kind == 'operator' and value in values:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, kind: str, value: str = None) -> Any:
+        token_kind, token_value = self.next()
+        if token_kind != kind or (value is not None and token_value != value):
+            raise FormulaError(f'Expected {value or kind}, got "{token_value}".')
+        return token_value
+
+    def parse_conditional(self) -> tuple:
+        condition = self.parse_comparison()
+        if self.accept('?'):
+            if_true = self.parse_conditional()
+            self.expect('operator', ':')
+            if_false = self.parse_conditional()
+            return ('conditional', condition, if_true, if_false)
+        return condition
+
+    def parse_comparison(self) -> tuple:
+        left = self.parse_additive()
+        kind, value = self.peek()
+        if kind == 'operator' and value in COMPARISON_OPERATORS:
+            self.position += 1
+            return ('binary', value, left, self.parse_additive())
+        return left
+
+    def parse_additive(self) -> tuple:
+        left = self.parse_multiplicative()
+        while True:
+            kind, value = self.peek()
+            if kind == 'operator' and value in ('+', '-'):
+                self.position += 1
+                left = ('binary', value, left, self.parse_multiplicative())
+            else:
+                return left
+
+    def parse_multiplicative(self) -> tuple:
+        left = self.parse_power()
+        while True:
+            kind, value = self.peek()
+            if kind == 'operator' and value in ('*', '/', '%'):
+                self.position += 1
+                left = ('binary', value, left, self.parse_power())
+            else:
+                return left
+
+    def parse_power(self) -> tuple:
+        # Like FreeCAD, "^" is left-associative and binds looser than unary minus.
+        left = self.parse_unary()
+        while self.accept('^'):
+            left = ('binary', '^', left, self.parse_unary())
+        return left
+
+    def parse_unary(self) -> tuple:
+        if self.accept('-'):
+            return ('unary', self.parse_unary())
+        if self.accept('+'):
+            return self.parse_unary()
+        return self.parse_postfix()
+
+    def parse_postfix(self) -> tuple:
+        expression = self.parse_primary()
+        while self.accept('.'):
+            expression = ('attribute', expression, self.expect('identifier'))
+        return expression
+
+    def parse_primary(self) -> tuple:
+        kind, value = self.next()
+        if kind in ('number', 'string'):
+            return ('literal', value)
+        elif kind == 'operator' and value == '(':
+            expression = self.parse_conditional()
+            self.expect('operator', ')')
+            return expression
+        elif kind == 'operator' and value == '.':
+            # Leading dot references an alias in the same sheet.
+            return ('reference', None, self.expect('identifier'))
+        elif kind == 'identifier':
+            if self.peek() == ('operator', '('):
+                self.position += 1
+                return ('call', value, self.parse_arguments())
+            if self.peek() == ('operator', '#'):
+                # References to other documents (e.g. Master_of_Puppets#Alternator.I)
+                # are to sheets of the same name, since spreadsheets are in one document.
+                self.position += 1
+                value = self.expect('identifier')
+                self.expect('operator', '.')
+                return ('reference', value, self.expect('identifier'))
+            if value in self.aliases:
+                return ('reference', None, value)
+            if value in constant_by_name:
+                return ('literal', constant_by_name[value])
+            if value in self.sheet_names and self.peek() == ('operator', '.'):
+                self.position += 1
+                return ('reference', value, self.expect('identifier'))
+            # Like FreeCAD, unknown references are errors when evaluated instead of parsed.
+            return ('reference', None, value)
+        raise FormulaError(f'Unexpected "{value}".')
+
+    def parse_arguments(self) -> List[tuple]:
+        arguments = []
+        if self.accept(')'):
+            return arguments
+        while True:
+            arguments.append(self.parse_conditional())
+            if self.accept(')'):
+                return arguments
+            if not self.accept(';', ','):
+                raise FormulaError(f'Expected ";" or ")", got "{self.peek()[1]}".')
+
+
+def apply_operator(symbol: str, left: Any, right: Any) -> Any:
+    try:
+        return function_by_operator[symbol](left, right)
+    except (TypeError, ZeroDivisionError, ValueError) as error:
+        raise FormulaError(f'Unable to evaluate {left!r} {symbol} {right!r}: {error}') from None
+
+
+def round_half_away_from_zero(value: float) -> float:
+    return math.copysign(math.floor(abs(value) + 0.5), value)
+
+
+def create_rotation(*arguments) -> Rotation:
+    if len(arguments) == 2:
+        axis, angle = arguments
+        return Rotation(axis, angle)
+    if len(arguments) == 3:
+        # Euler angles in the order yaw, pitch, and roll.
+        yaw, pitch, roll = arguments
+        return Rotation(Vector(0, 0, 1), yaw) * Rotation(Vector(0, 1, 0), pitch) * Rotation(Vector(1, 0, 0), roll)
+    raise FormulaError('rotation expects an axis and angle, or yaw, pitch, and roll.')
+
+
+def create_placement(*arguments) -> Placement:
+    if len(arguments) == 2:
+        base, rotation = arguments
+        return Placement(base, rotation)
+    if len(arguments) == 3:
+        base, axis, angle = arguments
+        return Placement(base, Rotation(axis, angle))
+    raise FormulaError('placement expects a base and rotation, or a base, axis, and angle.')
+
+
+def invert(value: Any) -> Any:
+    if isinstance(value, Placement):
+        return value.inverse()
+    if isinstance(value, Rotation):
+        return value.inverted()
+    raise FormulaError(f'Cannot invert {value!r}.')
+
+
+function_by_name: Dict[str, Callable[..., Any]] = {
+    # Trigonometric functions take and return degrees.
+    'sin': lambda x: math.sin(math.radians(x)),
+    'cos': lambda x: math.cos(math.radians(x)),
+    'tan': lambda x: math.tan(math.radians(x)),
+    'asin': lambda x: math.degrees(math.asin(x)),
+    'acos': lambda x: math.degrees(math.acos(x)),
+    'atan': lambda x: math.degrees(math.atan(x)),
+    'atan2': lambda y, x: math.degrees(math.atan2(y, x)),
+    'sqrt': math.sqrt,
+    'exp': math.exp,
+    'log': math.log,
+    'log10': math.log10,
+    'pow': math.pow,
+    'abs': abs,
+    'ceil': math.ceil,
+    'floor': math.floor,
+    'trunc': math.trunc,
+    'round': round_half_away_from_zero,
+    'mod': math.fmod,
+    'hypot': math.hypot,
+    'min': min,
+    'max': max,
+    'vector': Vector,
+    'vcross': lambda a, b: a.cross(b),
+    'vnormalize': lambda a: a.normalize(),
+    'rotation': create_rotation,
+    'placement': create_placement,
+    'minvert': invert
+}
+
+
+def call_function(name: str, arguments: List[Any]) -> Any:
+    if name not in function_by_name:
+        raise FormulaError(f'Unsupported function "{name}".')
+    try:
+        return function_by_name[name](*arguments)
+    except FormulaError:
+        raise
+    except (TypeError, ValueError, ZeroDivisionError) as error:
+        raise FormulaError(f'Unable to evaluate {name}: {error}') from None
@@ -0,0 +1,101 @@
+"""Module for taking a snapshot of values in a spreadsheet document.
+
+Reading a value from a FreeCAD spreadsheet
+(e.g. ``spreadsheet_document.Alternator.HubStudsLength``)
+is a property lookup on a C++ object.
+
+A snapshot reads the value of every aliased cell in every sheet once,
+and supports the same attribute access afterwards without FreeCAD:
+
+.. code-block:: python
+
+    snapshot = take_spreadsheet_snapshot(spreadsheet_document)
+    snapshot.Alternator.HubStudsLength
+
+Snapshots may be serialized with ``to_dict``, and restored by passing the dict to ``SpreadsheetSnapshot``.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+__all__ = ['SheetSnapshot', 'SpreadsheetSnapshot', 'take_spreadsheet_snapshot']
+
+
+class SheetSnapshot:
+    """Values of a single sheet accessed by alias."""
+
+    __slots__ = ('_index_by_alias', '_values')
+
+    def __init__(self, index_by_alias: Dict[str, int], values: List[Any]) -> None:
+        self._index_by_alias = index_by_alias
+        self._values = values
+
+    def __getattr__(self, alias: str) -> Any:
+        # Private attributes are slots, and never aliases.
+        if alias.startswith('_'):
+            raise AttributeError(alias)
+        try:
+            return self._values[self._index_by_alias[alias]]
+        except KeyError:
+            raise AttributeError(f'No alias "{alias}" in sheet snapshot.') from None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {alias: self._values[i] for alias, i in self._index_by_alias.items()}
+
+
+class SpreadsheetSnapshot:
+    """Values of every sheet in a spreadsheet document accessed by sheet name and alias.
+
+    Values for all sheets are stored in a single flat list,
+    and each sheet maps aliases to indices of that list.
+    """
+
+    __slots__ = ('_sheet_by_name', '_values')
+
+    def __init__(self, values_by_alias_by_sheet_name: Dict[str, Dict[str, Any]]) -> None:
+        self._values: List[Any] = []
+        self._sheet_by_name: Dict[str, SheetSnapshot] = {}
+        for sheet_name, value_by_alias in values_by_alias_by_sheet_name.items():
+            index_by_alias = {}
+            for alias, value in value_by_alias.items():
+                index_by_alias[alias] = len(self._values)
+                self._values.append(value)
+            self._sheet_by_name[sheet_name] = SheetSnapshot(index_by_alias, self._values)
+
+    def __getattr__(self, sheet_name: str) -> SheetSnapshot:
+        if sheet_name.startswith('_'):
+            raise AttributeError(sheet_name)
+        try:
+            return self._sheet_by_name[sheet_name]
+        except KeyError:
+            raise AttributeError(f'No sheet "{sheet_name}" in spreadsheet snapshot.') from None
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: sheet.to_dict() for name, sheet in self._sheet_by_name.items()}
+
+
+def take_spreadsheet_snapshot(spreadsheet_document: object,
+                              sheet_names: Optional[Iterable[str]] = None) -> SpreadsheetSnapshot:
+    """Read every aliased cell of every sheet in a spreadsheet document.
+
+    Quantities are stored as their numeric value, so snapshots serialize to JSON.
+
+    :param sheet_names: Optional names of sheets to read. Defaults to all sheets.
+    """
+    wanted = None if sheet_names is None else set(sheet_names)
+    values_by_alias_by_sheet_name = {}
+    for sheet in spreadsheet_document.findObjects('Spreadsheet::Sheet'):
+        if wanted is not None and sheet.Name not in wanted:
+            continue
+        value_by_alias = {}
+        for address in sheet.getUsedCells():
+            alias = sheet.getAlias(address)
+            if alias:
+                value_by_alias[alias] = to_plain_value(getattr(sheet, alias))
+        values_by_alias_by_sheet_name[sheet.Name] = value_by_alias
+    return SpreadsheetSnapshot(values_by_alias_by_sheet_name)
+
+
+def to_plain_value(value: Any) -> Any:
+    # FreeCAD.Units.Quantity
+    if hasattr(value, 'Value') and hasattr(value, 'Unit'):
+        return value.Value
+    return value
@@ -4,21 +4,11 @@ from typing import Dict, List
 import FreeCAD as App
 from FreeCAD import Document
 
-from .alternator_cells import alternator_cells
-from .blade_cells import blade_cells
-from .close_all_documents import close_all_documents
-from .fastener_cells import get_fastener_cells
-from .high_end_stop_cells import high_end_stop_cells
-from .hub_cells import hub_cells
-from .low_end_stop_cells import low_end_stop_cells
+from .cancellation import UNCANCELLABLE, CancellationToken
+from .get_cells_by_spreadsheet_name import get_cells_by_spreadsheet_name
 from .parameter_groups import (FurlingParameters, MagnafpmParameters,
                                UserParameters)
-from .parameters_by_key_to_cells import parameters_by_key_to_cells
 from .spreadsheet import Cell, populate_spreadsheet
-from .tail_cells import tail_cells
-from .wind_turbine_cells import wind_turbine_cells
-from .wind_turbine_shape import map_rotor_disk_radius_to_wind_turbine_shape
-from .yaw_bearing_cells import yaw_bearing_cells
 
 __all__ = ["upsert_spreadsheet_document"]
 
@@ -28,93 +18,45 @@ def upsert_spreadsheet_document(
     magnafpm_parameters: MagnafpmParameters,
     furling_parameters: FurlingParameters,
     user_parameters: UserParameters,
-    cancel_event=None,
+    cancellation_token: CancellationToken = UNCANCELLABLE,
 ) -> Document:
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-        
+    cancellation_token.check()
     cells_by_spreadsheet_name = get_cells_by_spreadsheet_name(
         magnafpm_parameters, furling_parameters, user_parameters
     )
-    return upsert_document(path, cells_by_spreadsheet_name, cancel_event)
-
-
-def get_cells_by_spreadsheet_name(
-    magnafpm_parameters: MagnafpmParameters,
-    furling_parameters: FurlingParameters,
-    user_parameters: UserParameters,
-) -> Dict[str, List[List[Cell]]]:
-    rotor_disk_radius = magnafpm_parameters['RotorDiskRadius']
-    calculated_wind_turbine_shape = map_rotor_disk_radius_to_wind_turbine_shape(rotor_disk_radius).to_string()
-    cells = parameters_by_key_to_cells(
-        {
-            "MagnAFPM": magnafpm_parameters,
-            "Furling": furling_parameters,
-            "User": user_parameters,
-            "Calculated": {
-                "CalculatedWindTurbineShape": f"=WindTurbineShape == <<Calculated>> ? <<{calculated_wind_turbine_shape}>> : WindTurbineShape"
-            }
-        }
-    )
-    return {
-        "Spreadsheet": cells,
-        "Fastener": get_fastener_cells(),
-        "Hub": hub_cells,
-        "Blade": blade_cells,
-        "Alternator": alternator_cells,
-        "YawBearing": yaw_bearing_cells,
-        "Tail": tail_cells,
-        "LowEndStop": low_end_stop_cells,
-        "HighEndStop": high_end_stop_cells,
-        "WindTurbine": wind_turbine_cells,
-    }
+    return upsert_document(path, cells_by_spreadsheet_name, cancellation_token)
 
 
 def upsert_document(
-    path: Path, cells_by_spreadsheet_name: Dict[str, List[List[Cell]]], cancel_event=None
+    path: Path,
+    cells_by_spreadsheet_name: Dict[str, List[List[Cell]]],
+    cancellation_token: CancellationToken = UNCANCELLABLE,
 ) -> Document:
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-        
     if path.exists():
         document = App.openDocument(str(path))
     else:
         document = App.newDocument(path.stem)
         
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-        
-    populate_spreadsheets(document, cells_by_spreadsheet_name, cancel_event)
+    populate_spreadsheets(document, cells_by_spreadsheet_name, cancellation_token)
     
-    if cancel_event is not None and cancel_event.is_set():
-        close_all_documents()
-        raise InterruptedError("Operation was cancelled")
-        
-    document.recompute()
+    with cancellation_token.step(f"Recomputing {document.Name}"):
+        document.recompute()
     if not path.exists():
         document.saveAs(str(path))
     return document
 
 
 def populate_spreadsheets(
-    document: Document, cells_by_spreadsheet_name: Dict[str, List[List[Cell]]], cancel_event=None
+    document: Document,
+    cells_by_spreadsheet_name: Dict[str, List[List[Cell]]],
+    cancellation_token: CancellationToken = UNCANCELLABLE,
 ) -> None:
     for spreadsheet_name, cells in cells_by_spreadsheet_name.items():
-        if cancel_event is not None and cancel_event.is_set():
-            close_all_documents()
-            raise InterruptedError("Operation was cancelled")
-            
+        cancellation_token.check()
         sheet = document.getObject(spreadsheet_name)
         if sheet is None:
             sheet = document.addObject("Spreadsheet::Sheet", spreadsheet_name)
         else:
             sheet.clearAll()
             
-        if cancel_event is not None and cancel_event.is_set():
-            close_all_documents()
-            raise InterruptedError("Operation was cancelled")
-            
-        populate_spreadsheet(sheet, cells, cancel_event)
+        populate_spreadsheet(sheet, cells, cancellation_token)
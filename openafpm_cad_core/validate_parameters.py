@@ -0,0 +1,68 @@
+"""Module to validate parameters against the JSON schema returned by ``get_parameters_schema``.
+
+Only the keywords used by ``get_parameters_schema`` are supported:
+``type``, ``enum``, ``minimum``, ``maximum``, and ``multipleOf``.
+"""
+from typing import List
+
+__all__ = ['validate_parameters']
+
+# Tolerance for floating point error when checking multipleOf.
+MULTIPLE_OF_TOLERANCE = 1e-9
+
+
+def validate_parameters(parameters_by_group: dict, schema: dict) -> List[str]:
+    """Validate parameters grouped by "magnafpm", "furling", and "user".
+
+    Only groups present in ``parameters_by_group`` are validated.
+
+    :returns: List of error messages. Empty if parameters are valid.
+    """
+    errors = []
+    for group, parameters in parameters_by_group.items():
+        group_properties = schema['properties'][group]['properties']
+        for key in group_properties.keys():
+            if key not in parameters:
+                errors.append(f'{group}.{key} is required.')
+        for key, value in parameters.items():
+            if key not in group_properties:
+                errors.append(f'{group}.{key} is not a recognized parameter.')
+            else:
+                errors.extend(
+                    f'{group}.{key} {error}'
+                    for error in get_errors(value, group_properties[key]))
+    return errors
+
+
+def get_errors(value, properties: dict) -> List[str]:
+    if 'type' in properties and not is_type(value, properties['type']):
+        return [f'must be of type {properties["type"]}, got {value!r}.']
+    errors = []
+    if 'enum' in properties and value not in properties['enum']:
+        errors.append(f'must be one of {list(properties["enum"])}, got {value!r}.')
+    if 'minimum' in properties and value < properties['minimum']:
+        errors.append(f'must be greater than or equal to {properties["minimum"]}, got {value}.')
+    if 'maximum' in properties and value > properties['maximum']:
+        errors.append(f'must be less than or equal to {properties["maximum"]}, got {value}.')
+    if 'multipleOf' in properties and not is_multiple_of(value, properties['multipleOf']):
+        errors.append(f'must be a multiple of {properties["multipleOf"]}, got {value}.')
+    return errors
+
+
+def is_type(value, json_schema_type: str) -> bool:
+    """https://json-schema.org/understanding-json-schema/reference/type.html"""
+    if isinstance(value, bool):
+        return json_schema_type == 'boolean'
+    elif json_schema_type == 'string':
+        return isinstance(value, str)
+    elif json_schema_type == 'integer':
+        return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+    elif json_schema_type == 'number':
+        return isinstance(value, (int, float))
+    else:
+        return False
+
+
+def is_multiple_of(value: float, multiple_of: float) -> bool:
+    quotient = value / multiple_of
+    return abs(quotient - round(quotient)) < MULTIPLE_OF_TOLERANCE * max(1, abs(quotient))
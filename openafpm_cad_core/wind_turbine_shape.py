@@ -7,6 +7,7 @@ __all__ = [
     'H_SHAPE_LOWER_BOUND',
     'STAR_SHAPE_LOWER_BOUND',
     'WindTurbineShape',
+    'get_wind_turbine_shape',
     'map_rotor_disk_radius_to_wind_turbine_shape'
 ]
 
@@ -42,3 +43,12 @@ def map_rotor_disk_radius_to_wind_turbine_shape(rotor_disk_radius: float) -> Win
         return WindTurbineShape.H
     else:
         return WindTurbineShape.STAR
+
+
+def get_wind_turbine_shape(magnafpm_parameters: dict, user_parameters: dict) -> WindTurbineShape:
+    """Get shape from WindTurbineShape user parameter, or rotor disk radius if 'Calculated'."""
+    wind_turbine_shape = user_parameters['WindTurbineShape']
+    if wind_turbine_shape == 'Calculated':
+        return map_rotor_disk_radius_to_wind_turbine_shape(magnafpm_parameters['RotorDiskRadius'])
+    else:
+        return WindTurbineShape.from_string(wind_turbine_shape)
@@ -144,7 +144,7 @@ yaw_bearing_cells: List[List[Cell]] = [
     [Cell("AlternatorTiltAngle"), Cell("I")],
     [
         Cell("=Alternator.AlternatorTiltAngle", alias="AlternatorTiltAngle"),
-        Cell("=Master_of_Puppets#Alternator.I", alias="I"),
+        Cell("=Alternator.I", alias="I"),
     ],
     [Cell("Pipe", styles=[Style.UNDERLINE, Style.BOLD])],
     [
@@ -0,0 +1,26 @@
+import unittest
+
+from openafpm_cad_core.get_docstring_by_key import (get_docstring_by_key, is_generated_docstring_by_key_stale,
+                                                    parse_docstring_by_key)
+from openafpm_cad_core.parameter_groups import FurlingParameters, MagnafpmParameters, UserParameters
+
+TYPED_DICTS = [MagnafpmParameters, FurlingParameters, UserParameters]
+
+
+class GetDocstringByKeyTest(unittest.TestCase):
+
+    def test_generated_docstrings_are_up_to_date(self):
+        for typed_dict in TYPED_DICTS:
+            with self.subTest(typed_dict.__name__):
+                self.assertFalse(
+                    is_generated_docstring_by_key_stale(typed_dict),
+                    'Regenerate by running: python -m openafpm_cad_core.get_docstring_by_key')
+
+    def test_generated_docstrings_equal_parsed_docstrings(self):
+        for typed_dict in TYPED_DICTS:
+            with self.subTest(typed_dict.__name__):
+                self.assertEqual(dict(get_docstring_by_key(typed_dict)), dict(parse_docstring_by_key(typed_dict)))
+
+
+if __name__ == '__main__':
+    unittest.main()
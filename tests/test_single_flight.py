@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+
+from openafpm_cad_core.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_request_after_every_request_was_cancelled_starts_new_computation(self):
+        single_flight = SingleFlight()
+        computation_count = 0
+
+        async def compute(listener):
+            nonlocal computation_count
+            computation_count += 1
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # Like FreeCADWorkerPool.run, which waits for the worker to stop before re-raising.
+                await asyncio.sleep(0.5)
+                raise
+            return computation_count
+
+        async def compute_quickly(listener):
+            return 'result'
+
+        cancelled_request = asyncio.ensure_future(single_flight.run('key', compute))
+        await asyncio.sleep(0.1)
+        cancelled_request.cancel()
+        await asyncio.sleep(0.1)
+
+        result = await single_flight.run('key', compute_quickly)
+
+        self.assertEqual(result, 'result')
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled_request
+
+    async def test_concurrent_requests_share_computation(self):
+        single_flight = SingleFlight()
+        computation_count = 0
+
+        async def compute(listener):
+            nonlocal computation_count
+            computation_count += 1
+            await asyncio.sleep(0.1)
+            return computation_count
+
+        results = await asyncio.gather(*[single_flight.run('key', compute) for _ in range(3)])
+
+        self.assertEqual(results, [1, 1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()